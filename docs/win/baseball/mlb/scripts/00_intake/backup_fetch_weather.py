@@ -7,15 +7,22 @@
 # and writes results to data/weather/{date}_weather.csv.
 #
 # enrich_game_context.py reads from that cache — it never calls the API.
+#
+# The distinct venue+hour combos of a slate are fetched in parallel on a small
+# thread pool behind one shared rate limiter; transient failures are retried.
 
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, UTC
 from pathlib import Path
 
 import pandas as pd
 import requests
 
+from request_limiter import RequestRateLimiter
+
 # ─────────────────────────────────────────────
 # PATHS
 # ─────────────────────────────────────────────
@@ -32,6 +39,12 @@ LOG_FILE = ERROR_DIR / "fetch_weather.txt"
 
 WEATHER_API_KEY = os.environ.get("WEATHER_API", "")
 
+MAX_REQUESTS_PER_SECOND = 4
+FETCH_WORKERS           = 4
+FETCH_MAX_ATTEMPTS      = 3
+RETRY_BACKOFF_SECONDS   = 2.0
+RETRY_STATUS_CODES      = {429, 500, 502, 503, 504}
+
 # ─────────────────────────────────────────────
 # LOGGING
 # ─────────────────────────────────────────────
@@ -74,6 +87,27 @@ def load_venue_map() -> dict:
     return df.set_index("venue_id").to_dict("index")
 
 
+WEATHER_API_LIMITER = RequestRateLimiter(MAX_REQUESTS_PER_SECOND)
+
+
+def _get_forecast_with_retry(params: dict) -> requests.Response:
+    for attempt in range(1, FETCH_MAX_ATTEMPTS + 1):
+        WEATHER_API_LIMITER.wait()
+        try:
+            r = requests.get("https://api.weatherapi.com/v1/forecast.json", params=params, timeout=10)
+            if r.status_code not in RETRY_STATUS_CODES or attempt == FETCH_MAX_ATTEMPTS:
+                r.raise_for_status()
+                return r
+            reason = f"status={r.status_code}"
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == FETCH_MAX_ATTEMPTS:
+                raise
+            reason = type(e).__name__
+        delay = RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+        _log(f"Weather API {reason} — retry {attempt}/{FETCH_MAX_ATTEMPTS - 1} in {delay:.1f}s", "WARN")
+        time.sleep(delay)
+
+
 def call_weather_api(lat: str, lon: str, local_date: str, local_hour: str) -> dict:
     """
     Call weatherapi.com over HTTPS.
@@ -84,18 +118,13 @@ def call_weather_api(lat: str, lon: str, local_date: str, local_hour: str) -> di
         _log("WEATHER_API not set — cannot fetch weather", "WARN")
         return {}
     try:
-        r = requests.get(
-            "https://api.weatherapi.com/v1/forecast.json",
-            params={
-                "key":  WEATHER_API_KEY,
-                "q":    f"{lat},{lon}",
-                "days": 1,
-                "dt":   local_date,
-                "hour": local_hour,
-            },
-            timeout=10,
-        )
-        r.raise_for_status()
+        r = _get_forecast_with_retry({
+            "key":  WEATHER_API_KEY,
+            "q":    f"{lat},{lon}",
+            "days": 1,
+            "dt":   local_date,
+            "hour": local_hour,
+        })
         hours = r.json()["forecast"]["forecastday"][0]["hour"]
         # Match by time string (e.g. "2026-04-19 21:00") rather than assuming [0] is correct
         target_suffix = f"{int(local_hour):02d}:00"
@@ -164,9 +193,11 @@ def process_date(date_str: str, venue_map: dict, summary: dict) -> None:
 
     _log(f"--- {date_str} | {total_games} games total")
 
-    seen_keys = {}  # cache_key -> weather dict (within this run)
+    # Pass 1: resolve each missing game's venue/hour, collecting distinct fetches.
+    plans = []
+    fetches = {}  # cache_key -> (lat, lon, local_date, local_hour)
 
-    for _, row in games_df.iterrows():
+    for row in games_df.to_dict("records"):
         game_pk = str(row.get("gamePk", "")).strip()
 
         if game_pk not in missing_pks:
@@ -183,8 +214,8 @@ def process_date(date_str: str, venue_map: dict, summary: dict) -> None:
         wind_out  = str(vinfo.get("wind_out_direction", "")).strip()
 
         weather_applicable = 0 if roof_type in ("dome", "indoor") else 1
-        weather            = {}
-        wind_blowing_out   = None
+        cache_key          = None
+        local_hour         = None
 
         if weather_applicable and lat and lon and game_time:
             try:
@@ -198,21 +229,35 @@ def process_date(date_str: str, venue_map: dict, summary: dict) -> None:
 
             if local_date and local_hour:
                 cache_key = f"{lat}_{lon}_{local_date}_{local_hour}"
+                fetches.setdefault(cache_key, (lat, lon, local_date, local_hour))
+
+        plans.append((game_pk, venue_id, weather_applicable, wind_out, cache_key, local_hour))
+
+    # Fetch every distinct venue+hour once, in parallel.
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        futures   = {key: pool.submit(call_weather_api, *args) for key, args in fetches.items()}
+        seen_keys = {key: future.result() for key, future in futures.items()}
+
+    summary["api_calls"] += sum(1 for weather in seen_keys.values() if weather)
+
+    # Pass 2: fill rows from the fetched weather.
+    logged_keys = set()
+
+    for game_pk, venue_id, weather_applicable, wind_out, cache_key, local_hour in plans:
+        weather          = (seen_keys.get(cache_key) or {}) if cache_key else {}
+        wind_blowing_out = None
+
+        if cache_key:
+            if not weather:
+                _log(f"  {game_pk} | weather fetch failed venue={venue_id} hr={local_hour}", "WARN")
+            elif cache_key in logged_keys:
+                _log(f"  {game_pk} | reused weather venue={venue_id} hr={local_hour}")
+            else:
+                _log(f"  {game_pk} | fetched weather venue={venue_id} hr={local_hour}")
+                logged_keys.add(cache_key)
 
-                if cache_key in seen_keys:
-                    weather = seen_keys[cache_key]
-                    _log(f"  {game_pk} | reused weather venue={venue_id} hr={local_hour}")
-                else:
-                    weather = call_weather_api(lat, lon, local_date, local_hour)
-                    if weather:
-                        seen_keys[cache_key] = weather
-                        summary["api_calls"] += 1
-                        _log(f"  {game_pk} | fetched weather venue={venue_id} hr={local_hour}")
-                    else:
-                        _log(f"  {game_pk} | weather fetch failed venue={venue_id} hr={local_hour}", "WARN")
-
-                if weather.get("wind_dir") and wind_out and wind_out not in ("NULL", ""):
-                    wind_blowing_out = 1 if weather["wind_dir"].strip().upper() == wind_out.strip().upper() else 0
+            if weather.get("wind_dir") and wind_out and wind_out not in ("NULL", ""):
+                wind_blowing_out = 1 if weather["wind_dir"].strip().upper() == wind_out.strip().upper() else 0
 
         existing_by_pk[game_pk] = {
             "gamePk":             game_pk,
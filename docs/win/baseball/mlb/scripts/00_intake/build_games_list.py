@@ -20,6 +20,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+from game_matcher import CandidateIndex, minutes_between
+
 MLB_RAW_DIR = Path("docs/win/baseball/mlb/00_intake/mlb_raw")
 BOOK_DIR = Path("docs/win/baseball/mlb/00_intake/sportsbook")
 MAPS_DIR = Path("docs/win/baseball/mlb/maps")
@@ -171,13 +173,6 @@ def sort_dt_key(entry: dict):
     return 0, dt
 
 
-def minutes_between(a, b):
-    if a is None or b is None:
-        return None
-
-    return abs((a - b).total_seconds()) / 60.0
-
-
 def make_output_row(raw_entry: dict, book_entry: dict) -> dict:
     r = raw_entry["row"]
     b = book_entry["row"]
@@ -292,7 +287,7 @@ def process_date(
             }
         )
 
-    book_groups = {}
+    book_index = CandidateIndex(time_field="book_dt")
 
     for idx, b in enumerate(book_rows):
         key = (
@@ -300,10 +295,8 @@ def process_date(
             norm(b.get("away_team", "")),
         )
 
-        if key not in book_groups:
-            book_groups[key] = []
-
-        book_groups[key].append(
+        book_index.add(
+            (date_str,) + key,
             {
                 "row": b,
                 "key": key,
@@ -322,7 +315,8 @@ def process_date(
 
     for key in raw_key_order:
         raws = raw_groups.get(key, [])
-        books = book_groups.get(key, [])
+        index_key = (date_str,) + key
+        books = book_index.get(index_key, [])
 
         matchup_label = (
             f"{raws[0]['away_name']} @ "
@@ -479,13 +473,7 @@ def process_date(
         )
 
         for raw_entry in sorted_raws:
-            available_books = [
-                b
-                for b in books
-                if not b["used"]
-            ]
-
-            if not available_books:
+            if not book_index.unused(index_key):
                 log(
                     f"{date_str} | "
                     f"UNMATCHED no unused sportsbook row: "
@@ -497,40 +485,13 @@ def process_date(
                 unmatched += 1
                 continue
 
-            scored = []
-
-            for book_entry in available_books:
-                diff = minutes_between(
+            selected, selected_diff, scored = (
+                book_index.match_nearest(
+                    index_key,
                     raw_entry.get("local_dt"),
-                    book_entry.get("book_dt"),
+                    MAX_TIME_DIFF_MINUTES,
                 )
-                scored.append(
-                    (
-                        diff,
-                        book_entry,
-                    )
-                )
-
-            scored_valid = [
-                x
-                for x in scored
-                if x[0] is not None
-            ]
-
-            selected = None
-            selected_diff = None
-
-            if scored_valid:
-                selected_diff, selected = min(
-                    scored_valid,
-                    key=lambda x: x[0],
-                )
-
-                if (
-                    selected_diff
-                    > MAX_TIME_DIFF_MINUTES
-                ):
-                    selected = None
+            )
 
             if selected is None:
                 diffs_text = ", ".join(
@@ -584,7 +545,7 @@ def process_date(
                 f"{diff_text}"
             )
 
-    for key, books in book_groups.items():
+    for key, books in book_index.items():
         unused = [
             b
             for b in books
@@ -10,10 +10,15 @@ Inputs per date:
     docs/win/baseball/mlb/models/run_projection/away_runs_model.joblib
     docs/win/baseball/mlb/models/run_projection/home_runs_model_metadata.json
     docs/win/baseball/mlb/models/run_projection/away_runs_model_metadata.json
+    docs/win/baseball/mlb/models/run_projection/{home,away}_runs_model_compiled.npz
+        (optional; used instead of the joblib model while it is current)
 
 Output:
     docs/win/baseball/mlb/00_intake/predictions/model_projection/{date}_MLB.csv
 
+Models are loaded once per process through load_run_models, which
+run_projection_server.py also uses to keep them hot between requests.
+
 The exact ordered feature list comes from model metadata. This script does not
 silently infer, add, drop, reorder, fill, or clip model features/predictions.
 """
@@ -21,8 +26,11 @@ silently infer, add, drop, reorder, fill, or clip model features/predictions.
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import json
+import os
 import sys
+import threading
 import traceback
 from datetime import UTC, datetime
 from pathlib import Path
@@ -44,6 +52,18 @@ HOME_MODEL_FILE = MODEL_DIR / "home_runs_model.joblib"
 AWAY_MODEL_FILE = MODEL_DIR / "away_runs_model.joblib"
 HOME_METADATA_FILE = MODEL_DIR / "home_runs_model_metadata.json"
 AWAY_METADATA_FILE = MODEL_DIR / "away_runs_model_metadata.json"
+HOME_COMPILED_FILE = MODEL_DIR / "home_runs_model_compiled.npz"
+AWAY_COMPILED_FILE = MODEL_DIR / "away_runs_model_compiled.npz"
+MODEL_FILES = [
+    HOME_MODEL_FILE,
+    AWAY_MODEL_FILE,
+    HOME_METADATA_FILE,
+    AWAY_METADATA_FILE,
+    HOME_COMPILED_FILE,
+    AWAY_COMPILED_FILE,
+]
+
+COMPILED_MODEL_SCRIPT = BASE_DIR / "scripts/modeling/compiled_run_model.py"
 
 OUTPUT_DIR = BASE_DIR / "00_intake/predictions/model_projection"
 ERROR_DIR = BASE_DIR / "errors/00_intake"
@@ -118,6 +138,10 @@ DRATINGS_RENAME = {
     "total_projected_runs": "dratings_total_projected_runs",
 }
 
+# Loaded models keyed by the model files' signature; see load_run_models.
+_RUN_MODELS_CACHE: dict = {}
+_RUN_MODELS_LOCK = threading.Lock()
+
 SAFE_CONTEXT_FEATURES = {
     "temp_f",
     "wind_mph",
@@ -238,10 +262,36 @@ def load_metadata(path: Path, label: str) -> dict:
     return metadata
 
 
+def _compiled_run_model_module():
+    module = sys.modules.get("mlb_compiled_run_model")
+    if module is not None:
+        return module
+
+    spec = importlib.util.spec_from_file_location(
+        "mlb_compiled_run_model",
+        COMPILED_MODEL_SCRIPT,
+    )
+    if spec is None or spec.loader is None:
+        fail(f"Could not load compiled model module: {COMPILED_MODEL_SCRIPT}")
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules["mlb_compiled_run_model"] = module
+    return module
+
+
 def load_model(path: Path, label: str):
     if not path.exists():
         fail(f"{label} model missing: {path}")
 
+    # The compiled twin scores identically (parity is checked at export) and
+    # loads without unpickling; it is used only while it matches the joblib.
+    if COMPILED_MODEL_SCRIPT.exists():
+        compiled = _compiled_run_model_module().load_if_fresh(path)
+        if compiled is not None:
+            _log(f"{label} model loaded from compiled artifact")
+            return compiled
+
     return joblib.load(path)
 
 
@@ -287,6 +337,91 @@ def assert_model_feature_order(model, metadata_features: list[str], label: str)
         )
 
 
+def model_files_signature() -> tuple:
+    signature = []
+
+    for path in MODEL_FILES:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            signature.append((str(path), None, None))
+            continue
+
+        signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+
+    return tuple(signature)
+
+
+def load_run_models() -> dict:
+    """Loads both run models and validates their feature contract.
+
+    The result is cached on the model and metadata files' mtime and size,
+    so repeated calls (several dates in one run, or a long-lived scoring
+    server) reuse the loaded models, and a retrain is picked up on the
+    next call. Contract checks run once per model version.
+    """
+    with _RUN_MODELS_LOCK:
+        signature = model_files_signature()
+        cached = _RUN_MODELS_CACHE.get("models")
+
+        if cached is not None and cached["signature"] == signature:
+            return cached
+
+        home_metadata = load_metadata(
+            HOME_METADATA_FILE,
+            "home_runs",
+        )
+        away_metadata = load_metadata(
+            AWAY_METADATA_FILE,
+            "away_runs",
+        )
+
+        feature_columns = assert_metadata_feature_contract(
+            home_metadata,
+            away_metadata,
+        )
+
+        home_model = load_model(
+            HOME_MODEL_FILE,
+            "home_runs",
+        )
+        away_model = load_model(
+            AWAY_MODEL_FILE,
+            "away_runs",
+        )
+
+        assert_model_feature_order(
+            home_model,
+            feature_columns,
+            "home_runs",
+        )
+        assert_model_feature_order(
+            away_model,
+            feature_columns,
+            "away_runs",
+        )
+
+        models = {
+            "signature": signature,
+            "feature_columns": feature_columns,
+            "home_model": home_model,
+            "away_model": away_model,
+            "version": (
+                model_version(home_metadata, "home")
+                + "|"
+                + model_version(away_metadata, "away")
+            ),
+        }
+
+        _RUN_MODELS_CACHE["models"] = models
+        _log(
+            f"loaded run models version={models['version']} "
+            f"features={len(feature_columns)}"
+        )
+
+        return models
+
+
 def assert_secondary_game_id_match(
     df: pd.DataFrame,
     left_col: str,
@@ -536,12 +671,58 @@ def validate_predictions(values, label: str) -> np.ndarray:
     return values
 
 
-def process_date(date_str: str) -> Path:
+def project_rows(
+    joined: pd.DataFrame,
+    X: pd.DataFrame,
+    models: dict,
+) -> pd.DataFrame:
+    home_runs = validate_predictions(
+        models["home_model"].predict(X),
+        "home_runs_model",
+    )
+    away_runs = validate_predictions(
+        models["away_model"].predict(X),
+        "away_runs_model",
+    )
+
+    result = joined.copy()
+
+    result["model_home_runs"] = home_runs
+    result["model_away_runs"] = away_runs
+    result["model_total_runs"] = (
+        result["model_home_runs"]
+        + result["model_away_runs"]
+    )
+
+    result["run_model_version"] = models["version"]
+
+    result["run_model_feature_status"] = build_feature_status(
+        result,
+        X,
+    )
+
+    # Explicit DRatings preservation contract.
+    for col in [
+        "dratings_home_prob",
+        "dratings_away_prob",
+        "dratings_home_projected_runs",
+        "dratings_away_projected_runs",
+        "dratings_total_projected_runs",
+    ]:
+        if col not in result.columns:
+            fail(f"Missing required preserved DRatings column: {col}")
+
+    return result
+
+
+def build_date_projection(
+    date_str: str,
+    models: dict | None = None,
+) -> pd.DataFrame:
     pred_path = PRED_DIR / f"{date_str}_MLB.csv"
     games_path = GAMES_DIR / f"{date_str}_games.csv"
     sdv_path = SDV_DIR / f"{date_str}_sportsdataverse.csv"
     context_path = CONTEXT_DIR / f"{date_str}_game_context.csv"
-    output_path = OUTPUT_DIR / f"{date_str}_MLB.csv"
 
     pred = read_csv_checked(
         pred_path,
@@ -569,105 +750,55 @@ def process_date(date_str: str) -> Path:
         f"game_context {date_str}",
     )
 
-    home_metadata = load_metadata(
-        HOME_METADATA_FILE,
-        "home_runs",
-    )
-    away_metadata = load_metadata(
-        AWAY_METADATA_FILE,
-        "away_runs",
-    )
-
-    feature_columns = assert_metadata_feature_contract(
-        home_metadata,
-        away_metadata,
-    )
-
-    home_model = load_model(
-        HOME_MODEL_FILE,
-        "home_runs",
-    )
-    away_model = load_model(
-        AWAY_MODEL_FILE,
-        "away_runs",
-    )
-
-    assert_model_feature_order(
-        home_model,
-        feature_columns,
-        "home_runs",
-    )
-    assert_model_feature_order(
-        away_model,
-        feature_columns,
-        "away_runs",
-    )
+    if models is None:
+        models = load_run_models()
 
     joined, X = build_feature_frame(
         pred,
         games,
         sdv,
         context,
-        feature_columns,
+        models["feature_columns"],
     )
 
-    home_runs = validate_predictions(
-        home_model.predict(X),
-        "home_runs_model",
-    )
-    away_runs = validate_predictions(
-        away_model.predict(X),
-        "away_runs_model",
-    )
+    return project_rows(joined, X, models)
 
-    result = joined.copy()
 
-    result["model_home_runs"] = home_runs
-    result["model_away_runs"] = away_runs
-    result["model_total_runs"] = (
-        result["model_home_runs"]
-        + result["model_away_runs"]
-    )
-
-    result["run_model_version"] = (
-        model_version(home_metadata, "home")
-        + "|"
-        + model_version(away_metadata, "away")
-    )
-
-    result["run_model_feature_status"] = build_feature_status(
-        result,
-        X,
-    )
-
-    # Explicit DRatings preservation contract.
-    for col in [
-        "dratings_home_prob",
-        "dratings_away_prob",
-        "dratings_home_projected_runs",
-        "dratings_away_projected_runs",
-        "dratings_total_projected_runs",
-    ]:
-        if col not in result.columns:
-            fail(f"Missing required preserved DRatings column: {col}")
+def write_projection(date_str: str, result: pd.DataFrame) -> Path:
+    pred_path = PRED_DIR / f"{date_str}_MLB.csv"
+    output_path = OUTPUT_DIR / f"{date_str}_MLB.csv"
 
     # Never overwrite the source file. Output path is separate by construction.
     if output_path.resolve() == pred_path.resolve():
         fail("Refusing to overwrite pred_with_game_id source file")
 
-    result.to_csv(
-        output_path,
-        index=False,
+    # Concurrent /project calls for the same date each get their own temp file;
+    # os.replace is atomic, so readers only ever see one complete projection.
+    # to_csv creates it, so the output keeps the usual umask-based mode.
+    tmp_path = output_path.with_name(
+        f"{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
     )
 
-    _log(
-        f"WROTE {output_path} rows={len(result)} "
-        f"features={len(feature_columns)}"
-    )
+    try:
+        result.to_csv(
+            tmp_path,
+            index=False,
+        )
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    _log(f"WROTE {output_path} rows={len(result)}")
 
     return output_path
 
 
+def process_date(date_str: str, models: dict | None = None) -> Path:
+    result = build_date_projection(date_str, models)
+    return write_projection(date_str, result)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -707,8 +838,10 @@ def main() -> None:
         if not dates:
             dates = [discover_latest_date()]
 
+        models = load_run_models()
+
         for date_str in dates:
-            output_path = process_date(date_str)
+            output_path = process_date(date_str, models)
             print(f"WROTE {output_path}")
 
     except Exception as exc:
@@ -8,17 +8,32 @@
 # docs/win/baseball/mlb/data/weather/metno_raw/{date}_metno_raw.csv
 #
 # Only processes games files dated today or in the future.
+#
+# MET Norway payloads are cached on disk per coordinate under
+# docs/win/baseball/mlb/data/weather/metno_cache/ (or METNO_CACHE_DIR).
+# A cached payload is reused until its Expires time; after that it is
+# revalidated with If-Modified-Since, so each ballpark is downloaded once
+# per forecast update no matter how many dates it appears on.
+#
+# Each slate's distinct venue coordinates are resolved in parallel on a small
+# thread pool. Every request waits on one process-wide rate limiter, and
+# transient failures (timeouts, 429, 5xx) are retried per venue with backoff.
 
+import json
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, UTC
+from email.utils import format_datetime, parsedate_to_datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 import pandas as pd
 import requests
 
+from request_limiter import RequestRateLimiter
+
 # ─────────────────────────────────────────────
 # PATHS
 # ─────────────────────────────────────────────
@@ -28,9 +43,16 @@ GAMES_DIR = BASE_DIR / "00_intake/games"
 MAPS_DIR = Path("docs/win/baseball/mlb/maps")
 WEATHER_DIR = BASE_DIR / "data/weather"
 RAW_OUT_DIR = WEATHER_DIR / "metno_raw"
+METNO_CACHE_DIR = Path(
+    os.environ.get(
+        "METNO_CACHE_DIR",
+        WEATHER_DIR / "metno_cache",
+    )
+)
 ERROR_DIR = BASE_DIR / "errors/00_intake"
 
 RAW_OUT_DIR.mkdir(parents=True, exist_ok=True)
+METNO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 ERROR_DIR.mkdir(parents=True, exist_ok=True)
 
 LOG_FILE = ERROR_DIR / "fetch_park_weather.txt"
@@ -47,7 +69,14 @@ METNO_USER_AGENT = os.environ.get(
 )
 
 REQUEST_TIMEOUT = 20
-REQUEST_SLEEP_SECONDS = 1.25
+
+# MET Norway's terms of service cap an application at 20 requests/second;
+# stay far below that however many workers are running.
+METNO_MAX_REQUESTS_PER_SECOND = 4
+FETCH_WORKERS = 4
+FETCH_MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 2.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 
 RAW_WEATHER_COLUMNS = [
     "time",
@@ -225,16 +254,35 @@ def get_today_and_future_games_files():
     return games_files
 
 
-def call_metno(lat: float, lon: float) -> dict:
+METNO_LIMITER = RequestRateLimiter(METNO_MAX_REQUESTS_PER_SECOND)
+
+
+def _retry_after_seconds(response) -> float | None:
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def call_metno(
+    lat: float,
+    lon: float,
+    last_modified: str = "",
+) -> requests.Response:
     headers = {
         "User-Agent": METNO_USER_AGENT,
     }
 
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
     params = {
         "lat": f"{lat:.4f}",
         "lon": f"{lon:.4f}",
     }
 
+    METNO_LIMITER.wait()
+
     response = requests.get(
         METNO_URL,
         params=params,
@@ -242,8 +290,211 @@ def call_metno(lat: float, lon: float) -> dict:
         timeout=REQUEST_TIMEOUT,
     )
 
-    response.raise_for_status()
-    return response.json()
+    if response.status_code != 304:
+        response.raise_for_status()
+
+    return response
+
+
+def call_metno_with_retry(
+    lat: float,
+    lon: float,
+    last_modified: str = "",
+) -> requests.Response:
+    for attempt in range(1, FETCH_MAX_ATTEMPTS + 1):
+        try:
+            return call_metno(
+                lat,
+                lon,
+                last_modified=last_modified,
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == FETCH_MAX_ATTEMPTS:
+                raise
+            reason = type(e).__name__
+            delay = RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+        except requests.HTTPError as e:
+            status = getattr(e.response, "status_code", None)
+            if (
+                status not in RETRY_STATUS_CODES
+                or attempt == FETCH_MAX_ATTEMPTS
+            ):
+                raise
+            reason = f"status={status}"
+            delay = (
+                _retry_after_seconds(e.response)
+                or RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+            )
+
+        _log(
+            f"MET Norway {reason} — retry "
+            f"{attempt}/{FETCH_MAX_ATTEMPTS - 1} "
+            f"in {delay:.1f}s",
+            "WARN",
+        )
+        time.sleep(delay)
+
+
+# ─────────────────────────────────────────────
+# FORECAST CACHE
+# ─────────────────────────────────────────────
+
+# Entries already read or written this run, keyed like the files on disk.
+_forecast_memo = {}
+
+
+def _parse_http_date(value: str):
+    try:
+        parsed = parsedate_to_datetime(_clean(value))
+    except (TypeError, ValueError):
+        return None
+
+    if parsed is None:
+        return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+
+    return parsed.astimezone(UTC)
+
+
+def _cache_path(coord_key: str) -> Path:
+    return METNO_CACHE_DIR / f"{coord_key}.json"
+
+
+def load_cached_forecast(coord_key: str):
+    if coord_key in _forecast_memo:
+        return _forecast_memo[coord_key]
+
+    path = _cache_path(coord_key)
+
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        _log(
+            f"{path.name} | unreadable forecast cache entry — refetching",
+            "WARN",
+        )
+        return None
+
+    if not isinstance(entry, dict) or "payload" not in entry:
+        return None
+
+    _forecast_memo[coord_key] = entry
+    return entry
+
+
+def save_cached_forecast(
+    coord_key: str,
+    payload: dict,
+    response: requests.Response,
+    last_modified: str = "",
+) -> dict:
+    expires = _parse_http_date(response.headers.get("Expires"))
+
+    entry = {
+        "fetched_at": _now(),
+        "expires": (
+            format_datetime(expires, usegmt=True)
+            if expires is not None
+            else ""
+        ),
+        "last_modified": (
+            _clean(response.headers.get("Last-Modified"))
+            or last_modified
+        ),
+        "payload": payload,
+    }
+
+    path = _cache_path(coord_key)
+    tmp_path = path.with_suffix(".json.tmp")
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+
+    tmp_path.replace(path)
+    _forecast_memo[coord_key] = entry
+
+    return entry
+
+
+def get_forecast(
+    lat: float,
+    lon: float,
+) -> tuple[dict, str]:
+    """
+    Returns (payload, source) for a coordinate, where source is
+    "cached", "not_modified" or "fetched".
+
+    A cached payload is served until its Expires time. Once expired it
+    is revalidated with If-Modified-Since; a 304 keeps the cached
+    payload and takes the new Expires time.
+    """
+    coord_key = f"{lat:.4f}_{lon:.4f}"
+    entry = load_cached_forecast(coord_key)
+
+    if entry is not None:
+        expires = _parse_http_date(entry.get("expires"))
+
+        if expires is not None and expires > datetime.now(UTC):
+            return entry["payload"], "cached"
+
+    response = call_metno_with_retry(
+        lat,
+        lon,
+        last_modified=(
+            _clean(entry.get("last_modified"))
+            if entry is not None
+            else ""
+        ),
+    )
+    if response.status_code == 304 and entry is not None:
+        entry = save_cached_forecast(
+            coord_key,
+            entry["payload"],
+            response,
+            last_modified=_clean(entry.get("last_modified")),
+        )
+        return entry["payload"], "not_modified"
+
+    entry = save_cached_forecast(
+        coord_key,
+        response.json(),
+        response,
+    )
+    return entry["payload"], "fetched"
+
+
+def fetch_forecasts(coords: list) -> dict:
+    """
+    Resolves every distinct (lat, lon) in parallel.
+
+    Values are (payload, source) tuples, or the exception a venue's
+    fetch finally raised so the caller can report it per game.
+    """
+    results = {}
+
+    if not coords:
+        return results
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        futures = {
+            pool.submit(get_forecast, lat, lon): (lat, lon)
+            for lat, lon in coords
+        }
+
+        for future in as_completed(futures):
+            coord = futures[future]
+            try:
+                results[coord] = future.result()
+            except Exception as e:
+                results[coord] = e
+
+    return results
 
 
 def select_timeseries_item(payload: dict, target_utc):
@@ -422,15 +673,44 @@ def process_date(
         return
 
     games_df = pd.read_csv(games_path, dtype=str)
+    games = games_df.to_dict("records")
     rows = []
 
-    forecast_cache = {}
-
     _log(f"--- {date_str} | games={len(games_df)}")
 
-    for _, game_row in games_df.iterrows():
-        game = game_row.to_dict()
+    # Pass 1: the distinct outdoor venue coordinates on this slate.
+    coords = {}
+
+    for game in games:
+        vinfo = venue_map.get(_clean(game.get("venue_id")), {})
+        lat = _to_float(vinfo.get("latitude"))
+        lon = _to_float(vinfo.get("longitude"))
+
+        if (
+            is_weather_applicable(_clean(vinfo.get("roof_type")))
+            and lat is not None
+            and lon is not None
+            and _clean(vinfo.get("time_zone_id"))
+        ):
+            coords[(round(lat, 4), round(lon, 4))] = None
+
+    forecasts = fetch_forecasts(list(coords))
+
+    for result in forecasts.values():
+        if isinstance(result, tuple):
+            source = result[1]
+            if source == "cached":
+                summary["cache_hits"] += 1
+            elif source == "not_modified":
+                summary["not_modified"] += 1
 
+    _log(
+        f"{date_str} | venues={len(coords)} "
+        f"resolved={sum(isinstance(r, tuple) for r in forecasts.values())}"
+    )
+
+    # Pass 2: fill game rows from the resolved forecasts, in file order.
+    for game in games:
         game_pk = _clean(game.get("gamePk"))
         venue_id = _clean(game.get("venue_id"))
 
@@ -451,38 +731,25 @@ def process_date(
             and time_zone_id
         ):
             try:
+                result = forecasts[(round(lat, 4), round(lon, 4))]
+
+                if isinstance(result, Exception):
+                    raise result
+
+                payload, source = result
+
                 target_utc = parse_game_datetime_utc(
                     _clean(game.get("game_date")),
                     _clean(game.get("game_time")),
                     time_zone_id,
                 )
 
-                coord_key = (
-                    f"{round(lat, 4):.4f}_"
-                    f"{round(lon, 4):.4f}"
+                _log(
+                    f"{game_pk} | "
+                    f"MET Norway data {source} "
+                    f"venue={venue_id}"
                 )
 
-                if coord_key in forecast_cache:
-                    payload = forecast_cache[coord_key]
-                    _log(
-                        f"{game_pk} | "
-                        f"reused MET Norway data "
-                        f"venue={venue_id}"
-                    )
-                else:
-                    payload = call_metno(
-                        round(lat, 4),
-                        round(lon, 4),
-                    )
-                    forecast_cache[coord_key] = payload
-                    summary["api_calls"] += 1
-                    _log(
-                        f"{game_pk} | "
-                        f"fetched MET Norway data "
-                        f"venue={venue_id}"
-                    )
-                    time.sleep(REQUEST_SLEEP_SECONDS)
-
                 selected_item = select_timeseries_item(
                     payload,
                     target_utc,
@@ -548,6 +815,8 @@ def main() -> None:
     summary = {
         "files_written": 0,
         "api_calls": 0,
+        "cache_hits": 0,
+        "not_modified": 0,
         "skipped": 0,
         "errors": 0,
     }
@@ -583,6 +852,8 @@ def main() -> None:
         )
         summary["errors"] += 1
 
+    summary["api_calls"] = METNO_LIMITER.requests
+
     status = (
         "SUCCESS"
         if summary["errors"] == 0
@@ -602,6 +873,14 @@ def main() -> None:
             f"  api_calls      : "
             f"{summary['api_calls']}"
         ),
+        (
+            f"  cache_hits     : "
+            f"{summary['cache_hits']}"
+        ),
+        (
+            f"  not_modified   : "
+            f"{summary['not_modified']}"
+        ),
         (
             f"  skipped        : "
             f"{summary['skipped']}"
@@ -621,7 +900,8 @@ def main() -> None:
     print(
         f"fetch_park_weather complete. "
         f"{summary['files_written']} files written, "
-        f"{summary['api_calls']} API calls. "
+        f"{summary['api_calls']} API calls, "
+        f"{summary['cache_hits']} cache hits. "
         f"Status: {status}"
     )
 
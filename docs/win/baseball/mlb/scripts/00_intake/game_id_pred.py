@@ -49,6 +49,8 @@ import traceback
 from datetime import date, datetime, timezone
 from pathlib import Path
 
+from game_matcher import CandidateIndex, minutes_between
+
 
 PRED_DIR = Path("docs/win/baseball/mlb/00_intake/predictions")
 GAMES_DIR = Path("docs/win/baseball/mlb/00_intake/games")
@@ -340,13 +342,6 @@ def parse_book_datetime(date_str: str, time_str: str):
     return parse_games_datetime(date_str, time_str)
 
 
-def minutes_between(a, b):
-    if a is None or b is None:
-        return None
-
-    return abs((a - b).total_seconds()) / 60.0
-
-
 def dt_sort_value(dt):
     if dt is None:
         return math.inf
@@ -510,8 +505,8 @@ def build_prediction_groups(pred_rows: list[dict]) -> tuple[dict, list]:
     return groups, key_order
 
 
-def build_games_groups(games_rows: list[dict], date_str: str) -> dict:
-    groups = {}
+def build_games_groups(games_rows: list[dict], date_str: str) -> CandidateIndex:
+    groups = CandidateIndex()
     seen_game_ids = {}
     seen_gamepks = {}
 
@@ -550,10 +545,7 @@ def build_games_groups(games_rows: list[dict], date_str: str) -> dict:
                 f"away={g.get('away_team', '')} home={g.get('home_team', '')}"
             )
 
-        if key not in groups:
-            groups[key] = []
-
-        groups[key].append({
+        groups.add((date_str,) + key, {
             "row": g,
             "key": key,
             "index": idx,
@@ -569,8 +561,8 @@ def build_games_groups(games_rows: list[dict], date_str: str) -> dict:
     return groups
 
 
-def build_book_groups(book_rows: list[dict], date_str: str) -> dict:
-    groups = {}
+def build_book_groups(book_rows: list[dict], date_str: str) -> CandidateIndex:
+    groups = CandidateIndex()
     seen_book_game_ids = {}
 
     for idx, b in enumerate(book_rows):
@@ -596,10 +588,7 @@ def build_book_groups(book_rows: list[dict], date_str: str) -> dict:
                 f"away={b.get('away_team', '')} home={b.get('home_team', '')}"
             )
 
-        if key not in groups:
-            groups[key] = []
-
-        groups[key].append({
+        groups.add((date_str,) + key, {
             "row": b,
             "key": key,
             "index": idx,
@@ -618,12 +607,18 @@ def build_book_groups(book_rows: list[dict], date_str: str) -> dict:
 # SPORTSBOOK PRESENCE
 # ─────────────────────────────────────────────
 
-def build_sportsbook_presence(date_str: str, pred_groups: dict, pred_key_order: list, book_groups: dict) -> dict:
+def build_sportsbook_presence(
+    date_str: str,
+    pred_groups: dict,
+    pred_key_order: list,
+    book_groups: CandidateIndex,
+) -> dict:
     presence = {}
 
     for key in pred_key_order:
         preds = pred_groups.get(key, [])
-        books = book_groups.get(key, [])
+        index_key = (date_str,) + key
+        books = book_groups.get(index_key, [])
 
         if not preds:
             continue
@@ -718,9 +713,7 @@ def build_sportsbook_presence(date_str: str, pred_groups: dict, pred_key_order:
         )
 
         for pred_entry in sorted_preds:
-            available_books = [b for b in books if not b["used"]]
-
-            if not available_books:
+            if not book_groups.unused(index_key):
                 log(
                     f"{date_str} | sportsbook no unused row for prediction: "
                     f"{label} pred_time={pred_entry['row'].get('game_time', '')}",
@@ -728,22 +721,11 @@ def build_sportsbook_presence(date_str: str, pred_groups: dict, pred_key_order:
                 )
                 continue
 
-            scored = []
-
-            for book_entry in available_books:
-                diff = minutes_between(pred_entry.get("dt"), book_entry.get("dt"))
-                scored.append((diff, book_entry))
-
-            scored_valid = [x for x in scored if x[0] is not None]
-
-            selected = None
-            selected_diff = None
-
-            if scored_valid:
-                selected_diff, selected = min(scored_valid, key=lambda x: x[0])
-
-                if selected_diff > MAX_TIME_DIFF_MINUTES:
-                    selected = None
+            selected, selected_diff, scored = book_groups.match_nearest(
+                index_key,
+                pred_entry.get("dt"),
+                MAX_TIME_DIFF_MINUTES,
+            )
 
             if selected is None:
                 candidates = describe_book_candidates(scored)
@@ -821,7 +803,7 @@ def process_date(date_str: str, pred_path: Path, summary: dict) -> None:
         return
 
     pred_groups, pred_key_order = build_prediction_groups(pred_rows)
-    book_groups = build_book_groups(book_rows, date_str) if book_rows else {}
+    book_groups = build_book_groups(book_rows, date_str) if book_rows else CandidateIndex()
 
     sportsbook_presence = build_sportsbook_presence(
         date_str=date_str,
@@ -1010,7 +992,8 @@ def process_date(date_str: str, pred_path: Path, summary: dict) -> None:
             if pred_entry["index"] in eligible_pred_indexes
         ]
 
-        games = games_groups.get(key, [])
+        index_key = (date_str,) + key
+        games = games_groups.get(index_key, [])
 
         if not preds:
             continue
@@ -1173,9 +1156,7 @@ def process_date(date_str: str, pred_path: Path, summary: dict) -> None:
         )
 
         for pred_entry in sorted_preds:
-            available_games = [g for g in games if not g["used"]]
-
-            if not available_games:
+            if not games_groups.unused(index_key):
                 presence = sportsbook_presence.get(pred_entry["index"], {"present": False, "detail": ""})
 
                 rejection_rows.append(make_rejection_row(
@@ -1196,22 +1177,11 @@ def process_date(date_str: str, pred_path: Path, summary: dict) -> None:
                 )
                 continue
 
-            scored = []
-
-            for game_entry in available_games:
-                diff = minutes_between(pred_entry.get("dt"), game_entry.get("dt"))
-                scored.append((diff, game_entry))
-
-            scored_valid = [x for x in scored if x[0] is not None]
-
-            selected = None
-            selected_diff = None
-
-            if scored_valid:
-                selected_diff, selected = min(scored_valid, key=lambda x: x[0])
-
-                if selected_diff > MAX_TIME_DIFF_MINUTES:
-                    selected = None
+            selected, selected_diff, scored = games_groups.match_nearest(
+                index_key,
+                pred_entry.get("dt"),
+                MAX_TIME_DIFF_MINUTES,
+            )
 
             if selected is None:
                 candidates = describe_candidates(scored)
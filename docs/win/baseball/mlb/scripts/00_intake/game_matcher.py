@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# docs/win/baseball/mlb/scripts/00_intake/game_matcher.py
+#
+# Shared candidate index for the game matching in build_games_list.py and
+# game_id_pred.py.
+#
+# Candidates are grouped by a caller-built key, normally
+# (date, normalized home team, normalized away team), and each group keeps
+# its start times in a sorted array. A nearest-time lookup is a binary search
+# plus a short walk past rows that are already used, so matching a slate costs
+# about one dict lookup and one bisect per row.
+#
+# Candidate entries are the same dicts the scripts already build: the time
+# field ("dt" unless the caller names another) is a tz-aware datetime or None
+# and "used" is flipped by the caller. Rejections
+# return the same (diff, entry) candidate list the old linear scan logged.
+
+from bisect import bisect_left, bisect_right
+
+
+def minutes_between(a, b):
+    if a is None or b is None:
+        return None
+
+    return abs((a - b).total_seconds()) / 60.0
+
+
+class CandidateIndex:
+    def __init__(self, time_field: str = "dt"):
+        self.time_field = time_field
+        self._groups = {}
+        self._times = {}
+
+    def add(self, key, entry: dict) -> None:
+        if key not in self._groups:
+            self._groups[key] = []
+
+        entry["position"] = len(self._groups[key])
+        self._groups[key].append(entry)
+
+        # Rebuilt lazily on the next lookup for this key.
+        self._times.pop(key, None)
+
+    def __contains__(self, key) -> bool:
+        return key in self._groups
+
+    def get(self, key, default=None):
+        return self._groups.get(key, default)
+
+    def items(self):
+        return self._groups.items()
+
+    def values(self):
+        return self._groups.values()
+
+    def unused(self, key) -> list:
+        return [e for e in self._groups.get(key, []) if not e["used"]]
+
+    def _sorted_times(self, key):
+        if key not in self._times:
+            timed = sorted(
+                (e[self.time_field].timestamp(), e["position"], e)
+                for e in self._groups.get(key, [])
+                if e.get(self.time_field) is not None
+            )
+            self._times[key] = (
+                [t for t, _, _ in timed],
+                [e for _, _, e in timed],
+            )
+
+        return self._times[key]
+
+    def scored_unused(self, key, dt) -> list:
+        """(diff_minutes, entry) for every unused candidate, in file order."""
+        return [
+            (minutes_between(dt, e.get(self.time_field)), e)
+            for e in self.unused(key)
+        ]
+
+    def nearest_unused(self, key, dt):
+        """
+        Closest unused timed candidate to dt as (entry, diff_minutes), or
+        (None, None). Equal distances go to the earlier row in file order,
+        as min() over the file-ordered candidates did.
+        """
+        if dt is None:
+            return None, None
+
+        times, entries = self._sorted_times(key)
+        target = dt.timestamp()
+        pos = bisect_left(times, target)
+
+        left = pos - 1
+        while left >= 0 and entries[left]["used"]:
+            left -= 1
+
+        right = pos
+        while right < len(entries) and entries[right]["used"]:
+            right += 1
+
+        anchors = []
+
+        if left >= 0:
+            anchors.append((target - times[left], times[left]))
+
+        if right < len(entries):
+            anchors.append((times[right] - target, times[right]))
+
+        if not anchors:
+            return None, None
+
+        best_seconds = min(seconds for seconds, _ in anchors)
+
+        # Same-time candidates form a contiguous run in the sorted array.
+        tied = []
+
+        for seconds, anchor in anchors:
+            if seconds != best_seconds:
+                continue
+
+            lo = bisect_left(times, anchor)
+            hi = bisect_right(times, anchor)
+            tied.extend(e for e in entries[lo:hi] if not e["used"])
+
+        selected = min(tied, key=lambda e: e["position"])
+
+        return selected, minutes_between(dt, selected[self.time_field])
+
+    def match_nearest(self, key, dt, max_minutes: float):
+        """
+        Resolves dt to the closest unused candidate within max_minutes.
+
+        Returns (entry, diff_minutes, None) on a match, or
+        (None, None, scored) where scored lists every unused candidate
+        with its diff for the rejection log.
+        """
+        selected, diff = self.nearest_unused(key, dt)
+
+        if selected is None or diff > max_minutes:
+            return None, None, self.scored_unused(key, dt)
+
+        return selected, diff, None
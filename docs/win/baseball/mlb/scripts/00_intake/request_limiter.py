@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# docs/win/baseball/mlb/scripts/00_intake/request_limiter.py
+#
+# Shared request pacing for the concurrent fetch scripts
+# (fetch_park_weather.py, backup_fetch_weather.py and, loaded by path from
+# 00_parsing, mlb_odds_pull.py and odds_mlb_update.py).
+#
+# Each script keeps one limiter per upstream API and every fetch thread calls
+# wait() before sending. The next start slot is reserved under the lock and the
+# sleep happens outside it, so request starts stay at least 1/rate seconds apart
+# however many workers are running.
+#
+# APIs that report a remaining request quota in a response header can also be
+# tracked: record() keeps the lowest value seen, and once it reaches zero wait()
+# raises QuotaExhausted instead of letting another request out.
+
+import threading
+import time
+
+
+class QuotaExhausted(RuntimeError):
+    pass
+
+
+class RequestRateLimiter:
+    """Spaces request starts at least 1/rate seconds apart across all threads."""
+
+    def __init__(self, rate: float, quota_headers=(), quota_reserve: int = 0) -> None:
+        self.min_interval = 1.0 / rate
+        self.quota_headers = list(quota_headers)
+        self.quota_reserve = quota_reserve
+        self.requests = 0
+        self.retries = 0
+        self.remaining = None
+        self._low_quota_reported = False
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            if self.remaining is not None and self.remaining <= 0:
+                raise QuotaExhausted("request quota exhausted")
+
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+            self.requests += 1
+
+        if start > now:
+            time.sleep(start - now)
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def record(self, response) -> bool:
+        """Track the quota a response reports; True once, when it first drops to quota_reserve."""
+        remaining = None
+
+        for header in self.quota_headers:
+            try:
+                remaining = int(float(response.headers.get(header)))
+                break
+            except (TypeError, ValueError):
+                continue
+
+        if remaining is None:
+            return False
+
+        with self._lock:
+            if self.remaining is None or remaining < self.remaining:
+                self.remaining = remaining
+
+            if self.remaining <= self.quota_reserve and not self._low_quota_reported:
+                self._low_quota_reported = True
+                return True
+
+        return False
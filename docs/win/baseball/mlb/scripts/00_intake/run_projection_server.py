@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""Long-lived scoring service for the MLB home/away run models.
+
+Keeps both run models loaded (through build_run_projection.load_run_models)
+so intraday re-projection after lineup or weather changes does not pay for
+joblib loading and feature-contract validation on every call. A retrained
+model is picked up on the next request; the contract is checked once per
+model version.
+
+Run from the repo root:
+    python docs/win/baseball/mlb/scripts/00_intake/run_projection_server.py
+
+Endpoints (JSON, bound to 127.0.0.1 by default):
+    GET  /health
+        {"status": "ok", "run_model_version": ..., "feature_columns": [...]}
+
+    POST /score   {"rows": [{<every metadata feature>: number|null,
+                             "game_id": optional, "gamePk": optional}, ...]}
+        Scores feature rows directly. Every metadata feature must be present;
+        null means missing, exactly as a blank CSV cell does in production.
+
+    POST /project {"date": "YYYY_MM_DD", "game_ids": [...] optional,
+                   "write": true}
+        Rebuilds the date's projection from the intake files, as
+        build_run_projection.py does, optionally limited to some games.
+        With "write" the full slate is written to the usual output file.
+
+POST bodies must be sent as application/json (415 otherwise). Invalid
+requests, including a date that is not a real YYYY_MM_DD day, return 400.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import time
+import traceback
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import build_run_projection as brp
+
+
+BASE_DIR = Path("docs/win/baseball/mlb")
+
+ERROR_DIR = BASE_DIR / "errors/00_intake"
+LOG_FILE = ERROR_DIR / "run_projection_server.txt"
+
+ERROR_DIR.mkdir(parents=True, exist_ok=True)
+
+DEFAULT_HOST = os.environ.get("RUN_PROJECTION_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.environ.get("RUN_PROJECTION_PORT", "8765"))
+
+MAX_BODY_BYTES = 5 * 1024 * 1024
+
+ID_FIELDS = ["game_id", "gamePk"]
+
+# The date names both the intake file read and the projection written.
+DATE_PATTERN = re.compile(r"^\d{4}_\d{2}_\d{2}$")
+
+PROJECTION_COLUMNS = [
+    "game_id",
+    "gamePk",
+    "game_date",
+    "home_team",
+    "away_team",
+    "model_home_runs",
+    "model_away_runs",
+    "model_total_runs",
+    "run_model_version",
+    "run_model_feature_status",
+]
+
+
+class UnsupportedMediaType(ValueError):
+    pass
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _log(message: str, level: str = "INFO") -> None:
+    with LOG_FILE.open("a", encoding="utf-8") as f:
+        f.write(f"{_now()} | {level:<5} | {message.rstrip()}\n")
+
+
+def _records(df: pd.DataFrame) -> list[dict]:
+    columns = [col for col in PROJECTION_COLUMNS if col in df.columns]
+    out = df[columns].astype(object)
+    return out.where(out.notna(), None).to_dict("records")
+
+
+def feature_frame_from_rows(
+    rows,
+    feature_columns: list[str],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Builds the exact metadata-ordered feature frame from request rows.
+
+    Rows must carry every feature and nothing but features and ID_FIELDS;
+    values must be finite numbers or null. Nothing is filled or inferred.
+    """
+    if not isinstance(rows, list) or not rows:
+        raise ValueError("rows must be a non-empty list")
+
+    allowed = set(feature_columns) | set(ID_FIELDS)
+    values = np.full((len(rows), len(feature_columns)), np.nan)
+    ids = []
+
+    for i, row in enumerate(rows):
+        if not isinstance(row, dict):
+            raise ValueError(f"row {i} is not an object")
+
+        missing = [col for col in feature_columns if col not in row]
+        if missing:
+            raise ValueError(f"row {i} missing features: {missing}")
+
+        unknown = sorted(key for key in row if key not in allowed)
+        if unknown:
+            raise ValueError(f"row {i} has unknown fields: {unknown}")
+
+        for j, col in enumerate(feature_columns):
+            value = row[col]
+
+            if value is None:
+                continue
+
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"row {i} feature {col} is not a number: {value!r}")
+
+            if not np.isfinite(value):
+                raise ValueError(f"row {i} feature {col} is not finite: {value!r}")
+
+            values[i, j] = value
+
+        ids.append({key: row.get(key) for key in ID_FIELDS})
+
+    X = pd.DataFrame(values, columns=feature_columns)
+    joined = pd.DataFrame(ids, columns=ID_FIELDS)
+
+    return joined, X
+
+
+def score_rows(rows) -> dict:
+    models = brp.load_run_models()
+    joined, X = feature_frame_from_rows(rows, models["feature_columns"])
+
+    home_runs = brp.validate_predictions(
+        models["home_model"].predict(X),
+        "home_runs_model",
+    )
+    away_runs = brp.validate_predictions(
+        models["away_model"].predict(X),
+        "away_runs_model",
+    )
+
+    joined["model_home_runs"] = home_runs
+    joined["model_away_runs"] = away_runs
+    joined["model_total_runs"] = home_runs + away_runs
+    joined["run_model_version"] = models["version"]
+
+    return {
+        "run_model_version": models["version"],
+        "projections": _records(joined),
+    }
+
+
+def slate_date(value) -> str:
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError("date is required")
+
+    date_str = brp.normalize_date_arg(value)
+
+    if not DATE_PATTERN.match(date_str):
+        raise ValueError(f"date must be YYYY_MM_DD or YYYY-MM-DD: {value!r}")
+
+    try:
+        datetime.strptime(date_str, "%Y_%m_%d")
+    except ValueError as exc:
+        raise ValueError(f"date is not a calendar day: {value!r}") from exc
+
+    return date_str
+
+
+def project_date(payload: dict) -> dict:
+    date_str = slate_date(payload.get("date"))
+
+    game_ids = payload.get("game_ids")
+    if game_ids is not None and (
+        not isinstance(game_ids, list)
+        or any(not isinstance(x, (str, int)) for x in game_ids)
+    ):
+        raise ValueError("game_ids must be a list of ids")
+
+    models = brp.load_run_models()
+    result = brp.build_date_projection(date_str, models)
+    selected = result
+
+    if game_ids is not None:
+        wanted = {str(x).strip() for x in game_ids}
+        selected = result.loc[result["game_id"].isin(wanted)]
+
+        unknown = sorted(wanted - set(selected["game_id"]))
+        if unknown:
+            raise ValueError(f"game_ids not on the {date_str} slate: {unknown}")
+
+    output_path = None
+    if payload.get("write", True):
+        output_path = brp.write_projection(date_str, result)
+
+    return {
+        "date": date_str,
+        "output_path": str(output_path) if output_path else None,
+        "run_model_version": models["version"],
+        "projections": _records(selected),
+    }
+
+
+class ProjectionHandler(BaseHTTPRequestHandler):
+    server_version = "RunProjectionServer/1"
+
+    def log_message(self, format, *args) -> None:
+        _log(f"{self.address_string()} {format % args}")
+
+    def _send(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _payload(self) -> dict:
+        content_type = self.headers.get("Content-Type") or ""
+        if content_type.split(";")[0].strip().lower() != "application/json":
+            raise UnsupportedMediaType(
+                f"Content-Type must be application/json, got {content_type!r}"
+            )
+
+        length = int(self.headers.get("Content-Length") or 0)
+
+        if length > MAX_BODY_BYTES:
+            raise ValueError(f"request body over {MAX_BODY_BYTES} bytes")
+
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"invalid JSON body: {exc}") from exc
+
+        if not isinstance(payload, dict):
+            raise ValueError("request body must be a JSON object")
+
+        return payload
+
+    def _handle(self, route) -> None:
+        started = time.perf_counter()
+
+        try:
+            body = route()
+        except UnsupportedMediaType as exc:
+            self._send(415, {"error": str(exc)})
+            return
+        except ValueError as exc:
+            self._send(400, {"error": str(exc)})
+            return
+        except Exception as exc:
+            _log(f"{self.path} failed: {exc}\n{traceback.format_exc()}", "ERROR")
+            self._send(500, {"error": str(exc)})
+            return
+
+        body["elapsed_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+        self._send(200, body)
+
+    def do_GET(self) -> None:
+        if self.path != "/health":
+            self._send(404, {"error": f"unknown path {self.path}"})
+            return
+
+        def health() -> dict:
+            models = brp.load_run_models()
+            return {
+                "status": "ok",
+                "run_model_version": models["version"],
+                "feature_columns": models["feature_columns"],
+            }
+
+        self._handle(health)
+
+    def do_POST(self) -> None:
+        if self.path == "/score":
+            self._handle(lambda: score_rows(self._payload().get("rows")))
+        elif self.path == "/project":
+            self._handle(lambda: project_date(self._payload()))
+        else:
+            self._send(404, {"error": f"unknown path {self.path}"})
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_HOST,
+        help="Bind address (default 127.0.0.1; keep it local).",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    with LOG_FILE.open("w", encoding="utf-8") as f:
+        f.write(f"=== run_projection_server RUN {_now()} ===\n")
+
+    try:
+        models = brp.load_run_models()
+    except Exception as exc:
+        _log(f"FATAL: {exc}\n{traceback.format_exc()}", "ERROR")
+        print(f"run_projection_server failed: {exc}")
+        raise SystemExit(1)
+
+    server = ThreadingHTTPServer((args.host, args.port), ProjectionHandler)
+    _log(f"serving on {args.host}:{args.port} version={models['version']}")
+    print(
+        f"run_projection_server listening on http://{args.host}:{args.port} "
+        f"version={models['version']}"
+    )
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        _log("server stopped")
+
+
+if __name__ == "__main__":
+    main()
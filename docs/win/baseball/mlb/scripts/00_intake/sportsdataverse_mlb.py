@@ -20,6 +20,18 @@ The raw seasonal cache may contain pitches after a historical target date, but
 those rows are filtered out before any xERA/xwOBA, Stuff+, Command+, velocity,
 spin, pitch-count, or game-count calculation.
 
+Stuff+/Command+ scores are persisted next to the raw cache
+(``{season}_pitch_scores.parquet`` and ``{season}_stuff_snapshots.parquet``)
+so each cached pitch is scored once; per-date features are as-of aggregations
+over the stored scores under the same strict cutoff. Pitch/game counts,
+velocity, spin and xwOBA/xERA come from per-appearance running totals built in
+one pass over the cache; an as-of date or rolling window is a prefix-sum
+difference over appearances strictly before the target.
+
+``--batch`` (for ``--from-date``/``--to-date`` backfills) refreshes each
+season's cache once for the union of all requested starters and loads it once
+for every date instead of re-checking and re-reading it per date.
+
 This file remains a separate upstream model input. Its ``sdv_*`` columns are
 not intended to be copied wholesale through the downstream merge/edge/EV
 pipeline. The run-projection stage should read this file directly and convert
@@ -51,6 +63,7 @@ from sportsdataverse.mlb import (
     mlb_stuff_plus,
     x_era,
 )
+from sportsdataverse.mlb.mlb_command_plus import COMMAND_FEATURES
 from sportsdataverse.mlb.mlb_pitch_features import pitch_features
 
 
@@ -99,6 +112,14 @@ PITCHER_FEATURE_COLUMNS = [
     "sp_last_game_date",
 ]
 
+# Statcast pitch identity used by the persistent per-pitch score store.
+PITCH_KEY_COLUMNS = [
+    "game_pk",
+    "at_bat_number",
+    "pitch_number",
+    "pitcher",
+]
+
 
 def _now() -> str:
     return datetime.now(UTC).isoformat()
@@ -330,58 +351,17 @@ def _merge_polars_feature(
     return base.merge(pdf, on="pitcher_id", how="left")
 
 
-def build_pitcher_features(
-    raw_pitches: pl.DataFrame,
-    pitcher_ids: list[int],
+def _direct_base_features(
+    features: pd.DataFrame,
+    pregame: pl.DataFrame,
     season: int,
     target_game_date: date,
     lookback_days: int,
 ) -> pd.DataFrame:
-    """Build all pitcher features from strictly pregame pitch rows only."""
-    features = pd.DataFrame(
-        {"pitcher_id": pd.Series(pitcher_ids, dtype="Int64")}
-    )
-
-    if raw_pitches is None or raw_pitches.height == 0:
-        return _empty_pitcher_features(pitcher_ids)
-
-    # Fatal leakage guard: this filter happens before every aggregation/model.
-    pregame = _filter_before_target(raw_pitches, target_game_date)
-    pregame = _filter_pitchers(pregame, pitcher_ids)
-
-    if pregame.height == 0:
-        return _empty_pitcher_features(pitcher_ids)
-
+    """Base, xERA and recent-window features re-aggregated from pitch rows."""
     season_base = _base_pitcher_stats(pregame)
     features = _merge_polars_feature(features, season_base)
 
-    feats = _safe_model(
-        "pitch_features",
-        lambda: pitch_features(pregame),
-    )
-
-    stuff_pitch = _safe_model(
-        "mlb_stuff_plus",
-        lambda: mlb_stuff_plus(feats, level="pitch"),
-    )
-    if stuff_pitch.height:
-        stuff = stuff_pitch.group_by("pitcher").agg(
-            pl.col("stuff_plus").mean().alias("sp_stuff_plus"),
-            pl.len().alias("sp_stuff_scored_pitches"),
-        )
-        features = _merge_polars_feature(features, stuff)
-
-    command_pitch = _safe_model(
-        "mlb_command_plus",
-        lambda: mlb_command_plus(feats, level="pitch"),
-    )
-    if command_pitch.height:
-        command = command_pitch.group_by("pitcher").agg(
-            pl.col("command_plus").mean().alias("sp_command_plus"),
-            pl.len().alias("sp_command_scored_pitches"),
-        )
-        features = _merge_polars_feature(features, command)
-
     xera = _safe_model(
         "x_era",
         lambda: x_era(pregame, season),
@@ -430,6 +410,118 @@ def build_pitcher_features(
             },
         )
 
+    return features
+
+
+def build_pitcher_features(
+    raw_pitches: pl.DataFrame,
+    pitcher_ids: list[int],
+    season: int,
+    target_game_date: date,
+    lookback_days: int,
+    score_store: dict | None = None,
+    aggregates: dict | None = None,
+    summary: dict | None = None,
+) -> pd.DataFrame:
+    """Build all pitcher features from strictly pregame pitch rows only.
+
+    When ``aggregates`` is supplied (see ``build_pitcher_aggregates``), base,
+    xERA and recent-window features are prefix-sum lookups instead of
+    re-aggregations of the raw frame. When ``score_store`` is supplied (see
+    ``load_score_store``), Stuff+ and Command+ are read from the persistent
+    score store instead of re-scoring every pregame pitch.
+    """
+    features = pd.DataFrame(
+        {"pitcher_id": pd.Series(pitcher_ids, dtype="Int64")}
+    )
+
+    if raw_pitches is None or raw_pitches.height == 0:
+        return _empty_pitcher_features(pitcher_ids)
+
+    pregame: pl.DataFrame | None = None
+    as_of: pl.DataFrame | None = None
+
+    if aggregates is not None:
+        # Lookups only ever read appearances strictly before the target.
+        as_of = pitcher_stats_as_of(
+            aggregates,
+            pitcher_ids,
+            season,
+            target_game_date,
+            lookback_days,
+        )
+        if as_of.height == 0:
+            return _empty_pitcher_features(pitcher_ids)
+
+        features = _merge_polars_feature(
+            features,
+            as_of.drop("through_game_date", "pregame_pitches"),
+        )
+    else:
+        # Fatal leakage guard: this filter happens before every aggregation/model.
+        pregame = _filter_before_target(raw_pitches, target_game_date)
+        pregame = _filter_pitchers(pregame, pitcher_ids)
+
+        if pregame.height == 0:
+            return _empty_pitcher_features(pitcher_ids)
+
+        features = _direct_base_features(
+            features,
+            pregame,
+            season,
+            target_game_date,
+            lookback_days,
+        )
+
+    if score_store is not None:
+        # Stored scores are aggregated under the same strict cutoff.
+        stuff = stuff_from_snapshots(
+            score_store,
+            raw_pitches,
+            pitcher_ids,
+            target_game_date,
+            summary,
+            as_of=as_of,
+        )
+        command = command_from_store(
+            score_store,
+            pitcher_ids,
+            target_game_date,
+        )
+        features = _merge_polars_feature(features, stuff)
+        features = _merge_polars_feature(features, command)
+    else:
+        if pregame is None:
+            pregame = _filter_before_target(raw_pitches, target_game_date)
+            pregame = _filter_pitchers(pregame, pitcher_ids)
+
+        feats = _safe_model(
+            "pitch_features",
+            lambda: pitch_features(pregame),
+        )
+
+        stuff_pitch = _safe_model(
+            "mlb_stuff_plus",
+            lambda: mlb_stuff_plus(feats, level="pitch"),
+        )
+        if stuff_pitch.height:
+            stuff = stuff_pitch.group_by("pitcher").agg(
+                pl.col("stuff_plus").mean().alias("sp_stuff_plus"),
+                pl.len().alias("sp_stuff_scored_pitches"),
+            )
+            features = _merge_polars_feature(features, stuff)
+
+        command_pitch = _safe_model(
+            "mlb_command_plus",
+            lambda: mlb_command_plus(feats, level="pitch"),
+        )
+        if command_pitch.height:
+            command = command_pitch.group_by("pitcher").agg(
+                pl.col("command_plus").mean().alias("sp_command_plus"),
+                pl.len().alias("sp_command_scored_pitches"),
+            )
+            features = _merge_polars_feature(features, command)
+
     if (
         "sp_avg_velo" in features.columns
         and "sp_avg_velo_30d" in features.columns
@@ -511,17 +603,23 @@ def _dedupe_raw_statcast(frame: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _write_cache_atomic(
-    season: int,
+def _write_parquet_atomic(
+    path: Path,
     frame: pl.DataFrame,
 ) -> None:
-    path = _cache_path(season)
     tmp = path.with_suffix(".tmp.parquet")
 
     frame.write_parquet(tmp)
     tmp.replace(path)
 
 
+def _write_cache_atomic(
+    season: int,
+    frame: pl.DataFrame,
+) -> None:
+    _write_parquet_atomic(_cache_path(season), frame)
+
+
 def _pitcher_cache_max_dates(
     cache: pl.DataFrame,
 ) -> dict[int, date]:
@@ -584,26 +682,47 @@ def _fetch_statcast(
     return _as_polars(raw)
 
 
-def ensure_season_cache(
+def _scan_cache_max_dates(season: int) -> dict[int, date]:
+    """Per-pitcher max cached game date, reading only two parquet columns."""
+    path = _cache_path(season)
+
+    if not path.exists():
+        return {}
+
+    try:
+        maxima = (
+            pl.scan_parquet(path)
+            .select(
+                pl.col("pitcher").cast(pl.Int64, strict=False),
+                pl.col("game_date")
+                .cast(pl.Utf8)
+                .str.strptime(pl.Date, "%Y-%m-%d", strict=False)
+                .alias("_sdv_game_date"),
+            )
+            .drop_nulls()
+            .group_by("pitcher")
+            .agg(pl.col("_sdv_game_date").max().alias("max_game_date"))
+            .collect()
+        )
+    except Exception as exc:
+        raise RuntimeError(
+            f"Could not scan Statcast cache {path}: {exc}"
+        ) from exc
+
+    return {
+        int(row["pitcher"]): row["max_game_date"]
+        for row in maxima.iter_rows(named=True)
+    }
+
+
+def _fetch_cache_gaps(
     season: int,
     pitcher_ids: list[int],
+    max_dates: dict[int, date],
     required_through_date: date,
-    summary: dict,
-) -> pl.DataFrame:
-    """Ensure the season cache covers requested pitchers through the cutoff.
-
-    The cache is allowed to contain rows after a later historical target. Those
-    rows are harmless because ``build_pitcher_features`` always applies the
-    strict ``pitch.game_date < target_game_date`` filter before aggregation.
-    """
-    cache = _read_cache(season)
+) -> list[pl.DataFrame]:
     season_start = date(season, 3, 1)
 
-    if required_through_date < season_start or not pitcher_ids:
-        return cache
-
-    max_dates = _pitcher_cache_max_dates(cache)
-
     missing_ids = [
         pitcher_id
         for pitcher_id in pitcher_ids
@@ -648,25 +767,64 @@ def ensure_season_cache(
         if fetched.height:
             fetched_frames.append(fetched)
 
-    if fetched_frames:
-        pieces = [cache] if cache.height else []
-        pieces.extend(fetched_frames)
+    return fetched_frames
 
-        cache = pl.concat(
-            pieces,
-            how="diagonal_relaxed",
-        )
-        cache = _dedupe_raw_statcast(cache)
-        _write_cache_atomic(season, cache)
 
-        fetched_rows = sum(frame.height for frame in fetched_frames)
-        summary["statcast_pitches_fetched"] += fetched_rows
-        summary["cache_writes"] += 1
+def _merge_into_cache(
+    season: int,
+    cache: pl.DataFrame,
+    fetched_frames: list[pl.DataFrame],
+    summary: dict,
+) -> pl.DataFrame:
+    pieces = [cache] if cache.height else []
+    pieces.extend(fetched_frames)
+
+    cache = pl.concat(
+        pieces,
+        how="diagonal_relaxed",
+    )
+    cache = _dedupe_raw_statcast(cache)
+    _write_cache_atomic(season, cache)
+
+    fetched_rows = sum(frame.height for frame in fetched_frames)
+    summary["statcast_pitches_fetched"] += fetched_rows
+    summary["cache_writes"] += 1
 
-        _log(
-            f"CACHE WROTE {_cache_path(season)} "
-            f"rows={cache.height} fetched_rows={fetched_rows}"
-        )
+    _log(
+        f"CACHE WROTE {_cache_path(season)} "
+        f"rows={cache.height} fetched_rows={fetched_rows}"
+    )
+
+    return cache
+
+
+def ensure_season_cache(
+    season: int,
+    pitcher_ids: list[int],
+    required_through_date: date,
+    summary: dict,
+) -> pl.DataFrame:
+    """Ensure the season cache covers requested pitchers through the cutoff.
+
+    The cache is allowed to contain rows after a later historical target. Those
+    rows are harmless because ``build_pitcher_features`` always applies the
+    strict ``pitch.game_date < target_game_date`` filter before aggregation.
+    """
+    cache = _read_cache(season)
+    season_start = date(season, 3, 1)
+
+    if required_through_date < season_start or not pitcher_ids:
+        return cache
+
+    fetched_frames = _fetch_cache_gaps(
+        season,
+        pitcher_ids,
+        _pitcher_cache_max_dates(cache),
+        required_through_date,
+    )
+
+    if fetched_frames:
+        cache = _merge_into_cache(season, cache, fetched_frames, summary)
     elif cache.height:
         _log(
             f"CACHE HIT {_cache_path(season)} rows={cache.height}"
@@ -675,90 +833,684 @@ def ensure_season_cache(
     return cache
 
 
-# =========================
-# OUTPUT BUILD / VALIDATION
-# =========================
+def load_batch_season_cache(
+    season: int,
+    pitcher_ids: list[int],
+    required_through_date: date,
+    summary: dict,
+) -> pl.DataFrame:
+    """Refresh and load one season's cache for a whole batch of dates.
 
-def attach_side_features(
-    games: pd.DataFrame,
-    pitcher_features: pd.DataFrame,
-    side: str,
-) -> pd.DataFrame:
-    key = f"{side}_pitcher_id"
+    Freshness is checked once from a two-column lazy scan, gaps are fetched
+    once for the union of the batch's starters, and the cache is read once,
+    projected down to those starters, for every date in the batch.
+    """
+    season_start = date(season, 3, 1)
 
-    if key not in games.columns:
-        games[key] = ""
+    if required_through_date >= season_start and pitcher_ids:
+        fetched_frames = _fetch_cache_gaps(
+            season,
+            pitcher_ids,
+            _scan_cache_max_dates(season),
+            required_through_date,
+        )
+        if fetched_frames:
+            _merge_into_cache(
+                season,
+                _read_cache(season),
+                fetched_frames,
+                summary,
+            )
 
-    side_features = pitcher_features.copy()
-    side_features["_pitcher_key"] = (
-        side_features["pitcher_id"]
-        .astype("Int64")
-        .astype("string")
-    )
-    side_features = side_features.drop(columns=["pitcher_id"])
+    path = _cache_path(season)
+    if not path.exists():
+        return pl.DataFrame()
 
-    rename = {
-        col: f"sdv_{side}_{col}"
-        for col in side_features.columns
-        if col != "_pitcher_key"
-    }
-    side_features = side_features.rename(columns=rename)
+    try:
+        cache = (
+            pl.scan_parquet(path)
+            .with_columns(pl.col("pitcher").cast(pl.Int64, strict=False))
+            .filter(pl.col("pitcher").is_in(pitcher_ids))
+            .collect()
+        )
+    except Exception as exc:
+        raise RuntimeError(
+            f"Could not read Statcast cache {path}: {exc}"
+        ) from exc
 
-    games[key] = games[key].astype("string").str.strip()
-    games = (
-        games
-        .merge(
-            side_features,
-            left_on=key,
-            right_on="_pitcher_key",
-            how="left",
+    if cache.height and "game_date" not in cache.columns:
+        raise ValueError(
+            f"Statcast cache {path} is missing game_date"
         )
-        .drop(columns=["_pitcher_key"])
-    )
 
-    pitches_col = f"sdv_{side}_sp_pitches"
-    games[f"sdv_{side}_sp_found"] = (
-        games[pitches_col].notna().astype(int)
+    _log(
+        f"BATCH CACHE LOADED {path} rows={cache.height} "
+        f"pitchers={len(pitcher_ids)} "
+        f"through={required_through_date.isoformat()}"
     )
 
-    return games
+    return cache
 
 
-def validate_output_pregame_cutoff(
-    output: pd.DataFrame,
-    label: str,
-) -> None:
-    if "sdv_as_of_date" not in output.columns:
-        raise ValueError(f"{label} missing sdv_as_of_date")
-    if "game_date" not in output.columns:
-        raise ValueError(f"{label} missing game_date")
+# =========================
+# PER-PITCH SCORE STORE
+# =========================
+#
+# Command+ features are purely per-pitch (location, count, handedness, pitch
+# type), so each cached pitch is scored once and stored by PITCH_KEY_COLUMNS.
+# Stuff+ features are z-scored within the pitcher over the whole as-of pitch
+# set, so a single pitch has no date-independent Stuff+ score. Stuff+ is
+# therefore stored as per-pitcher snapshots keyed by the as-of pitch set
+# (last pregame game date + pitch count), which is identical for every target
+# date between two appearances and survives re-runs.
+
+STUFF_SNAPSHOT_KEYS = [
+    "pitcher",
+    "through_game_date",
+    "pregame_pitches",
+]
 
-    as_of = pd.to_datetime(
-        output["sdv_as_of_date"]
-        .astype("string")
-        .str.replace("_", "-", regex=False),
-        errors="coerce",
-    )
-    game_date = pd.to_datetime(
-        output["game_date"]
-        .astype("string")
-        .str.replace("_", "-", regex=False),
-        errors="coerce",
-    )
 
-    bad = (
-        as_of.isna()
-        | game_date.isna()
-        | (as_of >= game_date)
-    )
+def _pitch_score_path(season: int) -> Path:
+    return CACHE_DIR / f"{season}_pitch_scores.parquet"
 
-    if bad.any():
-        sample = (
-            output.loc[
-                bad,
-                ["game_id", "game_date", "sdv_as_of_date"]
-                if "game_id" in output.columns
-                else ["game_date", "sdv_as_of_date"],
+
+def _stuff_snapshot_path(season: int) -> Path:
+    return CACHE_DIR / f"{season}_stuff_snapshots.parquet"
+
+
+def _read_store(path: Path) -> pl.DataFrame:
+    """Read a derived score store; unreadable stores are rebuilt, not fatal."""
+    if not path.exists():
+        return pl.DataFrame()
+
+    try:
+        return pl.read_parquet(path)
+    except Exception as exc:
+        _log(f"Score store {path} unreadable, rebuilding: {exc}", "WARN")
+        return pl.DataFrame()
+
+
+def _score_command_pitches(pending: pl.DataFrame) -> pl.DataFrame:
+    """Score pitches with Command+, one row per pending pitch key.
+
+    Pitches the model cannot score keep a null ``command_plus`` so they are
+    not re-scored on the next run.
+    """
+    feats = pitch_features(pending)
+    have = [col for col in COMMAND_FEATURES if col in feats.columns]
+    scorable = feats.filter(
+        pl.all_horizontal([pl.col(col).is_not_null() for col in have])
+    )
+
+    scored = mlb_command_plus(scorable, level="pitch")
+    if scored.height != scorable.height:
+        raise ValueError(
+            f"mlb_command_plus returned {scored.height} rows "
+            f"for {scorable.height} scorable pitches"
+        )
+
+    scores = scorable.select(PITCH_KEY_COLUMNS).with_columns(
+        scored.get_column("command_plus").alias("command_plus")
+    )
+
+    return (
+        pending
+        .select(PITCH_KEY_COLUMNS + ["_sdv_game_date"])
+        .rename({"_sdv_game_date": "game_date"})
+        .join(scores, on=PITCH_KEY_COLUMNS, how="left")
+    )
+
+
+def load_score_store(
+    season: int,
+    season_cache: pl.DataFrame,
+    summary: dict,
+) -> dict | None:
+    """Load the season score store and score any newly cached pitches.
+
+    Returns ``None`` when the cache lacks the pitch identity columns, in which
+    case callers fall back to scoring the pregame pitches directly.
+    """
+    if season_cache is None or season_cache.height == 0:
+        return None
+    if any(col not in season_cache.columns for col in PITCH_KEY_COLUMNS):
+        _log(
+            f"Score store disabled season={season}: cache missing "
+            f"{PITCH_KEY_COLUMNS}",
+            "WARN",
+        )
+        return None
+
+    keyed = _with_parsed_game_date(
+        season_cache.with_columns(
+            [pl.col(col).cast(pl.Int64, strict=False) for col in PITCH_KEY_COLUMNS]
+        )
+    ).filter(
+        pl.all_horizontal(
+            [pl.col(col).is_not_null() for col in PITCH_KEY_COLUMNS]
+        )
+        & pl.col("_sdv_game_date").is_not_null()
+    )
+
+    pitch_scores = _read_store(_pitch_score_path(season))
+    pending = (
+        keyed.join(
+            pitch_scores.select(PITCH_KEY_COLUMNS),
+            on=PITCH_KEY_COLUMNS,
+            how="anti",
+        )
+        if pitch_scores.height
+        else keyed
+    )
+
+    if pending.height:
+        try:
+            fresh = _score_command_pitches(pending)
+        except Exception as exc:
+            _log(f"mlb_command_plus store scoring failed: {exc}", "WARN")
+            return None
+
+        pitch_scores = (
+            pl.concat([pitch_scores, fresh], how="diagonal_relaxed")
+            if pitch_scores.height
+            else fresh
+        )
+        _write_parquet_atomic(_pitch_score_path(season), pitch_scores)
+        summary["pitches_scored"] += fresh.height
+
+        _log(
+            f"SCORE STORE WROTE {_pitch_score_path(season)} "
+            f"rows={pitch_scores.height} scored={fresh.height}"
+        )
+
+    return {
+        "season": season,
+        "pitch_scores": pitch_scores,
+        "stuff_snapshots": _read_store(_stuff_snapshot_path(season)),
+    }
+
+
+def command_from_store(
+    score_store: dict,
+    pitcher_ids: list[int],
+    target_game_date: date,
+) -> pl.DataFrame:
+    """As-of Command+ aggregate from stored per-pitch scores."""
+    pitch_scores = score_store["pitch_scores"]
+    if pitch_scores.height == 0:
+        return pl.DataFrame()
+
+    return (
+        pitch_scores
+        .filter(
+            (pl.col("game_date") < pl.lit(target_game_date))
+            & pl.col("pitcher").is_in(pitcher_ids)
+            & pl.col("command_plus").is_not_null()
+        )
+        .group_by("pitcher")
+        .agg(
+            pl.col("command_plus").mean().alias("sp_command_plus"),
+            pl.len().alias("sp_command_scored_pitches"),
+        )
+    )
+
+
+def stuff_from_snapshots(
+    score_store: dict,
+    raw_pitches: pl.DataFrame,
+    pitcher_ids: list[int],
+    target_game_date: date,
+    summary: dict | None,
+    as_of: pl.DataFrame | None = None,
+) -> pl.DataFrame:
+    """As-of Stuff+ aggregate, scoring only pitch sets not yet snapshotted.
+
+    ``as_of`` carries the snapshot keys (``pitcher``, ``through_game_date``,
+    ``pregame_pitches``) when they are already known from the cumulative
+    aggregates; otherwise they are derived from the pregame pitch rows.
+    """
+    if as_of is None:
+        pregame = _filter_pitchers(
+            _filter_before_target(raw_pitches, target_game_date),
+            pitcher_ids,
+        )
+        if pregame.height == 0:
+            return pl.DataFrame()
+        as_of = (
+            _with_parsed_game_date(pregame)
+            .group_by("pitcher")
+            .agg(
+                pl.col("_sdv_game_date").max().alias("through_game_date"),
+                pl.len().cast(pl.Int64).alias("pregame_pitches"),
+            )
+        )
+
+    as_of = as_of.select(STUFF_SNAPSHOT_KEYS)
+
+    snapshots = score_store["stuff_snapshots"]
+    if snapshots.height:
+        known = as_of.join(snapshots, on=STUFF_SNAPSHOT_KEYS, how="inner")
+        misses = as_of.join(snapshots, on=STUFF_SNAPSHOT_KEYS, how="anti")
+    else:
+        known = pl.DataFrame()
+        misses = as_of
+
+    pieces = [known] if known.height else []
+
+    if misses.height:
+        # Fatal leakage guard: only the missing pitchers' pregame rows.
+        subset = _filter_before_target(
+            _filter_pitchers(
+                raw_pitches,
+                misses.get_column("pitcher").to_list(),
+            ),
+            target_game_date,
+        )
+        try:
+            stuff_pitch = mlb_stuff_plus(
+                pitch_features(subset),
+                level="pitch",
+            )
+        except Exception as exc:
+            _log(f"mlb_stuff_plus failed: {exc}", "WARN")
+            stuff_pitch = None
+
+        if stuff_pitch is not None:
+            scored = (
+                stuff_pitch.group_by("pitcher").agg(
+                    pl.col("stuff_plus").mean().alias("sp_stuff_plus"),
+                    pl.len().alias("sp_stuff_scored_pitches"),
+                )
+                if stuff_pitch.height
+                else pl.DataFrame(
+                    schema={
+                        "pitcher": pl.Int64,
+                        "sp_stuff_plus": pl.Float64,
+                        "sp_stuff_scored_pitches": pl.UInt32,
+                    }
+                )
+            )
+            fresh = misses.join(
+                scored.with_columns(pl.col("pitcher").cast(pl.Int64)),
+                on="pitcher",
+                how="left",
+            )
+            pieces.append(fresh)
+
+            score_store["stuff_snapshots"] = (
+                pl.concat([snapshots, fresh], how="diagonal_relaxed")
+                if snapshots.height
+                else fresh
+            )
+            _write_parquet_atomic(
+                _stuff_snapshot_path(score_store["season"]),
+                score_store["stuff_snapshots"],
+            )
+            if summary is not None:
+                summary["stuff_snapshots_built"] += fresh.height
+
+    if not pieces:
+        return pl.DataFrame()
+
+    return (
+        pl.concat(pieces, how="diagonal_relaxed")
+        .filter(pl.col("sp_stuff_plus").is_not_null())
+        .select("pitcher", "sp_stuff_plus", "sp_stuff_scored_pitches")
+    )
+
+
+# =========================
+# CUMULATIVE AS-OF AGGREGATES
+# =========================
+#
+# One pass over the season cache builds one row per pitcher appearance
+# (pitcher, game date, game_pk) with running totals ordered by game date.
+# An as-of cutoff is the last appearance strictly before the target; a
+# rolling window is the difference between the running totals at its two
+# bounds. Neither touches the raw pitch rows again.
+
+AGGREGATE_REQUIRED_COLUMNS = [
+    "pitcher",
+    "game_date",
+    "game_pk",
+    "pitch_type",
+    "release_speed",
+    "release_spin_rate",
+    "estimated_woba_using_speedangle",
+]
+
+AGGREGATE_SUM_COLUMNS = [
+    "pitches",
+    "velo_sum",
+    "velo_n",
+    "spin_sum",
+    "spin_n",
+    "xwoba_sum",
+    "xwoba_n",
+    "new_games",
+]
+
+
+def build_pitcher_aggregates(season_cache: pl.DataFrame) -> dict | None:
+    """Build per-appearance running totals from the raw season cache.
+
+    Returns ``None`` when the cache lacks a column the aggregates need, in
+    which case callers fall back to re-aggregating the pregame pitch rows.
+    """
+    if season_cache is None or season_cache.height == 0:
+        return None
+
+    missing = [
+        col for col in AGGREGATE_REQUIRED_COLUMNS
+        if col not in season_cache.columns
+    ]
+    if missing:
+        _log(
+            f"Cumulative aggregates disabled: cache missing {missing}",
+            "WARN",
+        )
+        return None
+
+    parsed = _with_parsed_game_date(
+        season_cache.with_columns(
+            pl.col("pitcher").cast(pl.Int64, strict=False)
+        )
+    )
+    invalid_dates = parsed.filter(pl.col("_sdv_game_date").is_null()).height
+    if invalid_dates:
+        raise ValueError(
+            f"Statcast data contains {invalid_dates} rows with invalid game_date"
+        )
+    parsed = parsed.filter(pl.col("pitcher").is_not_null())
+
+    velo = pl.col("release_speed").cast(pl.Float64, strict=False)
+    spin = pl.col("release_spin_rate").cast(pl.Float64, strict=False)
+    xwoba = pl.col("estimated_woba_using_speedangle").cast(
+        pl.Float64,
+        strict=False,
+    )
+
+    appearances = (
+        parsed
+        .group_by("pitcher", "_sdv_game_date", "game_pk")
+        .agg(
+            pl.len().cast(pl.Int64).alias("pitches"),
+            velo.sum().alias("velo_sum"),
+            velo.count().cast(pl.Int64).alias("velo_n"),
+            spin.sum().alias("spin_sum"),
+            spin.count().cast(pl.Int64).alias("spin_n"),
+            xwoba.sum().alias("xwoba_sum"),
+            xwoba.count().cast(pl.Int64).alias("xwoba_n"),
+            pl.col("game_date").cast(pl.Utf8).max().alias("last_game_date"),
+        )
+        .rename({"_sdv_game_date": "appearance_date"})
+        .sort("pitcher", "appearance_date", "game_pk")
+        .with_columns(
+            # A game_pk counts once per pitcher, on its first appearance date.
+            pl.col("game_pk")
+            .is_first_distinct()
+            .over("pitcher")
+            .cast(pl.Int64)
+            .alias("new_games")
+        )
+        .with_columns(
+            [
+                pl.col(col).cum_sum().over("pitcher").alias(f"cum_{col}")
+                for col in AGGREGATE_SUM_COLUMNS
+            ]
+        )
+    )
+
+    pitch_types = (
+        parsed
+        .filter(pl.col("pitch_type").is_not_null())
+        .group_by("pitcher", "pitch_type")
+        .agg(pl.col("_sdv_game_date").min().alias("first_date"))
+    )
+
+    return {
+        "appearances": appearances,
+        "pitch_types": pitch_types,
+    }
+
+
+def _totals_before(
+    appearances: pl.DataFrame,
+    pitcher_ids: list[int],
+    cutoff: date,
+) -> pl.DataFrame:
+    """Running totals at each pitcher's last appearance strictly before cutoff."""
+    return (
+        appearances
+        .filter(
+            pl.col("pitcher").is_in(pitcher_ids)
+            & (pl.col("appearance_date") < pl.lit(cutoff))
+        )
+        .group_by("pitcher", maintain_order=True)
+        .last()
+    )
+
+
+def _xera_from_xwoba(
+    frame: pl.DataFrame,
+    season: int,
+    label: str,
+    suffix: str = "",
+) -> pl.DataFrame:
+    """Convert per-pitcher mean xwOBA to xERA through ``x_era`` itself."""
+    means = frame.filter(pl.col("x_woba").is_not_null()).select(
+        "pitcher",
+        pl.col("x_woba").alias("estimated_woba_using_speedangle"),
+    )
+    xera = _safe_model(label, lambda: x_era(means, season))
+    if xera.height == 0:
+        return pl.DataFrame()
+
+    return xera.select(
+        "pitcher",
+        pl.col("x_woba").alias(f"sp_xwoba{suffix}"),
+        pl.col("x_era").alias(f"sp_xera{suffix}"),
+    )
+
+
+def _mean_of(sum_col: str, n_col: str) -> pl.Expr:
+    return (
+        pl.when(pl.col(n_col) > 0)
+        .then(pl.col(sum_col) / pl.col(n_col))
+        .otherwise(None)
+    )
+
+
+def pitcher_stats_as_of(
+    aggregates: dict,
+    pitcher_ids: list[int],
+    season: int,
+    target_game_date: date,
+    lookback_days: int,
+) -> pl.DataFrame:
+    """Season-to-date and recent-window base/xERA features as of a target.
+
+    Also returns the Stuff+ snapshot keys ``through_game_date`` and
+    ``pregame_pitches`` so callers never need to re-scan the raw pitches.
+    """
+    appearances = aggregates["appearances"]
+    totals = _totals_before(appearances, pitcher_ids, target_game_date)
+    if totals.height == 0:
+        return pl.DataFrame()
+
+    pitch_types = (
+        aggregates["pitch_types"]
+        .filter(
+            pl.col("pitcher").is_in(pitcher_ids)
+            & (pl.col("first_date") < pl.lit(target_game_date))
+        )
+        .group_by("pitcher")
+        .agg(pl.len().alias("sp_pitch_types"))
+    )
+
+    season_stats = (
+        totals
+        .select(
+            "pitcher",
+            pl.col("cum_pitches").alias("sp_pitches"),
+            pl.col("cum_new_games").alias("sp_games"),
+            _mean_of("cum_velo_sum", "cum_velo_n").alias("sp_avg_velo"),
+            _mean_of("cum_spin_sum", "cum_spin_n").alias("sp_avg_spin"),
+            _mean_of("cum_xwoba_sum", "cum_xwoba_n").alias("x_woba"),
+            pl.col("last_game_date").alias("sp_last_game_date"),
+            pl.col("appearance_date").alias("through_game_date"),
+            pl.col("cum_pitches").alias("pregame_pitches"),
+        )
+        .join(pitch_types, on="pitcher", how="left")
+        .with_columns(pl.col("sp_pitch_types").fill_null(0))
+    )
+
+    # Recent window: totals before target minus totals before window start.
+    recent_start = target_game_date - timedelta(days=lookback_days)
+    prior = _totals_before(appearances, pitcher_ids, recent_start).select(
+        "pitcher",
+        *[pl.col(f"cum_{col}").alias(f"prior_{col}") for col in AGGREGATE_SUM_COLUMNS],
+    )
+    window = (
+        totals
+        .join(prior, on="pitcher", how="left")
+        .with_columns(
+            [
+                (
+                    pl.col(f"cum_{col}")
+                    - pl.col(f"prior_{col}").fill_null(0)
+                ).alias(f"win_{col}")
+                for col in AGGREGATE_SUM_COLUMNS
+            ]
+        )
+        .filter(pl.col("win_pitches") > 0)
+    )
+
+    # Distinct games inside the window are counted directly from the window's
+    # appearance rows so a game resumed on a later date is still counted.
+    window_games = (
+        appearances
+        .filter(
+            pl.col("pitcher").is_in(pitcher_ids)
+            & (pl.col("appearance_date") >= pl.lit(recent_start))
+            & (pl.col("appearance_date") < pl.lit(target_game_date))
+        )
+        .group_by("pitcher")
+        .agg(pl.col("game_pk").n_unique().alias("sp_games_30d"))
+    )
+
+    recent_stats = (
+        window
+        .select(
+            "pitcher",
+            pl.col("win_pitches").alias("sp_pitches_30d"),
+            _mean_of("win_velo_sum", "win_velo_n").alias("sp_avg_velo_30d"),
+            _mean_of("win_spin_sum", "win_spin_n").alias("sp_avg_spin_30d"),
+            _mean_of("win_xwoba_sum", "win_xwoba_n").alias("x_woba"),
+        )
+        .join(window_games, on="pitcher", how="left")
+    )
+
+    out = season_stats.drop("x_woba")
+
+    xera = _xera_from_xwoba(season_stats, season, "x_era")
+    if xera.height:
+        out = out.join(xera, on="pitcher", how="left")
+
+    out = out.join(recent_stats.drop("x_woba"), on="pitcher", how="left")
+
+    recent_xera = _xera_from_xwoba(recent_stats, season, "x_era_30d", "_30d")
+    if recent_xera.height:
+        out = out.join(recent_xera, on="pitcher", how="left")
+
+    return out
+
+
+# =========================
+# OUTPUT BUILD / VALIDATION
+# =========================
+
+def attach_side_features(
+    games: pd.DataFrame,
+    pitcher_features: pd.DataFrame,
+    side: str,
+) -> pd.DataFrame:
+    key = f"{side}_pitcher_id"
+
+    if key not in games.columns:
+        games[key] = ""
+
+    side_features = pitcher_features.copy()
+    side_features["_pitcher_key"] = (
+        side_features["pitcher_id"]
+        .astype("Int64")
+        .astype("string")
+    )
+    side_features = side_features.drop(columns=["pitcher_id"])
+
+    rename = {
+        col: f"sdv_{side}_{col}"
+        for col in side_features.columns
+        if col != "_pitcher_key"
+    }
+    side_features = side_features.rename(columns=rename)
+
+    games[key] = games[key].astype("string").str.strip()
+    games = (
+        games
+        .merge(
+            side_features,
+            left_on=key,
+            right_on="_pitcher_key",
+            how="left",
+        )
+        .drop(columns=["_pitcher_key"])
+    )
+
+    pitches_col = f"sdv_{side}_sp_pitches"
+    games[f"sdv_{side}_sp_found"] = (
+        games[pitches_col].notna().astype(int)
+    )
+
+    return games
+
+
+def validate_output_pregame_cutoff(
+    output: pd.DataFrame,
+    label: str,
+) -> None:
+    if "sdv_as_of_date" not in output.columns:
+        raise ValueError(f"{label} missing sdv_as_of_date")
+    if "game_date" not in output.columns:
+        raise ValueError(f"{label} missing game_date")
+
+    as_of = pd.to_datetime(
+        output["sdv_as_of_date"]
+        .astype("string")
+        .str.replace("_", "-", regex=False),
+        errors="coerce",
+    )
+    game_date = pd.to_datetime(
+        output["game_date"]
+        .astype("string")
+        .str.replace("_", "-", regex=False),
+        errors="coerce",
+    )
+
+    bad = (
+        as_of.isna()
+        | game_date.isna()
+        | (as_of >= game_date)
+    )
+
+    if bad.any():
+        sample = (
+            output.loc[
+                bad,
+                ["game_id", "game_date", "sdv_as_of_date"]
+                if "game_id" in output.columns
+                else ["game_date", "sdv_as_of_date"],
             ]
             .head(10)
             .to_dict("records")
@@ -803,11 +1555,84 @@ def write_base_output(
     write_output_checked(out, out_path)
 
 
+def _starter_ids(games: pd.DataFrame) -> list[int]:
+    return _safe_ints(
+        list(
+            games.get(
+                "home_pitcher_id",
+                pd.Series(dtype=str),
+            )
+        )
+        + list(
+            games.get(
+                "away_pitcher_id",
+                pd.Series(dtype=str),
+            )
+        )
+    )
+
+
+def season_derived_state(
+    season: int,
+    season_cache: pl.DataFrame,
+    summary: dict,
+    season_state: dict | None,
+) -> dict:
+    """Cumulative aggregates and score store for a season cache.
+
+    ``season_state`` memoizes them across dates of one run; they are rebuilt
+    only after a cache write changes the underlying rows.
+    """
+    cached = (season_state or {}).get(season)
+    if cached is not None and cached["cache_writes"] == summary["cache_writes"]:
+        return cached
+
+    try:
+        aggregates = build_pitcher_aggregates(season_cache)
+    except Exception as exc:
+        _log(
+            f"season={season} | cumulative aggregates unavailable: {exc}",
+            "WARN",
+        )
+        aggregates = None
+
+    try:
+        score_store = load_score_store(
+            season,
+            season_cache,
+            summary,
+        )
+    except Exception as exc:
+        _log(
+            f"season={season} | score store unavailable, scoring directly: {exc}",
+            "WARN",
+        )
+        score_store = None
+
+    derived = {
+        "cache_writes": summary["cache_writes"],
+        "aggregates": aggregates,
+        "score_store": score_store,
+    }
+    if season_state is not None:
+        season_state[season] = derived
+
+    return derived
+
+
 def process_date(
     date_str: str,
     lookback_days: int,
     summary: dict,
+    season_state: dict | None = None,
+    cache_loader=None,
 ) -> None:
+    """Write one date's SportsDataverse features.
+
+    ``cache_loader(season, pitcher_ids, statcast_end)`` supplies the season
+    Statcast frame; it defaults to a per-date ``ensure_season_cache`` call and
+    is replaced in batch mode by a lookup of the preloaded season caches.
+    """
     games_path = GAMES_DIR / f"{date_str}_games.csv"
     out_path = OUT_DIR / f"{date_str}_sportsdataverse.csv"
 
@@ -838,20 +1663,7 @@ def process_date(
     season = game_date.year
     season_start = date(season, 3, 1)
 
-    pitcher_ids = _safe_ints(
-        list(
-            games.get(
-                "home_pitcher_id",
-                pd.Series(dtype=str),
-            )
-        )
-        + list(
-            games.get(
-                "away_pitcher_id",
-                pd.Series(dtype=str),
-            )
-        )
-    )
+    pitcher_ids = _starter_ids(games)
 
     _log(
         f"{date_str} | games={len(games)} "
@@ -883,12 +1695,20 @@ def process_date(
         summary["rows_written"] += len(games)
         return
 
+    if cache_loader is None:
+        def cache_loader(season, pitcher_ids, statcast_end):
+            return ensure_season_cache(
+                season,
+                pitcher_ids,
+                statcast_end,
+                summary,
+            )
+
     try:
-        season_cache = ensure_season_cache(
+        season_cache = cache_loader(
             season,
             pitcher_ids,
             statcast_end,
-            summary,
         )
     except Exception as exc:
         _log(
@@ -923,17 +1743,40 @@ def process_date(
         summary["rows_written"] += len(games)
         return
 
-    # The cache may contain later dates. Filter strictly before feature work.
-    pregame_cache = _filter_before_target(
+    derived = season_derived_state(
+        season,
         season_cache,
-        game_date,
-    )
-    pregame_cache = _filter_pitchers(
-        pregame_cache,
-        pitcher_ids,
+        summary,
+        season_state,
     )
+    aggregates = derived["aggregates"]
+
+    if aggregates is not None:
+        # Appearance totals strictly before the target; no raw re-scan.
+        pregame_pitches = int(
+            _totals_before(
+                aggregates["appearances"],
+                pitcher_ids,
+                game_date,
+            )
+            .get_column("cum_pitches")
+            .sum()
+        )
+        feature_pitches = season_cache
+    else:
+        # The cache may contain later dates. Filter strictly before feature work.
+        pregame_cache = _filter_before_target(
+            season_cache,
+            game_date,
+        )
+        pregame_cache = _filter_pitchers(
+            pregame_cache,
+            pitcher_ids,
+        )
+        pregame_pitches = pregame_cache.height
+        feature_pitches = pregame_cache
 
-    if pregame_cache.height == 0:
+    if pregame_pitches == 0:
         write_base_output(
             games,
             out_path,
@@ -950,15 +1793,18 @@ def process_date(
         return
 
     _log(
-        f"{date_str} | pregame Statcast pitches={pregame_cache.height}"
+        f"{date_str} | pregame Statcast pitches={pregame_pitches}"
     )
 
     pitcher_features = build_pitcher_features(
-        pregame_cache,
+        feature_pitches,
         pitcher_ids,
         season,
         game_date,
         lookback_days,
+        score_store=derived["score_store"],
+        aggregates=aggregates,
+        summary=summary,
     )
 
     output = games.copy()
@@ -999,7 +1845,87 @@ def process_date(
 
     summary["files_written"] += 1
     summary["rows_written"] += len(output)
-    summary["pregame_statcast_pitches"] += pregame_cache.height
+    summary["pregame_statcast_pitches"] += pregame_pitches
+
+
+# =========================
+# BATCH MODE
+# =========================
+
+def plan_batch(dates: list[str]) -> dict[int, dict]:
+    """Union starters and the latest required cutoff per season for a batch."""
+    plan: dict[int, dict] = {}
+
+    for date_str in dates:
+        games_path = GAMES_DIR / f"{date_str}_games.csv"
+        if not games_path.exists():
+            continue
+
+        games = pd.read_csv(
+            games_path,
+            dtype=str,
+            encoding="utf-8-sig",
+        )
+        if games.empty:
+            continue
+
+        game_date = _game_date_for_file(date_str, games)
+        statcast_end = game_date - timedelta(days=1)
+        season = game_date.year
+
+        if statcast_end < date(season, 3, 1):
+            continue
+
+        entry = plan.setdefault(
+            season,
+            {"pitcher_ids": [], "through": statcast_end},
+        )
+        entry["pitcher_ids"] = list(
+            dict.fromkeys(entry["pitcher_ids"] + _starter_ids(games))
+        )
+        entry["through"] = max(entry["through"], statcast_end)
+
+    return plan
+
+
+def prepare_batch_loader(
+    dates: list[str],
+    summary: dict,
+):
+    """Refresh and load each season once, returning a ``cache_loader``.
+
+    The batch cache may contain pitches after any single date's cutoff; every
+    feature path still filters ``pitch.game_date < target_game_date``.
+    """
+    caches: dict[int, pl.DataFrame] = {}
+    failures: dict[int, str] = {}
+
+    for season, entry in sorted(plan_batch(dates).items()):
+        _log(
+            f"BATCH season={season} "
+            f"pitchers={len(entry['pitcher_ids'])} "
+            f"through={entry['through'].isoformat()}"
+        )
+        try:
+            caches[season] = load_batch_season_cache(
+                season,
+                entry["pitcher_ids"],
+                entry["through"],
+                summary,
+            )
+        except Exception as exc:
+            failures[season] = str(exc)
+            _log(
+                f"BATCH season={season} cache/fetch failed: {exc}",
+                "ERROR",
+            )
+
+    def cache_loader(season, pitcher_ids, statcast_end):
+        if season in failures:
+            raise RuntimeError(failures[season])
+        return caches.get(season, pl.DataFrame())
+
+    return cache_loader
 
 
 # =========================
@@ -1038,6 +1964,15 @@ def parse_args() -> argparse.Namespace:
         help="Recent-form window in calendar days (default: 30).",
     )
 
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "Refresh and load each season's Statcast cache once for all "
+            "requested dates instead of once per date (backfills)."
+        ),
+    )
+
     return parser.parse_args()
 
 
@@ -1136,6 +2071,8 @@ def main() -> None:
         "pregame_statcast_pitches": 0,
         "statcast_pitches_fetched": 0,
         "cache_writes": 0,
+        "pitches_scored": 0,
+        "stuff_snapshots_built": 0,
         "errors": 0,
     }
 
@@ -1161,6 +2098,7 @@ def main() -> None:
     _log(
         f"dates={dates} "
         f"lookback_days={args.lookback_days} "
+        f"batch={args.batch} "
         f"cache_dir={CACHE_DIR}"
     )
 
@@ -1174,12 +2112,27 @@ def main() -> None:
         )
         return
 
+    season_state: dict = {}
+    cache_loader = None
+    if args.batch:
+        try:
+            cache_loader = prepare_batch_loader(dates, summary)
+        except Exception as exc:
+            _log(
+                f"BATCH PREPARE FAILED, falling back to per-date caches: {exc}\n"
+                f"{traceback.format_exc()}",
+                "ERROR",
+            )
+            summary["errors"] += 1
+
     for date_str in dates:
         try:
             process_date(
                 date_str,
                 args.lookback_days,
                 summary,
+                season_state,
+                cache_loader,
             )
         except Exception as exc:
             _log(
@@ -1204,6 +2157,8 @@ def main() -> None:
         f"statcast_pitches_fetched="
         f"{summary['statcast_pitches_fetched']} "
         f"cache_writes={summary['cache_writes']} "
+        f"pitches_scored={summary['pitches_scored']} "
+        f"stuff_snapshots_built={summary['stuff_snapshots_built']} "
         f"errors={summary['errors']} "
         f"status={status}"
     )
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+# docs/win/baseball/mlb/scripts/00_parsing/odds_history.py
+#
+# Append-only odds history for MLB.
+#
+# Every odds pull appends one immutable Parquet part with one row per
+# (event, bookmaker, market, side) price it saw:
+#
+#   docs/win/baseball/mlb/odds/history/{YYYY_MM_DD}/{captured_at}_{source}.parquet
+#
+# The date directory is the slate's ET date, so a game's whole price history
+# lives in one directory. Part names start with the UTC capture stamp, so
+# as-of queries skip later parts without opening them. Rows inside a part are
+# sorted by event_id, bookmaker, market, side.
+#
+# Query helpers (opening_prices, closing_prices, prices_at) work on the frame
+# load_history returns and give one row per (event, bookmaker, market, side).
+#
+# Backfill from the JSON dumps already on disk:
+#   python docs/win/baseball/mlb/scripts/00_parsing/odds_history.py backfill
+
+import argparse
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+ODDS_DIR = Path("docs/win/baseball/mlb/odds")
+HISTORY_DIR = ODDS_DIR / "history"
+
+ET = ZoneInfo("America/New_York")
+
+STAMP_FORMAT = "%Y%m%dT%H%M%SZ"
+
+HISTORY_COLUMNS = [
+    "event_id",
+    "commence_time",
+    "home_team",
+    "away_team",
+    "bookmaker",
+    "market",
+    "side",
+    "line",
+    "price",
+    "last_update",
+    "captured_at",
+    "source",
+]
+
+KEY_COLUMNS = ["event_id", "bookmaker", "market", "side"]
+
+
+# =========================
+# FLATTEN
+# =========================
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _side(market_key, outcome_name, home_team, away_team):
+    name = str(outcome_name or "").strip()
+
+    if market_key == "totals":
+        lowered = name.lower()
+        return lowered if lowered in ("over", "under") else None
+
+    if name == str(home_team or "").strip():
+        return "home"
+
+    if name == str(away_team or "").strip():
+        return "away"
+
+    return None
+
+
+def flatten_markets(
+    event_id,
+    commence_time,
+    home_team,
+    away_team,
+    bookmaker,
+    markets,
+    captured_at,
+    source,
+):
+    """
+    Flattens converted markets ({"key", "last_update", "outcomes"}) into
+    history rows. Outcomes that cannot be mapped to a side are dropped.
+    """
+    rows = []
+
+    for market in markets or []:
+        market_key = market.get("key")
+
+        for outcome in market.get("outcomes") or []:
+            side = _side(market_key, outcome.get("name"), home_team, away_team)
+            price = _to_float(outcome.get("price"))
+
+            if side is None or price is None:
+                continue
+
+            rows.append(
+                {
+                    "event_id": str(event_id),
+                    "commence_time": commence_time,
+                    "home_team": home_team,
+                    "away_team": away_team,
+                    "bookmaker": bookmaker,
+                    "market": market_key,
+                    "side": side,
+                    "line": _to_float(outcome.get("point")),
+                    "price": price,
+                    "last_update": market.get("last_update"),
+                    "captured_at": captured_at,
+                    "source": source,
+                }
+            )
+
+    return rows
+
+
+def flatten_converted_events(events, captured_at, source):
+    """Flattens events in the odds/{date}.json layout (one entry per bookmaker)."""
+    rows = []
+
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+
+        for bookmaker in event.get("bookmakers") or []:
+            rows.extend(
+                flatten_markets(
+                    event.get("id"),
+                    event.get("commence_time"),
+                    event.get("home_team"),
+                    event.get("away_team"),
+                    bookmaker.get("title") or bookmaker.get("key"),
+                    bookmaker.get("markets"),
+                    captured_at,
+                    source,
+                )
+            )
+
+    return rows
+
+
+# =========================
+# WRITE
+# =========================
+
+def _utc(value):
+    ts = pd.Timestamp(value)
+
+    if ts.tzinfo is None:
+        return ts.tz_localize("UTC")
+
+    return ts.tz_convert("UTC")
+
+
+def _history_frame(rows):
+    df = pd.DataFrame(rows, columns=HISTORY_COLUMNS)
+
+    for col in ["commence_time", "last_update", "captured_at"]:
+        df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
+
+    for col in ["line", "price"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    for col in ["event_id", "home_team", "away_team", "bookmaker", "market", "side", "source"]:
+        df[col] = df[col].astype("string")
+
+    return df.sort_values(KEY_COLUMNS, kind="mergesort").reset_index(drop=True)
+
+
+def part_path(game_date, captured_at, source):
+    stamp = _utc(captured_at).strftime(STAMP_FORMAT)
+    return HISTORY_DIR / game_date / f"{stamp}_{source}.parquet"
+
+
+def append_snapshot(rows, game_date, captured_at, source):
+    """
+    Writes one pull's rows as a new part and returns its path.
+
+    Parts are never rewritten: an existing part for the same capture
+    stamp and source is left as is and None is returned.
+    """
+    path = part_path(game_date, captured_at, source)
+
+    if path.exists() or not rows:
+        return None
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".parquet.tmp")
+
+    _history_frame(rows).to_parquet(tmp_path, index=False)
+    tmp_path.replace(path)
+
+    return path
+
+
+# =========================
+# READ / QUERY
+# =========================
+
+def _part_stamp(path):
+    try:
+        return datetime.strptime(
+            path.name.split("_", 1)[0],
+            STAMP_FORMAT,
+        ).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def load_history(dates=None, event_ids=None, until=None):
+    """
+    Loads history rows sorted by key and capture time.
+
+    dates limits the date directories read (YYYY_MM_DD or YYYY-MM-DD),
+    event_ids limits the events kept, and until skips parts captured
+    after that instant.
+    """
+    if dates is None:
+        date_dirs = sorted(p for p in HISTORY_DIR.glob("*") if p.is_dir())
+    else:
+        date_dirs = [
+            HISTORY_DIR / str(d).strip().replace("-", "_")
+            for d in dates
+        ]
+
+    cutoff = _utc(until) if until is not None else None
+    frames = []
+
+    for date_dir in date_dirs:
+        for path in sorted(date_dir.glob("*.parquet")):
+            stamp = _part_stamp(path)
+
+            if cutoff is not None and stamp is not None and stamp > cutoff:
+                continue
+
+            frame = pd.read_parquet(path)
+
+            if event_ids is not None:
+                frame = frame[frame["event_id"].isin([str(e) for e in event_ids])]
+
+            frames.append(frame)
+
+    if not frames:
+        return _history_frame([])
+
+    history = pd.concat(frames, ignore_index=True)
+
+    return history.sort_values(
+        KEY_COLUMNS + ["captured_at"],
+        kind="mergesort",
+    ).reset_index(drop=True)
+
+
+def _last_per_key(history):
+    return (
+        history
+        .sort_values(KEY_COLUMNS + ["captured_at"], kind="mergesort")
+        .groupby(KEY_COLUMNS, sort=True, observed=True)
+        .tail(1)
+        .reset_index(drop=True)
+    )
+
+
+def opening_prices(history):
+    """First captured price per (event, bookmaker, market, side)."""
+    return (
+        history
+        .sort_values(KEY_COLUMNS + ["captured_at"], kind="mergesort")
+        .groupby(KEY_COLUMNS, sort=True, observed=True)
+        .head(1)
+        .reset_index(drop=True)
+    )
+
+
+def prices_at(history, at):
+    """Last price captured at or before `at` per (event, bookmaker, market, side)."""
+    return _last_per_key(history[history["captured_at"] <= _utc(at)])
+
+
+def closing_prices(history):
+    """Last price captured at or before each event's first pitch."""
+    return _last_per_key(history[history["captured_at"] <= history["commence_time"]])
+
+
+# =========================
+# BACKFILL
+# =========================
+
+def _read_events(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    return loaded if isinstance(loaded, list) else None
+
+
+def _max_last_update(events):
+    values = [
+        bookmaker.get("last_update")
+        for event in events
+        if isinstance(event, dict)
+        for bookmaker in event.get("bookmakers") or []
+        if bookmaker.get("last_update")
+    ]
+
+    return max(values) if values else None
+
+
+def backfill():
+    """
+    Appends a part for every JSON dump not yet in the history.
+
+    odds/updates/{YYYY_MM_DD_HHMM}.json are stamped with their ET pull
+    time. odds/{YYYY_MM_DD}.json only keeps the last morning pull, so it
+    is stamped with the newest bookmaker last_update it contains.
+    """
+    written = 0
+    skipped = 0
+
+    for path in sorted((ODDS_DIR / "updates").glob("*.json")):
+        events = _read_events(path)
+
+        try:
+            captured_et = datetime.strptime(path.stem, "%Y_%m_%d_%H%M").replace(tzinfo=ET)
+        except ValueError:
+            events = None
+
+        if not events:
+            skipped += 1
+            continue
+
+        rows = flatten_converted_events(events, captured_et.astimezone(timezone.utc), "odds_mlb_update")
+
+        if append_snapshot(rows, path.stem[:10], captured_et, "odds_mlb_update"):
+            written += 1
+
+    for path in sorted(ODDS_DIR.glob("*.json")):
+        events = _read_events(path)
+        captured_at = _max_last_update(events) if events else None
+
+        if not events or captured_at is None:
+            skipped += 1
+            continue
+
+        rows = flatten_converted_events(events, captured_at, "mlb_odds_pull")
+
+        if append_snapshot(rows, path.stem, captured_at, "mlb_odds_pull"):
+            written += 1
+
+    print(f"odds_history backfill complete. parts_written={written} files_skipped={skipped}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("command", choices=["backfill"])
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.command == "backfill":
+        backfill()
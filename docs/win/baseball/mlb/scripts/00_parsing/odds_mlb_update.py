@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 # docs/win/baseball/mlb/scripts/00_parsing/odds_mlb_update.py
 
+import importlib.util
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
 import requests
+from requests.adapters import HTTPAdapter
+
+import odds_history
 
 
 API_KEY = os.getenv("API_ODDS")
@@ -27,6 +33,18 @@ BOOKMAKERS = [PRIMARY_BOOKMAKER, FALLBACK_BOOKMAKER]
 
 EVENT_STATUS = "pending"
 
+ODDS_BATCH_SIZE = 10
+
+FETCH_WORKERS = int(os.getenv("ODDS_FETCH_WORKERS", "4"))
+ODDS_MAX_REQUESTS_PER_SECOND = float(os.getenv("ODDS_MAX_REQUESTS_PER_SECOND", "5"))
+ODDS_QUOTA_RESERVE = int(os.getenv("ODDS_QUOTA_RESERVE", "50"))
+
+FETCH_MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 2.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+QUOTA_REMAINING_HEADERS = ["x-ratelimit-remaining", "x-requests-remaining"]
+
 ET = ZoneInfo("America/New_York")
 
 now_utc = datetime.now(timezone.utc)
@@ -46,19 +64,80 @@ UPDATE_PATH = UPDATES_DIR / f"{stamp}.json"
 LATEST_PATH = LATEST_DIR / f"{today}.json"
 
 
+REQUEST_LIMITER_SCRIPT = Path("docs/win/baseball/mlb/scripts/00_intake/request_limiter.py")
+
+
+def load_request_limiter():
+    spec = importlib.util.spec_from_file_location("mlb_request_limiter", REQUEST_LIMITER_SCRIPT)
+
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Could not load request limiter: {REQUEST_LIMITER_SCRIPT}")
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+request_limiter = load_request_limiter()
+
+ODDS_LIMITER = request_limiter.RequestRateLimiter(
+    ODDS_MAX_REQUESTS_PER_SECOND,
+    quota_headers=QUOTA_REMAINING_HEADERS,
+    quota_reserve=ODDS_QUOTA_RESERVE,
+)
+
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=max(FETCH_WORKERS, len(BOOKMAKERS))),
+)
+
+
+def retry_after_seconds(response):
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+
 def get_json(endpoint, params):
-    response = requests.get(
-        f"{BASE_URL}{endpoint}",
-        params=params,
-        timeout=30,
-    )
+    for attempt in range(1, FETCH_MAX_ATTEMPTS + 1):
+        try:
+            ODDS_LIMITER.wait()
+        except request_limiter.QuotaExhausted:
+            print(f"{endpoint} skipped: odds API request quota exhausted")
+            raise SystemExit(1)
 
-    if response.status_code != 200:
-        print(f"{endpoint} error: {response.status_code}")
-        print(response.text)
-        raise SystemExit(1)
+        delay = RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+
+        try:
+            response = SESSION.get(
+                f"{BASE_URL}{endpoint}",
+                params=params,
+                timeout=30,
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == FETCH_MAX_ATTEMPTS:
+                raise
+            reason = type(e).__name__
+        else:
+            if ODDS_LIMITER.record(response):
+                print(f"WARN odds API quota low: {ODDS_LIMITER.remaining} requests remaining")
+
+            if response.status_code == 200:
+                return response.json()
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt == FETCH_MAX_ATTEMPTS:
+                print(f"{endpoint} error: {response.status_code}")
+                print(response.text)
+                raise SystemExit(1)
 
-    return response.json()
+            reason = f"status={response.status_code}"
+            delay = retry_after_seconds(response) or delay
+
+        ODDS_LIMITER.record_retry()
+        print(f"{endpoint} {reason}, retry {attempt}/{FETCH_MAX_ATTEMPTS - 1} in {delay:.1f}s")
+        time.sleep(delay)
 
 
 def parse_event_utc_datetime(value):
@@ -143,8 +222,13 @@ def fetch_events():
     skipped_non_target = {}
     skipped_started = {}
 
+    with ThreadPoolExecutor(max_workers=len(BOOKMAKERS)) as executor:
+        events_by_bookmaker = dict(
+            zip(BOOKMAKERS, executor.map(fetch_events_for_bookmaker, BOOKMAKERS))
+        )
+
     for bookmaker in BOOKMAKERS:
-        events = fetch_events_for_bookmaker(bookmaker)
+        events = events_by_bookmaker[bookmaker]
         counts[bookmaker] = len(events)
         skipped_non_target[bookmaker] = 0
         skipped_started[bookmaker] = 0
@@ -178,35 +262,41 @@ def chunks(items, size):
         yield items[i:i + size]
 
 
-def fetch_odds_for_bookmaker(event_ids, bookmaker):
-    odds = []
+def fetch_odds_batch(job):
+    bookmaker, batch_ids = job
 
-    for batch_ids in chunks(event_ids, 10):
-        batch = get_json(
-            "/odds/multi",
-            {
-                "apiKey": API_KEY,
-                "eventIds": ",".join(str(event_id) for event_id in batch_ids),
-                "bookmakers": bookmaker,
-            },
-        )
-
-        if not isinstance(batch, list):
-            print(f"Unexpected /odds/multi response for {bookmaker}:")
-            print(json.dumps(batch, indent=2))
-            raise SystemExit(1)
+    batch = get_json(
+        "/odds/multi",
+        {
+            "apiKey": API_KEY,
+            "eventIds": ",".join(str(event_id) for event_id in batch_ids),
+            "bookmakers": bookmaker,
+        },
+    )
 
-        odds.extend(batch)
+    if not isinstance(batch, list):
+        print(f"Unexpected /odds/multi response for {bookmaker}:")
+        print(json.dumps(batch, indent=2))
+        raise SystemExit(1)
 
-    return odds
+    return batch
 
 
 def fetch_odds(event_ids):
     by_id = {}
 
-    for bookmaker in BOOKMAKERS:
-        bookmaker_odds = fetch_odds_for_bookmaker(event_ids, bookmaker)
+    # Every (bookmaker, batch) request goes out at once; results are read
+    # back in the same bookmaker and batch order as a sequential pull.
+    jobs = [
+        (bookmaker, batch_ids)
+        for bookmaker in BOOKMAKERS
+        for batch_ids in chunks(event_ids, ODDS_BATCH_SIZE)
+    ]
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        batches = list(executor.map(fetch_odds_batch, jobs))
 
+    for (bookmaker, _), bookmaker_odds in zip(jobs, batches):
         for event in bookmaker_odds:
             if not is_target_et_date(event):
                 continue
@@ -638,6 +728,38 @@ def convert_event(event_by_bookmaker, event_fallback):
     }, selected_bookmaker
 
 
+def append_history(raw_odds_by_id, events_by_id):
+    rows = []
+
+    for event_id_value, event_by_bookmaker in raw_odds_by_id.items():
+        event_fallback = events_by_id.get(event_id_value, {})
+
+        for bookmaker in BOOKMAKERS:
+            candidate_event = event_by_bookmaker.get(bookmaker)
+
+            if not candidate_event:
+                continue
+
+            rows.extend(
+                odds_history.flatten_markets(
+                    event_id_value,
+                    candidate_event.get("date") or event_fallback.get("date"),
+                    candidate_event.get("home") or event_fallback.get("home"),
+                    candidate_event.get("away") or event_fallback.get("away"),
+                    bookmaker,
+                    converted_markets_for_bookmaker(candidate_event, bookmaker),
+                    now_utc,
+                    "odds_mlb_update",
+                )
+            )
+
+    try:
+        return odds_history.append_snapshot(rows, today, now_utc, "odds_mlb_update"), len(rows)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"WARN odds history not written: {e}")
+        return None, len(rows)
+
+
 def read_json_list(path):
     if not path.exists():
         return []
@@ -818,6 +940,7 @@ events, event_counts, skipped_non_target_counts, skipped_started_counts = fetch_
 if not events:
     print("No pending MLB events found with DraftKings or FanDuel odds.")
     pulled_data = []
+    history_path, history_row_count = None, 0
     source_counts = {
         PRIMARY_BOOKMAKER: 0,
         FALLBACK_BOOKMAKER: 0,
@@ -848,6 +971,8 @@ else:
             pulled_data.append(converted)
             source_counts[source_bookmaker] = source_counts.get(source_bookmaker, 0) + 1
 
+    history_path, history_row_count = append_history(raw_odds_by_id, events_by_id)
+
 pulled_data = sort_events(pulled_data)
 
 seed_path, raw_seed_data, existing_latest_data, dropped_seed_non_target = choose_latest_seed()
@@ -899,3 +1024,7 @@ print(f"Preserved target-date events missing from this pull: {preserved_count}")
 print(f"Skipped updates to already-started existing events: {skipped_started_updates}")
 print(f"Skipped adding already-started pulled events: {skipped_started_adds}")
 print(f"Final latest event count: {len(latest_data)}")
+print(f"Odds history rows captured this pull: {history_row_count}")
+print(f"Odds history part: {history_path if history_path else 'not written'}")
+print(f"Odds API requests: {ODDS_LIMITER.requests} (retries {ODDS_LIMITER.retries}, workers {FETCH_WORKERS})")
+print(f"Odds API quota remaining: {ODDS_LIMITER.remaining if ODDS_LIMITER.remaining is not None else 'not reported'}")
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 # docs/win/baseball/mlb/scripts/01_merge/build_juice_files.py
 
+import argparse
 import glob
-import math
+import importlib.util
 import sys
 import traceback
 from datetime import UTC, datetime
@@ -19,6 +20,7 @@ OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 ERROR_DIR = Path("docs/win/baseball/mlb/errors/01_merge")
 ERROR_DIR.mkdir(parents=True, exist_ok=True)
 LOG_FILE = ERROR_DIR / "build_juice_files.txt"
+INTERCHANGE_SCRIPT = Path("docs/win/baseball/mlb/scripts/interchange.py")
 
 PROB_TOLERANCE = 1e-6
 
@@ -226,6 +228,19 @@ def _validate_run_projection(df, label):
         raise ValueError(f"{label} model_total_runs mismatch; sample={sample}")
 
 
+def load_interchange():
+    """Load the shared stage interchange helpers (scripts/interchange.py) once per process."""
+    module = sys.modules.get("mlb_interchange")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("mlb_interchange", INTERCHANGE_SCRIPT)
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"Could not load interchange helpers: {INTERCHANGE_SCRIPT}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["mlb_interchange"] = module
+    return module
+
+
 def write_csv_checked(df, out_path, market):
     validate_no_duplicate_columns(df, f"{out_path} output")
     if market == "moneyline":
@@ -240,60 +255,114 @@ def write_csv_checked(df, out_path, market):
     if legacy:
         raise ValueError(f"{out_path} contains obsolete official probability columns: {legacy}")
     df.to_csv(out_path, index=False)
+    load_interchange().write_columnar(df, out_path, warn=lambda msg: log(f"WARN {msg}"))
 
 
-def moneyline_probabilities(model_home_runs, model_away_runs):
-    p_home_raw = 1.0 - skellam.cdf(0, model_home_runs, model_away_runs)
-    p_away_raw = skellam.cdf(-1, model_home_runs, model_away_runs)
-    p_tie = skellam.pmf(0, model_home_runs, model_away_runs)
+# The *_probability_arrays helpers take aligned arrays (or scalars) of model
+# runs and lines and price every row in one vectorized scipy call; the scalar
+# helpers below are one-row views of the same engine.
+
+
+def _as_float_arrays(*values):
+    return np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in values))
+
+
+def _raise_bad_rows(bad, describe):
+    if not bad.any():
+        return
+    i = int(np.flatnonzero(bad)[0])
+    message = describe(i)
+    if bad.size > 1:
+        message = f"idx={i} bad_rows={int(bad.sum())}: {message}"
+    raise ValueError(message)
+
+
+def moneyline_probability_arrays(model_home_runs, model_away_runs):
+    home, away = _as_float_arrays(model_home_runs, model_away_runs)
+    p_home_raw = 1.0 - skellam.cdf(0, home, away)
+    p_away_raw = skellam.cdf(-1, home, away)
+    p_tie = skellam.pmf(0, home, away)
     resolved = p_home_raw + p_away_raw
-    if not np.isfinite(resolved) or resolved <= 0:
-        raise ValueError("invalid moneyline resolved probability mass")
+    _raise_bad_rows(
+        ~np.isfinite(resolved) | (resolved <= 0),
+        lambda i: "invalid moneyline resolved probability mass",
+    )
     return p_home_raw / resolved, p_away_raw / resolved, p_tie
 
 
-def run_line_probabilities(model_home_runs, model_away_runs, home_line, away_line):
-    if not np.isfinite(home_line) or not np.isfinite(away_line):
-        raise ValueError("missing run line")
-    if abs(home_line + away_line) > PROB_TOLERANCE:
-        raise ValueError(f"run lines are not complementary: home={home_line} away={away_line}")
-    if sorted([round(home_line, 6), round(away_line, 6)]) != [-1.5, 1.5]:
-        raise ValueError(f"unsupported run-line pair: home={home_line} away={away_line}")
-    threshold = math.floor(-home_line) + 1
-    p_home = 1.0 - skellam.cdf(threshold - 1, model_home_runs, model_away_runs)
+def run_line_probability_arrays(model_home_runs, model_away_runs, home_line, away_line):
+    home, away, home_line, away_line = _as_float_arrays(model_home_runs, model_away_runs, home_line, away_line)
+    _raise_bad_rows(~np.isfinite(home_line) | ~np.isfinite(away_line), lambda i: "missing run line")
+    _raise_bad_rows(
+        np.abs(home_line + away_line) > PROB_TOLERANCE,
+        lambda i: f"run lines are not complementary: home={home_line[i]} away={away_line[i]}",
+    )
+    rounded_home = np.round(home_line, 6)
+    rounded_away = np.round(away_line, 6)
+    _raise_bad_rows(
+        (np.minimum(rounded_home, rounded_away) != -1.5) | (np.maximum(rounded_home, rounded_away) != 1.5),
+        lambda i: f"unsupported run-line pair: home={home_line[i]} away={away_line[i]}",
+    )
+    threshold = np.floor(-home_line) + 1
+    p_home = 1.0 - skellam.cdf(threshold - 1, home, away)
     p_away = 1.0 - p_home
     return p_home, p_away
 
 
-def totals_probabilities(model_home_runs, model_away_runs, total_line):
-    if not np.isfinite(model_home_runs) or not np.isfinite(model_away_runs):
-        raise ValueError("missing model run projection")
-    if model_home_runs < 0 or model_away_runs < 0:
-        raise ValueError("negative model run projection")
-    if not np.isfinite(total_line):
-        raise ValueError("missing total line")
-
-    lambda_total = model_home_runs + model_away_runs
-    frac = abs(total_line - round(total_line))
-
-    if frac < 1e-9:
-        k = int(round(total_line))
-        p_under = poisson.cdf(k - 1, lambda_total)
-        p_push = poisson.pmf(k, lambda_total)
-        p_over = 1.0 - poisson.cdf(k, lambda_total)
-    elif abs(frac - 0.5) < 1e-9:
-        k = math.floor(total_line)
-        p_under = poisson.cdf(k, lambda_total)
-        p_push = 0.0
-        p_over = 1.0 - p_under
-    else:
-        raise ValueError(f"unsupported total line: {total_line}")
+def totals_probability_arrays(model_home_runs, model_away_runs, total_line):
+    home, away, total_line = _as_float_arrays(model_home_runs, model_away_runs, total_line)
+    _raise_bad_rows(~np.isfinite(home) | ~np.isfinite(away), lambda i: "missing model run projection")
+    _raise_bad_rows((home < 0) | (away < 0), lambda i: "negative model run projection")
+    _raise_bad_rows(~np.isfinite(total_line), lambda i: "missing total line")
 
+    lambda_total = home + away
+    frac = np.abs(total_line - np.round(total_line))
+    whole = frac < 1e-9
+    half = np.abs(frac - 0.5) < 1e-9
+    _raise_bad_rows(~(whole | half), lambda i: f"unsupported total line: {total_line[i]}")
+
+    # Whole lines: under = P(X < k), push = P(X = k). Half lines: under = P(X <= floor(line)), no push.
+    k = np.where(whole, np.round(total_line), np.floor(total_line))
+    p_under = np.where(whole, poisson.cdf(k - 1, lambda_total), poisson.cdf(k, lambda_total))
+    p_push = np.where(whole, poisson.pmf(k, lambda_total), 0.0)
+    p_over = np.where(whole, 1.0 - poisson.cdf(k, lambda_total), 1.0 - p_under)
     return p_over, p_under, p_push
 
 
+def market_probability_arrays(model_home_runs, model_away_runs, home_line, away_line, total_line):
+    """Moneyline, run-line and total probabilities for every row in one batched call."""
+    ml_home, ml_away, ml_tie = moneyline_probability_arrays(model_home_runs, model_away_runs)
+    rl_home, rl_away = run_line_probability_arrays(model_home_runs, model_away_runs, home_line, away_line)
+    total_over, total_under, total_push = totals_probability_arrays(model_home_runs, model_away_runs, total_line)
+    return {
+        "ml_home": ml_home,
+        "ml_away": ml_away,
+        "ml_tie": ml_tie,
+        "rl_home": rl_home,
+        "rl_away": rl_away,
+        "total_over": total_over,
+        "total_under": total_under,
+        "total_push": total_push,
+    }
+
+
+def moneyline_probabilities(model_home_runs, model_away_runs):
+    p_home, p_away, p_tie = moneyline_probability_arrays(model_home_runs, model_away_runs)
+    return p_home[0], p_away[0], p_tie[0]
+
+
+def run_line_probabilities(model_home_runs, model_away_runs, home_line, away_line):
+    p_home, p_away = run_line_probability_arrays(model_home_runs, model_away_runs, home_line, away_line)
+    return p_home[0], p_away[0]
+
+
+def totals_probabilities(model_home_runs, model_away_runs, total_line):
+    p_over, p_under, p_push = totals_probability_arrays(model_home_runs, model_away_runs, total_line)
+    return p_over[0], p_under[0], p_push[0]
+
+
 def _prepare(file_path, required_columns, numeric_cols):
-    df = pd.read_csv(file_path)
+    df = load_interchange().read_interchange(file_path)
     if df.empty:
         raise ValueError(f"{file_path} is empty")
     validate_schema(df, required_columns, str(file_path))
@@ -312,15 +381,10 @@ def process_moneyline(file_path, summary):
             "away_dk_moneyline_decimal", "home_dk_moneyline_decimal",
         ],
     )
-    home_probs, away_probs, ties = [], [], []
-    for i, r in df.iterrows():
-        try:
-            hp, ap, tp = moneyline_probabilities(r["model_home_runs"], r["model_away_runs"])
-        except Exception as e:
-            raise ValueError(f"{file_path} idx={i} moneyline probability failure: {e}") from e
-        home_probs.append(hp)
-        away_probs.append(ap)
-        ties.append(tp)
+    try:
+        home_probs, away_probs, ties = moneyline_probability_arrays(df["model_home_runs"], df["model_away_runs"])
+    except ValueError as e:
+        raise ValueError(f"{file_path} moneyline probability failure: {e}") from e
 
     ml = df.copy()
     ml["away_dk_decimal_moneyline"] = ml["away_dk_moneyline_american"].apply(american_to_decimal)
@@ -351,16 +415,12 @@ def process_run_line(file_path, summary):
             "away_dk_run_line_decimal", "home_dk_run_line_decimal",
         ],
     )
-    home_probs, away_probs = [], []
-    for i, r in df.iterrows():
-        try:
-            hp, ap = run_line_probabilities(
-                r["model_home_runs"], r["model_away_runs"], r["home_run_line"], r["away_run_line"]
-            )
-        except Exception as e:
-            raise ValueError(f"{file_path} idx={i} run-line probability failure: {e}") from e
-        home_probs.append(hp)
-        away_probs.append(ap)
+    try:
+        home_probs, away_probs = run_line_probability_arrays(
+            df["model_home_runs"], df["model_away_runs"], df["home_run_line"], df["away_run_line"]
+        )
+    except ValueError as e:
+        raise ValueError(f"{file_path} run-line probability failure: {e}") from e
 
     rl = df.copy()
     rl["home_dk_run_line_decimal"] = rl["home_dk_run_line_american"].apply(american_to_decimal)
@@ -390,28 +450,19 @@ def process_total(file_path, summary):
             "dk_total_over_decimal", "dk_total_under_decimal",
         ],
     )
-    over_win, over_loss, under_win, under_loss, pushes = [], [], [], [], []
-    for i, r in df.iterrows():
-        try:
-            p_over, p_under, p_push = totals_probabilities(
-                r["model_home_runs"], r["model_away_runs"], r["total"]
-            )
-        except Exception as e:
-            raise ValueError(f"{file_path} idx={i} total probability failure: {e}") from e
-        over_win.append(p_over)
-        over_loss.append(p_under)
-        under_win.append(p_under)
-        under_loss.append(p_over)
-        pushes.append(p_push)
+    try:
+        p_over, p_under, p_push = totals_probability_arrays(df["model_home_runs"], df["model_away_runs"], df["total"])
+    except ValueError as e:
+        raise ValueError(f"{file_path} total probability failure: {e}") from e
 
     tot = df.copy()
     tot["dk_total_over_decimal"] = tot["dk_total_over_american"].apply(american_to_decimal)
     tot["dk_total_under_decimal"] = tot["dk_total_under_american"].apply(american_to_decimal)
-    tot["over_model_prob_total_win"] = over_win
-    tot["over_model_prob_total_loss"] = over_loss
-    tot["under_model_prob_total_win"] = under_win
-    tot["under_model_prob_total_loss"] = under_loss
-    tot["total_model_prob_push"] = pushes
+    tot["over_model_prob_total_win"] = p_over
+    tot["over_model_prob_total_loss"] = p_under
+    tot["under_model_prob_total_win"] = p_under
+    tot["under_model_prob_total_loss"] = p_over
+    tot["total_model_prob_push"] = p_push
 
     # Push-aware fair decimal: 1 + (p_loss / p_win).
     # For half-run totals, p_push == 0 and this reduces to 1 / p_win.
@@ -434,7 +485,19 @@ def process_total(file_path, summary):
     summary["rows_written"] += len(tot)
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "dates",
+        nargs="*",
+        help="Optional date(s) to rebuild (YYYY_MM_DD or YYYY-MM-DD); omit to rebuild every slate.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    dates = sorted({value.strip().replace("-", "_") for value in parse_args(argv).dates})
+
     with open(LOG_FILE, "w", encoding="utf-8") as f:
         f.write(f"=== build_juice_files RUN {_now()} ===\n")
 
@@ -447,16 +510,25 @@ def main():
         "errors": 0,
     }
 
+    log(f"INTERCHANGE: {load_interchange().INTERCHANGE}")
     log("MODEL PROBABILITIES ARE PRICE-INDEPENDENT: sportsbook odds are not probability inputs")
 
-    for f in OUTPUT_DIR.glob("*.csv"):
-        f.unlink()
+    prefixes = dates or [""]
+    if dates:
+        log(f"Date-scoped rebuild: {dates}")
+
+    for prefix in prefixes:
+        for f in OUTPUT_DIR.glob(f"{prefix}*.csv"):
+            load_interchange().remove_output(f)
+
+    def slate_files(pattern):
+        return sorted(path for prefix in prefixes for path in glob.glob(str(INPUT_DIR / f"{prefix}{pattern}")))
 
     try:
         groups = [
-            ("moneyline", sorted(glob.glob(str(INPUT_DIR / "*_mlb_moneyline.csv"))), process_moneyline),
-            ("run_line", sorted(glob.glob(str(INPUT_DIR / "*_mlb_run_line.csv"))), process_run_line),
-            ("total", sorted(glob.glob(str(INPUT_DIR / "*_mlb_total.csv"))), process_total),
+            ("moneyline", slate_files("*_mlb_moneyline.csv"), process_moneyline),
+            ("run_line", slate_files("*_mlb_run_line.csv"), process_run_line),
+            ("total", slate_files("*_mlb_total.csv"), process_total),
         ]
         for market, files, processor in groups:
             log(f"{market} files: {len(files)}")
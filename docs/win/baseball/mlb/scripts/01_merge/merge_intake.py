@@ -19,10 +19,13 @@
 #       team_id -> canonical_team
 #       canonical_team -> team_id
 
+import argparse
 import csv
 import traceback
 import re
 import hashlib
+import importlib.util
+import sys
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -36,6 +39,7 @@ AUDIT_DIR = OUT_DIR / "audit"
 REJECTION_DIR = OUT_DIR / "rejections"
 
 TEAM_MAP_FILE = Path("docs/win/baseball/mlb/maps/team_map_mlb.csv")
+INTERCHANGE_SCRIPT = Path("docs/win/baseball/mlb/scripts/interchange.py")
 
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -198,6 +202,40 @@ def write_csv(path, header, rows):
     log(f"WROTE {path} ({len(rows)} rows)")
 
 
+def load_interchange():
+    """Load the shared stage interchange helpers (scripts/interchange.py) once per process."""
+    module = sys.modules.get("mlb_interchange")
+
+    if module is None:
+        spec = importlib.util.spec_from_file_location("mlb_interchange", INTERCHANGE_SCRIPT)
+
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"Could not load interchange helpers: {INTERCHANGE_SCRIPT}")
+
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["mlb_interchange"] = module
+
+    return module
+
+
+def write_columnar(csv_path):
+    """
+    Writes the Parquet twin of a just-written market CSV (parquet mode only).
+
+    The twin is the frame the next stage would get from pd.read_csv(csv_path),
+    so switching interchange modes never changes what downstream stages see.
+    """
+    parquet_path = load_interchange().write_columnar(
+        None,
+        csv_path,
+        warn=lambda msg: log(f"WARN: {msg}"),
+    )
+
+    if parquet_path is not None:
+        log(f"WROTE {parquet_path}")
+
+
 def write_dict_csv(path, fieldnames, rows):
     assert_no_duplicate_columns(fieldnames, f"{path} output")
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -214,24 +252,31 @@ def write_dict_csv(path, fieldnames, rows):
 # OLD OUTPUT CLEANUP
 # ─────────────────────────────────────────────
 
-def clear_old_outputs():
+def _date_csvs(folder, dates=None):
+    if dates is None:
+        return sorted([p for p in folder.glob("*.csv") if p.is_file()])
+    return sorted([p for date in dates for p in folder.glob(f"{date}_*.csv") if p.is_file()])
+
+
+def clear_old_outputs(dates=None):
     """
     Permanently deletes every root-level CSV in docs/win/baseball/mlb/01_merge before rebuilding.
+    When dates are given, only those slates' root-level CSVs are deleted.
 
     This intentionally does NOT delete files inside subfolders such as:
       docs/win/baseball/mlb/01_merge/01_merguiced/
       docs/win/baseball/mlb/01_merge/audit/
       docs/win/baseball/mlb/01_merge/rejections/
     """
-    old_files = sorted([p for p in OUT_DIR.glob("*.csv") if p.is_file()])
+    old_files = _date_csvs(OUT_DIR, dates)
     deleted = 0
 
     for old_file in old_files:
-        old_file.unlink()
+        load_interchange().remove_output(old_file)
         deleted += 1
         log(f"DELETED OLD ROOT MERGE OUTPUT: {old_file}")
 
-    remaining = sorted([p for p in OUT_DIR.glob("*.csv") if p.is_file()])
+    remaining = _date_csvs(OUT_DIR, dates)
 
     if remaining:
         remaining_text = ", ".join(str(p) for p in remaining)
@@ -240,14 +285,17 @@ def clear_old_outputs():
         )
 
     log(f"OLD ROOT MERGE CSV OUTPUTS PERMANENTLY DELETED: {deleted}")
-    log("CONFIRMED: docs/win/baseball/mlb/01_merge has zero root-level CSV files before rebuild")
+    if dates is None:
+        log("CONFIRMED: docs/win/baseball/mlb/01_merge has zero root-level CSV files before rebuild")
+    else:
+        log(f"CONFIRMED: zero root-level CSV files remain for dates {dates} before rebuild")
 
 
-def clear_old_audit_and_rejection_outputs():
+def clear_old_audit_and_rejection_outputs(dates=None):
     deleted = 0
 
     for folder in [AUDIT_DIR, REJECTION_DIR]:
-        for old_file in sorted([p for p in folder.glob("*.csv") if p.is_file()]):
+        for old_file in _date_csvs(folder, dates):
             old_file.unlink()
             deleted += 1
             log(f"DELETED OLD SUPPORT OUTPUT: {old_file}")
@@ -1239,9 +1287,15 @@ def process_date(date, summary, alias_map, team_id_to_canonical):
         "total_runs_over_prob", "total_runs_under_prob",
     ]
 
-    write_csv(OUT_DIR / f"{date}_mlb_moneyline.csv", base_ml_header + CONTEXT_COLS, ml_rows)
-    write_csv(OUT_DIR / f"{date}_mlb_run_line.csv", base_rl_header + CONTEXT_COLS, rl_rows)
-    write_csv(OUT_DIR / f"{date}_mlb_total.csv", base_tot_header + CONTEXT_COLS, tot_rows)
+    market_outputs = [
+        (OUT_DIR / f"{date}_mlb_moneyline.csv", base_ml_header, ml_rows),
+        (OUT_DIR / f"{date}_mlb_run_line.csv", base_rl_header, rl_rows),
+        (OUT_DIR / f"{date}_mlb_total.csv", base_tot_header, tot_rows),
+    ]
+
+    for out_path, header, rows in market_outputs:
+        write_csv(out_path, header + CONTEXT_COLS, rows)
+        write_columnar(out_path)
 
     summary["files_written"] += 3
     summary["slates_written"] += 1
@@ -1251,7 +1305,23 @@ def process_date(date, summary, alias_map, team_id_to_canonical):
 # MAIN
 # ─────────────────────────────────────────────
 
-if __name__ == "__main__":
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "dates",
+        nargs="*",
+        help=(
+            "Optional date(s) to rebuild (YYYY_MM_DD or YYYY-MM-DD). "
+            "Only those slates' outputs are replaced; omit to rebuild every slate."
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    only_dates = sorted({value.strip().replace("-", "_") for value in args.dates}) or None
+
     summary = {
         "slates_processed": 0,
         "slates_written": 0,
@@ -1270,12 +1340,15 @@ if __name__ == "__main__":
     }
 
     try:
-        clear_old_outputs()
-        clear_old_audit_and_rejection_outputs()
+        clear_old_outputs(only_dates)
+        clear_old_audit_and_rejection_outputs(only_dates)
 
         alias_map, team_id_to_canonical, _canonical_to_team_id = load_team_maps()
 
         pred_files = sorted(PRED_DIR.glob("*_MLB.csv"))
+        if only_dates is not None:
+            pred_files = [p for p in pred_files if p.stem.replace("_MLB", "") in only_dates]
+            log(f"Date-scoped rebuild: {only_dates}")
         log(f"Model projection files found: {len(pred_files)}")
 
         for file in pred_files:
@@ -1314,4 +1387,8 @@ if __name__ == "__main__":
     except Exception as e:
         log(f"FATAL ERROR: {e}\n{traceback.format_exc()}")
         log("STATUS: FAILED")
-        raise
\ No newline at end of file
+        raise
+
+
+if __name__ == "__main__":
+    main()
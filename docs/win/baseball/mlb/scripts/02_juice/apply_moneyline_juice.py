@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 # docs/win/baseball/mlb/scripts/02_juice/apply_moneyline_juice.py
 import glob
-import math
 import sys
 import traceback
 from datetime import datetime, UTC
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 INPUT_DIR = Path("docs/win/baseball/mlb/01_merge/01_merguiced")
@@ -197,25 +197,25 @@ def validate_stale_input(input_path: Path) -> None:
 
 
 def validate_normalized_pair(df: pd.DataFrame, left_col: str, right_col: str, label: str) -> int:
-    bad = 0
-    for idx, row in df.iterrows():
-        left = pd.to_numeric(pd.Series([row[left_col]]), errors="coerce").iloc[0]
-        right = pd.to_numeric(pd.Series([row[right_col]]), errors="coerce").iloc[0]
+    left = pd.to_numeric(df[left_col], errors="coerce").to_numpy(dtype=float)
+    right = pd.to_numeric(df[right_col], errors="coerce").to_numpy(dtype=float)
 
-        if pd.isna(left) and pd.isna(right):
-            continue
-
-        if pd.isna(left) or pd.isna(right):
-            bad += 1
-            _log(f"{label} row={idx} reason=incomplete_normalized_pair {left_col}={left} {right_col}={right}", "ERROR")
-            continue
+    incomplete = np.isnan(left) != np.isnan(right)
+    total = left + right
+    with np.errstate(invalid="ignore"):
+        invalid = ~np.isnan(left) & ~np.isnan(right) & (~np.isfinite(total) | (np.abs(total - 1.0) > NORMALIZATION_TOLERANCE))
 
-        total = float(left) + float(right)
-        if not math.isfinite(total) or abs(total - 1.0) > NORMALIZATION_TOLERANCE:
-            bad += 1
-            _log(f"{label} row={idx} reason=normalized_sum_invalid total={total}", "ERROR")
+    for i in np.flatnonzero(incomplete | invalid):
+        if incomplete[i]:
+            _log(
+                f"{label} row={df.index[i]} reason=incomplete_normalized_pair "
+                f"{left_col}={left[i]} {right_col}={right[i]}",
+                "ERROR",
+            )
+        else:
+            _log(f"{label} row={df.index[i]} reason=normalized_sum_invalid total={float(total[i])}", "ERROR")
 
-    return bad
+    return int((incomplete | invalid).sum())
 
 
 # =========================
@@ -261,163 +261,199 @@ def validate_juice_config(juice_df: pd.DataFrame) -> None:
 # JUICE LOOKUP
 # =========================
 
-def find_band_row(juice_df, american, fav_ud, venue):
-    band = juice_df[
-        (juice_df["band_min"] <= american) &
-        (american < juice_df["band_max"]) &
-        (juice_df["fav_ud"] == fav_ud) &
-        (juice_df["venue"] == venue)
-    ]
+def compile_band_index(juice_df: pd.DataFrame) -> dict:
+    """Map (fav_ud, venue) to band edges sorted by band_min for searchsorted lookup.
+
+    validate_juice_config guarantees bands within a key never overlap, so the
+    only band that can hold a price is the last one starting at or below it.
+    """
+    band_index = {}
+    for key, group in juice_df.groupby(["fav_ud", "venue"]):
+        group = group.sort_values("band_min")
+        band_index[key] = (
+            group["band_min"].to_numpy(dtype=float),
+            group["band_max"].to_numpy(dtype=float),
+            group["extra_juice"].to_numpy(dtype=float),
+        )
+    return band_index
 
-    if len(band) != 1:
-        return None
 
-    return float(band.iloc[0]["extra_juice"])
+def lookup_band_extras(band_index: dict, american, fav_ud, venue: str) -> np.ndarray:
+    american = np.asarray(american, dtype=float)
+    fav_ud = np.asarray(fav_ud, dtype=object)
+    extras = np.full(american.shape, np.nan)
+
+    for (band_fav_ud, band_venue), (band_min, band_max, extra_juice) in band_index.items():
+        if band_venue != venue:
+            continue
+        mask = fav_ud == band_fav_ud
+        if not mask.any():
+            continue
+        values = american[mask]
+        pos = np.searchsorted(band_min, values, side="right") - 1
+        hit = (pos >= 0) & (values < band_max[np.maximum(pos, 0)])
+        found = np.full(values.shape, np.nan)
+        found[hit] = extra_juice[pos[hit]]
+        extras[mask] = found
+
+    return extras
+
+
+def find_band_row(band_index, american, fav_ud, venue):
+    extra = lookup_band_extras(band_index, [american], [fav_ud], venue)[0]
+    return None if np.isnan(extra) else float(extra)
 
 
 # =========================
 # AUDIT
 # =========================
 
-def append_audit_rows(audit_rows: list, row: pd.Series, side: str, status: str, values: dict | None = None) -> None:
-    values = values or {}
-    audit_rows.append({
-        "date": row.get("game_date", pd.NA),
-        "game_id": row.get("game_id", pd.NA),
+def build_audit_frame(df: pd.DataFrame, status: np.ndarray, values: dict) -> pd.DataFrame:
+    """Two audit rows per game (home then away); ``values`` maps column -> (home, away) arrays."""
+    rows = len(df)
+
+    def interleave(column):
+        home, away = values.get(column, (np.full(rows, np.nan), np.full(rows, np.nan)))
+        return np.column_stack([home, away]).reshape(-1)
+
+    return pd.DataFrame({
+        "date": np.repeat(df["game_date"].to_numpy(), 2),
+        "game_id": np.repeat(df["game_id"].to_numpy(), 2),
         "market": "moneyline",
-        "side": side,
-        "dk_american": values.get("dk_american", pd.NA),
-        "dk_decimal": values.get("dk_decimal", pd.NA),
-        "fair_decimal": values.get("fair_decimal", pd.NA),
-        "juiced_decimal": values.get("juiced_decimal", pd.NA),
-        "juiced_prob": values.get("juiced_prob", pd.NA),
-        "normalized_prob": values.get("normalized_prob", pd.NA),
-        "status": status,
-    })
+        "side": np.tile(["home", "away"], rows),
+        "dk_american": interleave("dk_american"),
+        "dk_decimal": interleave("dk_decimal"),
+        "fair_decimal": interleave("fair_decimal"),
+        "juiced_decimal": interleave("juiced_decimal"),
+        "juiced_prob": interleave("juiced_prob"),
+        "normalized_prob": interleave("normalized_prob"),
+        "status": np.repeat(status, 2),
+    }, columns=AUDIT_COLUMNS)
 
 
 # =========================
-# ROW PROCESSOR
+# SLATE PROCESSOR
 # =========================
 
-def process_row(df, juice_df, idx, row, audit_rows):
-    missing_dk = False
-    for col in DK_ODDS_COLUMNS:
-        if pd.isna(row[col]):
-            missing_dk = True
+def parse_numeric_columns(df, columns):
+    """Coerce ``columns`` to float rows; also flag rows with a cell that is present but not a number."""
+    raw = df[columns]
+    parsed = raw.apply(pd.to_numeric, errors="coerce")
+    unparseable = (raw.notna() & parsed.isna()).any(axis=1).to_numpy()
+    return parsed.to_numpy(dtype=float).T, unparseable
+
+
+def process_frame(df, band_index):
+    """Juice every row of a slate in one vectorized pass.
+
+    Rows fall through the same checks, in the same order, as the old per-row
+    processor; returns the juiced frame, its audit rows and a per-row result
+    of "ok", "bad" or "noband".
+    """
+    rows = len(df)
+    (
+        home_american, away_american, home_dk_decimal, away_dk_decimal, home_fair, away_fair,
+    ), unparseable = parse_numeric_columns(df, DK_ODDS_COLUMNS + [
+        "home_fair_decimal_moneyline",
+        "away_fair_decimal_moneyline",
+    ])
+
+    status = np.full(rows, "juiced", dtype=object)
+    result = np.full(rows, "ok", dtype=object)
+    reasons = {}
+    pending = np.ones(rows, dtype=bool)
+
+    def settle(mask, row_status, row_result, reason):
+        hit = pending & mask
+        for i in np.flatnonzero(hit):
+            reasons[i] = reason(i)
+        status[hit] = row_status
+        result[hit] = row_result
+        pending[hit] = False
+
+    settle(
+        df[DK_ODDS_COLUMNS].isna().any(axis=1).to_numpy(),
+        "missing_dk_odds", "bad", lambda i: "reason=missing_dk_odds",
+    )
+    settle(unparseable, "bad_parse", "bad", lambda i: "reason=conversion_failed")
+
+    numeric_labels = ["home_american", "away_american", "home_dk_decimal", "away_dk_decimal", "home_fair", "away_fair"]
+    numeric = np.vstack([home_american, away_american, home_dk_decimal, away_dk_decimal, home_fair, away_fair])
+    nonfinite = ~np.isfinite(numeric)
+    first_nonfinite = nonfinite.argmax(axis=0)
+    settle(
+        nonfinite.any(axis=0), "invalid_numeric", "bad",
+        lambda i: f"reason=invalid_numeric {numeric_labels[first_nonfinite[i]]}={float(numeric[first_nonfinite[i], i])}",
+    )
 
-    if missing_dk:
-        append_audit_rows(audit_rows, row, "home", "missing_dk_odds")
-        append_audit_rows(audit_rows, row, "away", "missing_dk_odds")
-        _log(f"row={idx} reason=missing_dk_odds", "SKIP")
-        return df, "bad"
+    with np.errstate(invalid="ignore"):
+        settle(
+            (home_fair <= 1) | (away_fair <= 1) | (home_dk_decimal <= 1) | (away_dk_decimal <= 1),
+            "invalid_decimal", "bad", lambda i: "reason=invalid_decimal",
+        )
 
-    try:
-        home_american = float(row["home_dk_moneyline_american"])
-        away_american = float(row["away_dk_moneyline_american"])
-        home_dk_decimal = float(row["home_dk_moneyline_decimal"])
-        away_dk_decimal = float(row["away_dk_moneyline_decimal"])
-        home_fair = float(row["home_fair_decimal_moneyline"])
-        away_fair = float(row["away_fair_decimal_moneyline"])
-    except Exception:
-        append_audit_rows(audit_rows, row, "home", "bad_parse")
-        append_audit_rows(audit_rows, row, "away", "bad_parse")
-        _log(f"row={idx} reason=conversion_failed", "SKIP")
-        return df, "bad"
-
-    for label, value in [
-        ("home_american", home_american),
-        ("away_american", away_american),
-        ("home_dk_decimal", home_dk_decimal),
-        ("away_dk_decimal", away_dk_decimal),
-        ("home_fair", home_fair),
-        ("away_fair", away_fair),
-    ]:
-        if not math.isfinite(value):
-            append_audit_rows(audit_rows, row, "home", "invalid_numeric")
-            append_audit_rows(audit_rows, row, "away", "invalid_numeric")
-            _log(f"row={idx} reason=invalid_numeric {label}={value}", "SKIP")
-            return df, "bad"
-
-    if home_fair <= 1 or away_fair <= 1 or home_dk_decimal <= 1 or away_dk_decimal <= 1:
-        append_audit_rows(audit_rows, row, "home", "invalid_decimal")
-        append_audit_rows(audit_rows, row, "away", "invalid_decimal")
-        _log(f"row={idx} reason=invalid_decimal", "SKIP")
-        return df, "bad"
-
-    home_fav_ud = "favorite" if home_american < 0 else "underdog"
-    away_fav_ud = "favorite" if away_american < 0 else "underdog"
-
-    home_extra = find_band_row(juice_df, home_american, home_fav_ud, "home")
-    away_extra = find_band_row(juice_df, away_american, away_fav_ud, "away")
-
-    if home_extra is None or away_extra is None:
-        append_audit_rows(audit_rows, row, "home", "missing_band", {
-            "dk_american": home_american,
-            "dk_decimal": home_dk_decimal,
-            "fair_decimal": home_fair,
-        })
-        append_audit_rows(audit_rows, row, "away", "missing_band", {
-            "dk_american": away_american,
-            "dk_decimal": away_dk_decimal,
-            "fair_decimal": away_fair,
-        })
-        _log(f"row={idx} reason=band_lookup_failed home={home_american} away={away_american}", "SKIP")
-        return df, "noband"
-
-    home_juiced_decimal = home_fair * (1 - home_extra)
-    away_juiced_decimal = away_fair * (1 - away_extra)
-
-    if not math.isfinite(home_juiced_decimal) or not math.isfinite(away_juiced_decimal):
-        append_audit_rows(audit_rows, row, "home", "invalid_juiced_decimal")
-        append_audit_rows(audit_rows, row, "away", "invalid_juiced_decimal")
-        _log(f"row={idx} reason=nonfinite_juiced_decimal home={home_juiced_decimal} away={away_juiced_decimal}", "SKIP")
-        return df, "bad"
-
-    if home_juiced_decimal <= 1 or away_juiced_decimal <= 1:
-        append_audit_rows(audit_rows, row, "home", "invalid_juiced_decimal")
-        append_audit_rows(audit_rows, row, "away", "invalid_juiced_decimal")
-        _log(f"row={idx} reason=invalid_juiced_decimal home={home_juiced_decimal} away={away_juiced_decimal}", "SKIP")
-        return df, "bad"
-
-    home_juiced_prob = 1 / home_juiced_decimal
-    away_juiced_prob = 1 / away_juiced_decimal
-    total = home_juiced_prob + away_juiced_prob
-
-    if not math.isfinite(total) or total <= 0:
-        append_audit_rows(audit_rows, row, "home", "invalid_normalization_total")
-        append_audit_rows(audit_rows, row, "away", "invalid_normalization_total")
-        _log(f"row={idx} reason=invalid_normalization_total val={total}", "SKIP")
-        return df, "bad"
-
-    home_normalized = home_juiced_prob / total
-    away_normalized = away_juiced_prob / total
-
-    df.at[idx, "home_juiced_decimal_moneyline"] = home_juiced_decimal
-    df.at[idx, "away_juiced_decimal_moneyline"] = away_juiced_decimal
-    df.at[idx, "home_juiced_prob_moneyline"] = home_juiced_prob
-    df.at[idx, "away_juiced_prob_moneyline"] = away_juiced_prob
-    df.at[idx, "home_normalized_prob_moneyline"] = home_normalized
-    df.at[idx, "away_normalized_prob_moneyline"] = away_normalized
-
-    append_audit_rows(audit_rows, row, "home", "juiced", {
-        "dk_american": home_american,
-        "dk_decimal": home_dk_decimal,
-        "fair_decimal": home_fair,
-        "juiced_decimal": home_juiced_decimal,
-        "juiced_prob": home_juiced_prob,
-        "normalized_prob": home_normalized,
-    })
-    append_audit_rows(audit_rows, row, "away", "juiced", {
-        "dk_american": away_american,
-        "dk_decimal": away_dk_decimal,
-        "fair_decimal": away_fair,
-        "juiced_decimal": away_juiced_decimal,
-        "juiced_prob": away_juiced_prob,
-        "normalized_prob": away_normalized,
+        home_extra = lookup_band_extras(band_index, home_american, np.where(home_american < 0, "favorite", "underdog"), "home")
+        away_extra = lookup_band_extras(band_index, away_american, np.where(away_american < 0, "favorite", "underdog"), "away")
+        no_band = pending & (np.isnan(home_extra) | np.isnan(away_extra))
+        settle(
+            no_band, "missing_band", "noband",
+            lambda i: f"reason=band_lookup_failed home={float(home_american[i])} away={float(away_american[i])}",
+        )
+
+        home_juiced_decimal = home_fair * (1 - home_extra)
+        away_juiced_decimal = away_fair * (1 - away_extra)
+        settle(
+            ~np.isfinite(home_juiced_decimal) | ~np.isfinite(away_juiced_decimal), "invalid_juiced_decimal", "bad",
+            lambda i: (
+                f"reason=nonfinite_juiced_decimal home={float(home_juiced_decimal[i])} "
+                f"away={float(away_juiced_decimal[i])}"
+            ),
+        )
+        settle(
+            (home_juiced_decimal <= 1) | (away_juiced_decimal <= 1), "invalid_juiced_decimal", "bad",
+            lambda i: (
+                f"reason=invalid_juiced_decimal home={float(home_juiced_decimal[i])} "
+                f"away={float(away_juiced_decimal[i])}"
+            ),
+        )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        home_juiced_prob = 1 / home_juiced_decimal
+        away_juiced_prob = 1 / away_juiced_decimal
+        total = home_juiced_prob + away_juiced_prob
+        settle(
+            ~np.isfinite(total) | (total <= 0), "invalid_normalization_total", "bad",
+            lambda i: f"reason=invalid_normalization_total val={float(total[i])}",
+        )
+        home_normalized = home_juiced_prob / total
+        away_normalized = away_juiced_prob / total
+
+    for i in sorted(reasons):
+        _log(f"row={df.index[i]} {reasons[i]}", "SKIP")
+
+    juiced = result == "ok"
+    priced = juiced | (status == "missing_band")
+
+    def keep(mask, values):
+        return np.where(mask, values, np.nan)
+
+    df["home_juiced_decimal_moneyline"] = keep(juiced, home_juiced_decimal)
+    df["away_juiced_decimal_moneyline"] = keep(juiced, away_juiced_decimal)
+    df["home_juiced_prob_moneyline"] = keep(juiced, home_juiced_prob)
+    df["away_juiced_prob_moneyline"] = keep(juiced, away_juiced_prob)
+    df["home_normalized_prob_moneyline"] = keep(juiced, home_normalized)
+    df["away_normalized_prob_moneyline"] = keep(juiced, away_normalized)
+
+    audit = build_audit_frame(df, status, {
+        "dk_american": (keep(priced, home_american), keep(priced, away_american)),
+        "dk_decimal": (keep(priced, home_dk_decimal), keep(priced, away_dk_decimal)),
+        "fair_decimal": (keep(priced, home_fair), keep(priced, away_fair)),
+        "juiced_decimal": (keep(juiced, home_juiced_decimal), keep(juiced, away_juiced_decimal)),
+        "juiced_prob": (keep(juiced, home_juiced_prob), keep(juiced, away_juiced_prob)),
+        "normalized_prob": (keep(juiced, home_normalized), keep(juiced, away_normalized)),
     })
 
-    return df, "ok"
+    return df, audit, result
 
 
 # =========================
@@ -445,7 +481,7 @@ def main():
     }
 
     per_file = []
-    audit_rows = []
+    audit_frames = []
 
     for f in OUTPUT_DIR.glob("*moneyline.csv"):
         f.unlink()
@@ -464,6 +500,7 @@ def main():
         juice_df["fav_ud"] = juice_df["fav_ud"].astype(str).str.strip().str.lower()
         juice_df["venue"] = juice_df["venue"].astype(str).str.strip().str.lower()
         validate_juice_config(juice_df)
+        band_index = compile_band_index(juice_df)
 
         files = sorted(glob.glob(str(INPUT_DIR / "*_mlb_moneyline.csv")))
         summary["files_found"] = len(files)
@@ -528,15 +565,12 @@ def main():
                 summary["missing_away_moneyline_dk"] += pf["missing_away_moneyline_dk"]
                 summary["missing_any_moneyline_dk"] += pf["missing_any_moneyline_dk"]
 
-                for idx, row in df.iterrows():
-                    df, result = process_row(df, juice_df, idx, row, audit_rows)
+                df, audit, result = process_frame(df, band_index)
+                audit_frames.append(audit)
 
-                    if result == "ok":
-                        pf["applied"] += 1
-                    elif result == "noband":
-                        pf["skipped_noband"] += 1
-                    else:
-                        pf["skipped_bad"] += 1
+                pf["applied"] = int((result == "ok").sum())
+                pf["skipped_noband"] = int((result == "noband").sum())
+                pf["skipped_bad"] = int((result == "bad").sum())
 
                 norm_bad = validate_normalized_pair(
                     df,
@@ -583,7 +617,8 @@ def main():
         sys.exit(1)
 
     audit_path = AUDIT_DIR / "moneyline_post_juice_audit.csv"
-    pd.DataFrame(audit_rows, columns=AUDIT_COLUMNS).to_csv(audit_path, index=False)
+    audit_df = pd.concat(audit_frames, ignore_index=True) if audit_frames else pd.DataFrame(columns=AUDIT_COLUMNS)
+    audit_df.to_csv(audit_path, index=False)
     _log(f"WROTE AUDIT: {audit_path}")
 
     _write_summary(summary, per_file)
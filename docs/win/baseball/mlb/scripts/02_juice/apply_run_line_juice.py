@@ -2,12 +2,12 @@
 # docs/win/baseball/mlb/scripts/02_juice/apply_run_line_juice.py
 
 import glob
-import math
 import sys
 import traceback
 from datetime import datetime, UTC
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 INPUT_DIR = Path("docs/win/baseball/mlb/01_merge/01_merguiced")
@@ -221,25 +221,26 @@ def validate_stale_input(input_path: Path) -> None:
 
 
 def validate_normalized_pair(df: pd.DataFrame, left_col: str, right_col: str, label: str) -> int:
-    bad = 0
-    for idx, row in df.iterrows():
-        left = pd.to_numeric(pd.Series([row[left_col]]), errors="coerce").iloc[0]
-        right = pd.to_numeric(pd.Series([row[right_col]]), errors="coerce").iloc[0]
+    left = pd.to_numeric(df[left_col], errors="coerce").to_numpy(dtype=float)
+    right = pd.to_numeric(df[right_col], errors="coerce").to_numpy(dtype=float)
 
-        if pd.isna(left) and pd.isna(right):
-            continue
+    incomplete = np.isnan(left) != np.isnan(right)
+    total = left + right
+    with np.errstate(invalid="ignore"):
+        invalid = ~np.isnan(left) & ~np.isnan(right) & (~np.isfinite(total) | (np.abs(total - 1.0) > NORMALIZATION_TOLERANCE))
 
-        if pd.isna(left) or pd.isna(right):
-            bad += 1
-            _log(f"{label} row={idx} reason=incomplete_normalized_pair {left_col}={left} {right_col}={right}", "ERROR")
-            continue
+    for i in np.flatnonzero(incomplete | invalid):
+        if incomplete[i]:
+            _log(
+                f"{label} row={df.index[i]} reason=incomplete_normalized_pair "
+                f"{left_col}={left[i]} {right_col}={right[i]}",
+                "ERROR",
+            )
+        else:
+            _log(f"{label} row={df.index[i]} reason=normalized_sum_invalid total={float(total[i])}", "ERROR")
 
-        total = float(left) + float(right)
-        if not math.isfinite(total) or abs(total - 1.0) > NORMALIZATION_TOLERANCE:
-            bad += 1
-            _log(f"{label} row={idx} reason=normalized_sum_invalid total={total}", "ERROR")
+    return int((incomplete | invalid).sum())
 
-    return bad
 
 
 # =========================
@@ -285,146 +286,182 @@ def validate_juice_config(juice_df: pd.DataFrame) -> None:
 # JUICE LOOKUP
 # =========================
 
-def find_band(juice_df, odds, venue, fav_ud):
-    band = juice_df[
-        (juice_df["band_min"] <= odds) &
-        (odds < juice_df["band_max"]) &
-        (juice_df["venue"] == venue) &
-        (juice_df["fav_ud"] == fav_ud)
-    ]
+def compile_band_index(juice_df: pd.DataFrame) -> dict:
+    """Map (venue, fav_ud) to band edges sorted by band_min for searchsorted lookup.
+
+    validate_juice_config guarantees bands within a key never overlap, so the
+    only band that can hold a price is the last one starting at or below it.
+    """
+    band_index = {}
+    for key, group in juice_df.groupby(["venue", "fav_ud"]):
+        group = group.sort_values("band_min")
+        band_index[key] = (
+            group["band_min"].to_numpy(dtype=float),
+            group["band_max"].to_numpy(dtype=float),
+            group["extra_juice"].to_numpy(dtype=float),
+        )
+    return band_index
+
+
+def lookup_band_extras(band_index: dict, odds, venue: str, fav_ud) -> np.ndarray:
+    odds = np.asarray(odds, dtype=float)
+    fav_ud = np.asarray(fav_ud, dtype=object)
+    extras = np.full(odds.shape, np.nan)
+
+    for (band_venue, band_fav_ud), (band_min, band_max, extra_juice) in band_index.items():
+        if band_venue != venue:
+            continue
+        mask = fav_ud == band_fav_ud
+        if not mask.any():
+            continue
+        values = odds[mask]
+        pos = np.searchsorted(band_min, values, side="right") - 1
+        hit = (pos >= 0) & (values < band_max[np.maximum(pos, 0)])
+        found = np.full(values.shape, np.nan)
+        found[hit] = extra_juice[pos[hit]]
+        extras[mask] = found
 
-    if len(band) != 1:
-        return None
+    return extras
 
-    return float(band.iloc[0]["extra_juice"])
+
+def find_band(band_index, odds, venue, fav_ud):
+    extra = lookup_band_extras(band_index, [odds], venue, [fav_ud])[0]
+    return None if np.isnan(extra) else float(extra)
 
 
 # =========================
 # AUDIT
 # =========================
 
-def append_audit_rows(audit_rows: list, row: pd.Series, side: str, status: str, values: dict | None = None) -> None:
-    values = values or {}
-    audit_rows.append({
-        "date": row.get("game_date", pd.NA),
-        "game_id": row.get("game_id", pd.NA),
+def build_audit_frame(df: pd.DataFrame, status: np.ndarray, values: dict) -> pd.DataFrame:
+    """Two audit rows per game (home then away); ``values`` maps column -> (home, away) arrays."""
+    rows = len(df)
+
+    def interleave(column):
+        home, away = values.get(column, (np.full(rows, np.nan), np.full(rows, np.nan)))
+        return np.column_stack([home, away]).reshape(-1)
+
+    return pd.DataFrame({
+        "date": np.repeat(df["game_date"].to_numpy(), 2),
+        "game_id": np.repeat(df["game_id"].to_numpy(), 2),
         "market": "run_line",
-        "side": side,
-        "dk_american": values.get("dk_american", pd.NA),
-        "dk_decimal": values.get("dk_decimal", pd.NA),
-        "fair_decimal": values.get("fair_decimal", pd.NA),
-        "juiced_decimal": values.get("juiced_decimal", pd.NA),
-        "juiced_prob": values.get("juiced_prob", pd.NA),
-        "normalized_prob": values.get("normalized_prob", pd.NA),
-        "status": status,
-    })
+        "side": np.tile(["home", "away"], rows),
+        "dk_american": interleave("dk_american"),
+        "dk_decimal": interleave("dk_decimal"),
+        "fair_decimal": interleave("fair_decimal"),
+        "juiced_decimal": interleave("juiced_decimal"),
+        "juiced_prob": interleave("juiced_prob"),
+        "normalized_prob": interleave("normalized_prob"),
+        "status": np.repeat(status, 2),
+    }, columns=AUDIT_COLUMNS)
 
 
 # =========================
-# ROW PROCESSOR
+# SLATE PROCESSOR
 # =========================
 
-def process_row(df, juice_df, idx, row, audit_rows):
-    missing_dk = False
-    for col in DK_ODDS_COLUMNS:
-        if pd.isna(row[col]):
-            missing_dk = True
+def parse_numeric_columns(df, columns):
+    """Coerce ``columns`` to float rows; also flag rows with a cell that is present but not a number."""
+    raw = df[columns]
+    parsed = raw.apply(pd.to_numeric, errors="coerce")
+    unparseable = (raw.notna() & parsed.isna()).any(axis=1).to_numpy()
+    return parsed.to_numpy(dtype=float).T, unparseable
+
+
+def process_frame(df, band_index):
+    """Juice every row of a slate in one vectorized pass.
+
+    Rows fall through the same checks, in the same order, as the old per-row
+    processor; returns the juiced frame, its audit rows and a per-row result
+    of "ok", "bad" or "noband".
+    """
+    rows = len(df)
+    (
+        home_base, away_base, home_odds, away_odds, home_dk_decimal, away_dk_decimal,
+    ), unparseable = parse_numeric_columns(df, [
+        "home_prob_run_line",
+        "away_prob_run_line",
+        "home_dk_run_line_american",
+        "away_dk_run_line_american",
+        "home_dk_run_line_decimal",
+        "away_dk_run_line_decimal",
+    ])
+
+    status = np.full(rows, "juiced", dtype=object)
+    result = np.full(rows, "ok", dtype=object)
+    reasons = {}
+    pending = np.ones(rows, dtype=bool)
+
+    def settle(mask, row_status, row_result, reason):
+        hit = pending & mask
+        for i in np.flatnonzero(hit):
+            reasons[i] = reason(i)
+        status[hit] = row_status
+        result[hit] = row_result
+        pending[hit] = False
+
+    settle(
+        df[DK_ODDS_COLUMNS].isna().any(axis=1).to_numpy(),
+        "missing_dk_odds", "bad", lambda i: "reason=missing_dk_odds",
+    )
+    settle(unparseable, "bad_parse", "bad", lambda i: "reason=conversion_failed")
+
+    numeric_labels = ["home_base", "away_base", "home_odds", "away_odds", "home_dk_decimal", "away_dk_decimal"]
+    numeric = np.vstack([home_base, away_base, home_odds, away_odds, home_dk_decimal, away_dk_decimal])
+    nonfinite = ~np.isfinite(numeric)
+    first_nonfinite = nonfinite.argmax(axis=0)
+    settle(
+        nonfinite.any(axis=0), "invalid_numeric", "bad",
+        lambda i: f"reason=invalid_numeric {numeric_labels[first_nonfinite[i]]}={float(numeric[first_nonfinite[i], i])}",
+    )
 
-    if missing_dk:
-        append_audit_rows(audit_rows, row, "home", "missing_dk_odds")
-        append_audit_rows(audit_rows, row, "away", "missing_dk_odds")
-        _log(f"row={idx} reason=missing_dk_odds", "SKIP")
-        return df, "bad"
+    with np.errstate(invalid="ignore"):
+        settle(
+            (home_base < 0) | (away_base < 0) | (home_dk_decimal <= 1) | (away_dk_decimal <= 1),
+            "invalid_decimal", "bad", lambda i: "reason=invalid_run_line_inputs",
+        )
 
-    try:
-        home_base = float(row["home_prob_run_line"])
-        away_base = float(row["away_prob_run_line"])
-        home_odds = float(row["home_dk_run_line_american"])
-        away_odds = float(row["away_dk_run_line_american"])
-        home_dk_decimal = float(row["home_dk_run_line_decimal"])
-        away_dk_decimal = float(row["away_dk_run_line_decimal"])
-    except Exception:
-        append_audit_rows(audit_rows, row, "home", "bad_parse")
-        append_audit_rows(audit_rows, row, "away", "bad_parse")
-        _log(f"row={idx} reason=conversion_failed", "SKIP")
-        return df, "bad"
-
-    for label, value in [
-        ("home_base", home_base),
-        ("away_base", away_base),
-        ("home_odds", home_odds),
-        ("away_odds", away_odds),
-        ("home_dk_decimal", home_dk_decimal),
-        ("away_dk_decimal", away_dk_decimal),
-    ]:
-        if not math.isfinite(value):
-            append_audit_rows(audit_rows, row, "home", "invalid_numeric")
-            append_audit_rows(audit_rows, row, "away", "invalid_numeric")
-            _log(f"row={idx} reason=invalid_numeric {label}={value}", "SKIP")
-            return df, "bad"
-
-    if home_base < 0 or away_base < 0 or home_dk_decimal <= 1 or away_dk_decimal <= 1:
-        append_audit_rows(audit_rows, row, "home", "invalid_decimal")
-        append_audit_rows(audit_rows, row, "away", "invalid_decimal")
-        _log(f"row={idx} reason=invalid_run_line_inputs", "SKIP")
-        return df, "bad"
-
-    home_type = "favorite" if home_odds < 0 else "underdog"
-    away_type = "favorite" if away_odds < 0 else "underdog"
-
-    home_extra = find_band(juice_df, home_odds, "home", home_type)
-    away_extra = find_band(juice_df, away_odds, "away", away_type)
-
-    if home_extra is None or away_extra is None:
-        append_audit_rows(audit_rows, row, "home", "missing_band", {
-            "dk_american": home_odds,
-            "dk_decimal": home_dk_decimal,
-            "fair_decimal": pd.NA,
-        })
-        append_audit_rows(audit_rows, row, "away", "missing_band", {
-            "dk_american": away_odds,
-            "dk_decimal": away_dk_decimal,
-            "fair_decimal": pd.NA,
-        })
-        _log(f"row={idx} reason=no_band home_odds={home_odds} away_odds={away_odds}", "SKIP")
-        return df, "noband"
-
-    home_juiced_prob = max(min(home_base + home_extra, 0.95), 0.01)
-    away_juiced_prob = max(min(away_base + away_extra, 0.95), 0.01)
-    total = home_juiced_prob + away_juiced_prob
-
-    if not math.isfinite(total) or total <= 0:
-        append_audit_rows(audit_rows, row, "home", "invalid_normalization_total")
-        append_audit_rows(audit_rows, row, "away", "invalid_normalization_total")
-        _log(f"row={idx} reason=invalid_normalization_total total={total}", "SKIP")
-        return df, "bad"
-
-    home_normalized = home_juiced_prob / total
-    away_normalized = away_juiced_prob / total
-
-    df.at[idx, "home_juiced_prob_run_line"] = home_juiced_prob
-    df.at[idx, "away_juiced_prob_run_line"] = away_juiced_prob
-    df.at[idx, "home_normalized_prob_run_line"] = home_normalized
-    df.at[idx, "away_normalized_prob_run_line"] = away_normalized
-
-    append_audit_rows(audit_rows, row, "home", "juiced", {
-        "dk_american": home_odds,
-        "dk_decimal": home_dk_decimal,
-        "fair_decimal": pd.NA,
-        "juiced_decimal": pd.NA,
-        "juiced_prob": home_juiced_prob,
-        "normalized_prob": home_normalized,
-    })
-    append_audit_rows(audit_rows, row, "away", "juiced", {
-        "dk_american": away_odds,
-        "dk_decimal": away_dk_decimal,
-        "fair_decimal": pd.NA,
-        "juiced_decimal": pd.NA,
-        "juiced_prob": away_juiced_prob,
-        "normalized_prob": away_normalized,
+        home_extra = lookup_band_extras(band_index, home_odds, "home", np.where(home_odds < 0, "favorite", "underdog"))
+        away_extra = lookup_band_extras(band_index, away_odds, "away", np.where(away_odds < 0, "favorite", "underdog"))
+        settle(
+            np.isnan(home_extra) | np.isnan(away_extra), "missing_band", "noband",
+            lambda i: f"reason=no_band home_odds={float(home_odds[i])} away_odds={float(away_odds[i])}",
+        )
+
+        home_juiced_prob = np.clip(home_base + home_extra, 0.01, 0.95)
+        away_juiced_prob = np.clip(away_base + away_extra, 0.01, 0.95)
+        total = home_juiced_prob + away_juiced_prob
+        settle(
+            ~np.isfinite(total) | (total <= 0), "invalid_normalization_total", "bad",
+            lambda i: f"reason=invalid_normalization_total total={float(total[i])}",
+        )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        home_normalized = home_juiced_prob / total
+        away_normalized = away_juiced_prob / total
+
+    for i in sorted(reasons):
+        _log(f"row={df.index[i]} {reasons[i]}", "SKIP")
+
+    juiced = result == "ok"
+    priced = juiced | (status == "missing_band")
+
+    def keep(mask, values):
+        return np.where(mask, values, np.nan)
+
+    df["home_juiced_prob_run_line"] = keep(juiced, home_juiced_prob)
+    df["away_juiced_prob_run_line"] = keep(juiced, away_juiced_prob)
+    df["home_normalized_prob_run_line"] = keep(juiced, home_normalized)
+    df["away_normalized_prob_run_line"] = keep(juiced, away_normalized)
+
+    audit = build_audit_frame(df, status, {
+        "dk_american": (keep(priced, home_odds), keep(priced, away_odds)),
+        "dk_decimal": (keep(priced, home_dk_decimal), keep(priced, away_dk_decimal)),
+        "juiced_prob": (keep(juiced, home_juiced_prob), keep(juiced, away_juiced_prob)),
+        "normalized_prob": (keep(juiced, home_normalized), keep(juiced, away_normalized)),
     })
 
-    return df, "ok"
+    return df, audit, result
 
 
 # =========================
@@ -454,7 +491,7 @@ def main():
     }
 
     per_file = []
-    audit_rows = []
+    audit_frames = []
 
     for f in OUTPUT_DIR.glob("*run_line.csv"):
         f.unlink()
@@ -473,6 +510,7 @@ def main():
         juice_df["venue"] = juice_df["venue"].astype(str).str.strip().str.lower()
         juice_df["fav_ud"] = juice_df["fav_ud"].astype(str).str.strip().str.lower()
         validate_juice_config(juice_df)
+        band_index = compile_band_index(juice_df)
 
         files = sorted(glob.glob(str(INPUT_DIR / "*_mlb_run_line.csv")))
         summary["files_found"] = len(files)
@@ -544,15 +582,12 @@ def main():
                 summary["missing_away_run_line_price_dk"] += pf["missing_away_run_line_price_dk"]
                 summary["missing_any_run_line_dk"] += pf["missing_any_run_line_dk"]
 
-                for idx, row in df.iterrows():
-                    df, result = process_row(df, juice_df, idx, row, audit_rows)
+                df, audit, result = process_frame(df, band_index)
+                audit_frames.append(audit)
 
-                    if result == "ok":
-                        pf["applied"] += 1
-                    elif result == "noband":
-                        pf["skipped_noband"] += 1
-                    else:
-                        pf["skipped_bad"] += 1
+                pf["applied"] = int((result == "ok").sum())
+                pf["skipped_noband"] = int((result == "noband").sum())
+                pf["skipped_bad"] = int((result == "bad").sum())
 
                 norm_bad = validate_normalized_pair(
                     df,
@@ -599,7 +634,8 @@ def main():
         sys.exit(1)
 
     audit_path = AUDIT_DIR / "run_line_post_juice_audit.csv"
-    pd.DataFrame(audit_rows, columns=AUDIT_COLUMNS).to_csv(audit_path, index=False)
+    audit_df = pd.concat(audit_frames, ignore_index=True) if audit_frames else pd.DataFrame(columns=AUDIT_COLUMNS)
+    audit_df.to_csv(audit_path, index=False)
     _log(f"WROTE AUDIT: {audit_path}")
 
     _write_summary(summary, per_file)
@@ -2,12 +2,12 @@
 # docs/win/baseball/mlb/scripts/02_juice/apply_total_juice.py
 
 import glob
-import math
 import sys
 import traceback
 from datetime import datetime, UTC
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 INPUT_DIR = Path("docs/win/baseball/mlb/01_merge/01_merguiced")
@@ -196,25 +196,25 @@ def validate_stale_input(input_path: Path) -> None:
 
 
 def validate_normalized_pair(df: pd.DataFrame, left_col: str, right_col: str, label: str) -> int:
-    bad = 0
-    for idx, row in df.iterrows():
-        left = pd.to_numeric(pd.Series([row[left_col]]), errors="coerce").iloc[0]
-        right = pd.to_numeric(pd.Series([row[right_col]]), errors="coerce").iloc[0]
+    left = pd.to_numeric(df[left_col], errors="coerce").to_numpy(dtype=float)
+    right = pd.to_numeric(df[right_col], errors="coerce").to_numpy(dtype=float)
 
-        if pd.isna(left) and pd.isna(right):
-            continue
-
-        if pd.isna(left) or pd.isna(right):
-            bad += 1
-            _log(f"{label} row={idx} reason=incomplete_normalized_pair {left_col}={left} {right_col}={right}", "ERROR")
-            continue
+    incomplete = np.isnan(left) != np.isnan(right)
+    total = left + right
+    with np.errstate(invalid="ignore"):
+        invalid = ~np.isnan(left) & ~np.isnan(right) & (~np.isfinite(total) | (np.abs(total - 1.0) > NORMALIZATION_TOLERANCE))
 
-        total = float(left) + float(right)
-        if not math.isfinite(total) or abs(total - 1.0) > NORMALIZATION_TOLERANCE:
-            bad += 1
-            _log(f"{label} row={idx} reason=normalized_sum_invalid total={total}", "ERROR")
+    for i in np.flatnonzero(incomplete | invalid):
+        if incomplete[i]:
+            _log(
+                f"{label} row={df.index[i]} reason=incomplete_normalized_pair "
+                f"{left_col}={left[i]} {right_col}={right[i]}",
+                "ERROR",
+            )
+        else:
+            _log(f"{label} row={df.index[i]} reason=normalized_sum_invalid total={float(total[i])}", "ERROR")
 
-    return bad
+    return int((incomplete | invalid).sum())
 
 
 # =========================
@@ -294,198 +294,219 @@ def validate_juice_config(juice_df: pd.DataFrame) -> bool:
 # JUICE LOOKUP
 # =========================
 
-def find_band_row(juice_df, total, side, dk_american, uses_odds_bands):
-    band = juice_df[
-        (juice_df["band_min"] <= total) &
-        (total < juice_df["band_max"]) &
-        (juice_df["side"] == side)
-    ]
+def compile_band_index(juice_df: pd.DataFrame, uses_odds_bands: bool) -> dict:
+    """Band table per side, resolved lazily into a per-(side, total) odds index.
+
+    A slate only carries a handful of distinct total lines, so every row on
+    the same (side, total) shares one candidate list. validate_juice_config
+    guarantees those candidates never overlap in odds, so the only band that
+    can hold a price is the last one whose odds_min is at or below it.
+    """
+    return {
+        "uses_odds_bands": uses_odds_bands,
+        "sides": {side: group.reset_index(drop=True) for side, group in juice_df.groupby("side")},
+        "keys": {},
+    }
 
-    if uses_odds_bands:
-        band = band[
-            (band["odds_min"] <= dk_american) &
-            (dk_american < band["odds_max"])
-        ]
 
-    if len(band) != 1:
-        return None
+def _total_key_bands(band_index: dict, side: str, total: float):
+    key = (side, total)
+    if key not in band_index["keys"]:
+        group = band_index["sides"].get(side)
+        if group is None:
+            band_index["keys"][key] = None
+        else:
+            band = group[(group["band_min"] <= total) & (total < group["band_max"])]
+            if band_index["uses_odds_bands"]:
+                band = band.sort_values("odds_min")
+                band_index["keys"][key] = (
+                    band["odds_min"].to_numpy(dtype=float),
+                    band["odds_max"].to_numpy(dtype=float),
+                    band["extra_juice"].to_numpy(dtype=float),
+                )
+            else:
+                band_index["keys"][key] = float(band.iloc[0]["extra_juice"]) if len(band) == 1 else None
+    return band_index["keys"][key]
+
+
+def lookup_band_extras(band_index: dict, totals, side: str, dk_american) -> np.ndarray:
+    totals = np.asarray(totals, dtype=float)
+    dk_american = np.asarray(dk_american, dtype=float)
+    extras = np.full(totals.shape, np.nan)
+
+    for total in np.unique(totals[~np.isnan(totals)]):
+        bands = _total_key_bands(band_index, side, float(total))
+        if bands is None:
+            continue
+        mask = totals == total
+        if not band_index["uses_odds_bands"]:
+            extras[mask] = bands
+            continue
+        odds_min, odds_max, extra_juice = bands
+        values = dk_american[mask]
+        pos = np.searchsorted(odds_min, values, side="right") - 1
+        hit = (pos >= 0) & (values < odds_max[np.maximum(pos, 0)]) if len(odds_min) else np.zeros(values.shape, bool)
+        found = np.full(values.shape, np.nan)
+        found[hit] = extra_juice[pos[hit]]
+        extras[mask] = found
 
-    return float(band.iloc[0]["extra_juice"])
+    return extras
+
+
+def find_band_row(band_index, total, side, dk_american):
+    extra = lookup_band_extras(band_index, [total], side, [dk_american])[0]
+    return None if np.isnan(extra) else float(extra)
 
 
 # =========================
 # AUDIT
 # =========================
 
-def append_audit_row(audit_rows: list, row: pd.Series, side: str, status: str, values: dict | None = None) -> None:
-    values = values or {}
-    audit_rows.append({
-        "date": row.get("game_date", pd.NA),
-        "game_id": row.get("game_id", pd.NA),
+def build_audit_frame(df: pd.DataFrame, side: str, status: np.ndarray, values: dict) -> pd.DataFrame:
+    """One audit row per game for ``side``; ``values`` maps audit column -> array."""
+    rows = len(df)
+    return pd.DataFrame({
+        "date": df["game_date"].to_numpy(),
+        "game_id": df["game_id"].to_numpy(),
         "market": "total",
         "side": side,
-        "dk_american": values.get("dk_american", pd.NA),
-        "dk_decimal": values.get("dk_decimal", pd.NA),
-        "fair_decimal": values.get("fair_decimal", pd.NA),
-        "juiced_decimal": values.get("juiced_decimal", pd.NA),
-        "juiced_prob": values.get("juiced_prob", pd.NA),
-        "normalized_prob": values.get("normalized_prob", pd.NA),
+        **{
+            col: values.get(col, np.full(rows, np.nan))
+            for col in ["dk_american", "dk_decimal", "fair_decimal", "juiced_decimal", "juiced_prob", "normalized_prob"]
+        },
         "status": status,
-    })
+    }, columns=AUDIT_COLUMNS)
 
 
 # =========================
 # SIDE PROCESSOR
 # =========================
 
-def process_side(df, juice_df, side, uses_odds_bands, audit_rows):
+def parse_numeric_columns(df, columns):
+    """Coerce ``columns`` to float rows; also flag rows with a cell that is present but not a number."""
+    raw = df[columns]
+    parsed = raw.apply(pd.to_numeric, errors="coerce")
+    unparseable = (raw.notna() & parsed.isna()).any(axis=1).to_numpy()
+    return parsed.to_numpy(dtype=float).T, unparseable
+
+
+def process_side(df, band_index, side):
+    """Juice one side of every row in a vectorized pass (same checks and order as the old row loop)."""
     fair_col = f"fair_total_{side}_decimal"
     american_col = f"dk_total_{side}_american"
     dk_decimal_col = f"dk_total_{side}_decimal"
     juiced_dec_col = f"{side}_juiced_decimal_total"
     juiced_prob_col = f"{side}_juiced_prob_total"
 
-    df[juiced_dec_col] = pd.NA
-    df[juiced_prob_col] = pd.NA
-
-    applied = 0
-    skipped_noband = 0
-    skipped_bad = 0
-    clamped_decimal = 0
-
-    for idx, row in df.iterrows():
-        if pd.isna(row[american_col]) or pd.isna(row[dk_decimal_col]):
-            append_audit_row(audit_rows, row, side, "missing_dk_odds")
-            _log(f"row={idx} side={side} reason=missing_dk_odds", "SKIP")
-            skipped_bad += 1
-            continue
-
-        try:
-            total = round(float(row["total"]), 1)
-            fair_decimal = float(row[fair_col])
-            dk_american = float(row[american_col])
-            dk_decimal = float(row[dk_decimal_col])
-        except Exception:
-            append_audit_row(audit_rows, row, side, "bad_parse")
-            _log(f"row={idx} side={side} reason=bad_parse", "SKIP")
-            skipped_bad += 1
-            continue
-
-        if not math.isfinite(fair_decimal) or fair_decimal <= 1:
-            append_audit_row(audit_rows, row, side, "invalid_fair_decimal", {
-                "dk_american": dk_american,
-                "dk_decimal": dk_decimal,
-                "fair_decimal": fair_decimal,
-            })
-            _log(f"row={idx} side={side} reason=bad_fair_decimal val={fair_decimal}", "SKIP")
-            skipped_bad += 1
-            continue
-
-        if not math.isfinite(dk_american) or not math.isfinite(dk_decimal) or dk_decimal <= 1:
-            append_audit_row(audit_rows, row, side, "invalid_dk_odds", {
-                "dk_american": dk_american,
-                "dk_decimal": dk_decimal,
-                "fair_decimal": fair_decimal,
-            })
-            _log(f"row={idx} side={side} reason=bad_dk_odds american={dk_american} decimal={dk_decimal}", "SKIP")
-            skipped_bad += 1
-            continue
-
-        extra = find_band_row(juice_df, total, side, dk_american, uses_odds_bands)
-
-        if extra is None:
-            append_audit_row(audit_rows, row, side, "missing_band", {
-                "dk_american": dk_american,
-                "dk_decimal": dk_decimal,
-                "fair_decimal": fair_decimal,
-            })
-            _log(f"row={idx} side={side} reason=no_band total={total} dk_american={dk_american}", "SKIP")
-            skipped_noband += 1
-            continue
-
-        try:
-            juiced_decimal = fair_decimal * (1 - extra)
-            status = "juiced"
-
-            if not math.isfinite(juiced_decimal):
-                append_audit_row(audit_rows, row, side, "invalid_juiced_decimal", {
-                    "dk_american": dk_american,
-                    "dk_decimal": dk_decimal,
-                    "fair_decimal": fair_decimal,
-                })
-                _log(f"row={idx} side={side} reason=invalid_juiced_decimal val={juiced_decimal} fair={fair_decimal} extra={extra}", "SKIP")
-                skipped_bad += 1
-                continue
-
-            if juiced_decimal <= 1:
-                _log(
-                    f"row={idx} side={side} reason=clamped_juiced_decimal "
-                    f"original={juiced_decimal} clamped={MIN_JUICED_DECIMAL} fair={fair_decimal} extra={extra}",
-                    "WARN",
-                )
-                juiced_decimal = MIN_JUICED_DECIMAL
-                clamped_decimal += 1
-                status = "invalid_decimal_clamped"
+    rows = len(df)
+    (raw_total, fair_decimal, dk_american, dk_decimal), unparseable = parse_numeric_columns(
+        df, ["total", fair_col, american_col, dk_decimal_col],
+    )
+    missing_dk = df[[american_col, dk_decimal_col]].isna().any(axis=1).to_numpy()
+    unique_totals, inverse = np.unique(raw_total, return_inverse=True)
+    total = np.array([round(float(t), 1) for t in unique_totals])[inverse.reshape(-1)]
+
+    status = np.full(rows, "juiced", dtype=object)
+    result = np.full(rows, "ok", dtype=object)
+    messages = {}
+    pending = np.ones(rows, dtype=bool)
+
+    def settle(mask, row_status, row_result, reason):
+        hit = pending & mask
+        for i in np.flatnonzero(hit):
+            messages[i] = ("SKIP", reason(i))
+        status[hit] = row_status
+        result[hit] = row_result
+        pending[hit] = False
+
+    with np.errstate(invalid="ignore"):
+        settle(missing_dk, "missing_dk_odds", "bad", lambda i: "reason=missing_dk_odds")
+        settle(unparseable, "bad_parse", "bad", lambda i: "reason=bad_parse")
+        settle(
+            ~np.isfinite(fair_decimal) | (fair_decimal <= 1), "invalid_fair_decimal", "bad",
+            lambda i: f"reason=bad_fair_decimal val={float(fair_decimal[i])}",
+        )
+        settle(
+            ~np.isfinite(dk_american) | ~np.isfinite(dk_decimal) | (dk_decimal <= 1), "invalid_dk_odds", "bad",
+            lambda i: f"reason=bad_dk_odds american={float(dk_american[i])} decimal={float(dk_decimal[i])}",
+        )
 
-            juiced_prob = 1 / juiced_decimal
+        extra = lookup_band_extras(band_index, total, side, dk_american)
+        settle(
+            np.isnan(extra), "missing_band", "noband",
+            lambda i: f"reason=no_band total={float(total[i])} dk_american={float(dk_american[i])}",
+        )
 
-            df.at[idx, juiced_dec_col] = juiced_decimal
-            df.at[idx, juiced_prob_col] = juiced_prob
-            append_audit_row(audit_rows, row, side, status, {
-                "dk_american": dk_american,
-                "dk_decimal": dk_decimal,
-                "fair_decimal": fair_decimal,
-                "juiced_decimal": juiced_decimal,
-                "juiced_prob": juiced_prob,
-            })
-            applied += 1
+        juiced_decimal = fair_decimal * (1 - extra)
+        settle(
+            ~np.isfinite(juiced_decimal), "invalid_juiced_decimal", "bad",
+            lambda i: (
+                f"reason=invalid_juiced_decimal val={float(juiced_decimal[i])} "
+                f"fair={float(fair_decimal[i])} extra={float(extra[i])}"
+            ),
+        )
 
-        except Exception:
-            append_audit_row(audit_rows, row, side, "calc_error")
-            _log(f"row={idx} side={side} reason=calc_error", "SKIP")
-            skipped_bad += 1
+        clamped = pending & (juiced_decimal <= 1)
+    for i in np.flatnonzero(clamped):
+        messages[i] = ("WARN", (
+            f"reason=clamped_juiced_decimal original={float(juiced_decimal[i])} clamped={MIN_JUICED_DECIMAL} "
+            f"fair={float(fair_decimal[i])} extra={float(extra[i])}"
+        ))
+    status[clamped] = "invalid_decimal_clamped"
+    juiced_decimal = np.where(clamped, MIN_JUICED_DECIMAL, juiced_decimal)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        juiced_prob = 1 / juiced_decimal
+
+    for i in sorted(messages):
+        level, reason = messages[i]
+        _log(f"row={df.index[i]} side={side} {reason}", level)
+
+    applied = result == "ok"
+    priced = ~np.isin(status, ["missing_dk_odds", "bad_parse"])
+
+    def keep(mask, values):
+        return np.where(mask, values, np.nan)
+
+    df[juiced_dec_col] = keep(applied, juiced_decimal)
+    df[juiced_prob_col] = keep(applied, juiced_prob)
+
+    audit = build_audit_frame(df, side, status, {
+        "dk_american": keep(priced, dk_american),
+        "dk_decimal": keep(priced, dk_decimal),
+        "fair_decimal": keep(priced, fair_decimal),
+        "juiced_decimal": keep(applied, juiced_decimal),
+        "juiced_prob": keep(applied, juiced_prob),
+    })
 
-    return df, applied, skipped_noband, skipped_bad, clamped_decimal
+    return (
+        df,
+        audit,
+        int(applied.sum()),
+        int((result == "noband").sum()),
+        int((result == "bad").sum()),
+        int(clamped.sum()),
+    )
 
 
 # =========================
 # NORMALIZATION
 # =========================
 
-def apply_normalization(df, audit_rows):
-    df["over_normalized_prob_total"] = pd.NA
-    df["under_normalized_prob_total"] = pd.NA
-
-    for idx, row in df.iterrows():
-        try:
-            op = float(row["over_juiced_prob_total"])
-            up = float(row["under_juiced_prob_total"])
-
-            if not math.isfinite(op) or not math.isfinite(up):
-                continue
+def apply_normalization(df, over_audit, under_audit):
+    op = pd.to_numeric(df["over_juiced_prob_total"], errors="coerce").to_numpy(dtype=float)
+    up = pd.to_numeric(df["under_juiced_prob_total"], errors="coerce").to_numpy(dtype=float)
+    total = op + up
 
-            total = op + up
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = np.isfinite(op) & np.isfinite(up) & (total > 0)
+        over_norm = np.where(normalized, op / total, np.nan)
+        under_norm = np.where(normalized, up / total, np.nan)
 
-            if total <= 0:
-                continue
-
-            over_norm = op / total
-            under_norm = up / total
-
-            df.at[idx, "over_normalized_prob_total"] = over_norm
-            df.at[idx, "under_normalized_prob_total"] = under_norm
-
-            for audit_row in reversed(audit_rows):
-                if audit_row["game_id"] == row.get("game_id") and audit_row["market"] == "total" and audit_row["side"] == "over" and pd.isna(audit_row["normalized_prob"]):
-                    audit_row["normalized_prob"] = over_norm
-                    break
-            for audit_row in reversed(audit_rows):
-                if audit_row["game_id"] == row.get("game_id") and audit_row["market"] == "total" and audit_row["side"] == "under" and pd.isna(audit_row["normalized_prob"]):
-                    audit_row["normalized_prob"] = under_norm
-                    break
-
-        except Exception:
-            continue
+    df["over_normalized_prob_total"] = over_norm
+    df["under_normalized_prob_total"] = under_norm
+    over_audit["normalized_prob"] = over_norm
+    under_audit["normalized_prob"] = under_norm
 
     return df
 
@@ -518,7 +539,7 @@ def main():
     }
 
     per_file = []
-    audit_rows = []
+    audit_frames = []
 
     for f in OUTPUT_DIR.glob("*total.csv"):
         f.unlink()
@@ -541,6 +562,7 @@ def main():
             juice_df["odds_max"] = pd.to_numeric(juice_df["odds_max"], errors="coerce")
 
         uses_odds_bands = validate_juice_config(juice_df)
+        band_index = compile_band_index(juice_df, uses_odds_bands)
 
         files = sorted(glob.glob(str(INPUT_DIR / "*_mlb_total.csv")))
         summary["files_found"] = len(files)
@@ -607,9 +629,10 @@ def main():
                 summary["missing_under_price_dk"] += pf["missing_under_price_dk"]
                 summary["missing_any_total_dk"] += pf["missing_any_total_dk"]
 
-                df, o_applied, o_noband, o_bad, o_clamped = process_side(df, juice_df, "over", uses_odds_bands, audit_rows)
-                df, u_applied, u_noband, u_bad, u_clamped = process_side(df, juice_df, "under", uses_odds_bands, audit_rows)
-                df = apply_normalization(df, audit_rows)
+                df, over_audit, o_applied, o_noband, o_bad, o_clamped = process_side(df, band_index, "over")
+                df, under_audit, u_applied, u_noband, u_bad, u_clamped = process_side(df, band_index, "under")
+                df = apply_normalization(df, over_audit, under_audit)
+                audit_frames.extend([over_audit, under_audit])
 
                 pf["over_applied"] = o_applied
                 pf["under_applied"] = u_applied
@@ -666,7 +689,8 @@ def main():
         sys.exit(1)
 
     audit_path = AUDIT_DIR / "total_post_juice_audit.csv"
-    pd.DataFrame(audit_rows, columns=AUDIT_COLUMNS).to_csv(audit_path, index=False)
+    audit_df = pd.concat(audit_frames, ignore_index=True) if audit_frames else pd.DataFrame(columns=AUDIT_COLUMNS)
+    audit_df.to_csv(audit_path, index=False)
     _log(f"WROTE AUDIT: {audit_path}")
 
     _write_summary(summary, per_file)
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 # docs/win/baseball/mlb/scripts/03_edges/compute_edges.py
 
+import argparse
+import importlib.util
+import sys
 import traceback
 from datetime import UTC, datetime
 from pathlib import Path
@@ -12,6 +15,7 @@ INPUT_DIR = Path("docs/win/baseball/mlb/02_juice")
 OUTPUT_DIR = Path("docs/win/baseball/mlb/03_edges")
 ERROR_DIR = Path("docs/win/baseball/mlb/errors/03_edges")
 LOG_FILE = ERROR_DIR / "compute_edges.txt"
+INTERCHANGE_SCRIPT = Path("docs/win/baseball/mlb/scripts/interchange.py")
 
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 ERROR_DIR.mkdir(parents=True, exist_ok=True)
@@ -113,9 +117,26 @@ def assert_read_path_allowed(path: Path) -> None:
     record_file_read(path, True, "allowed")
 
 
+def load_interchange():
+    """Load the shared stage interchange helpers (scripts/interchange.py) once per process."""
+    module = sys.modules.get("mlb_interchange")
+
+    if module is None:
+        spec = importlib.util.spec_from_file_location("mlb_interchange", INTERCHANGE_SCRIPT)
+
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"Could not load interchange helpers: {INTERCHANGE_SCRIPT}")
+
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["mlb_interchange"] = module
+
+    return module
+
+
 def read_csv_guarded(path: Path) -> pd.DataFrame:
-    assert_read_path_allowed(path)
-    return pd.read_csv(path)
+    """Read a stage boundary file, checking whichever path is actually read."""
+    return load_interchange().read_interchange(path, guard=assert_read_path_allowed)
 
 
 # =========================
@@ -418,6 +439,11 @@ def write_csv_checked(
 ) -> None:
     validate_no_duplicate_columns(df, f"{output_path} output")
     df.to_csv(output_path, index=False)
+    load_interchange().write_columnar(
+        df,
+        output_path,
+        warn=lambda msg: _log(msg, "WARN"),
+    )
 
 
 # =========================
@@ -601,7 +627,20 @@ def compute_total(df: pd.DataFrame):
 # MAIN
 # =========================
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "dates",
+        nargs="*",
+        help="Optional date(s) to rebuild (YYYY_MM_DD or YYYY-MM-DD); omit to rebuild every slate.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    dates = sorted({value.strip().replace("-", "_") for value in parse_args(argv).dates})
+    prefixes = dates or [""]
+
     with open(LOG_FILE, "w", encoding="utf-8") as f:
         f.write(f"=== compute_edges RUN {_now()} ===\n")
 
@@ -620,15 +659,20 @@ def main():
 
     _log(f"INPUT_DIR : {INPUT_DIR}")
     _log(f"OUTPUT_DIR: {OUTPUT_DIR}")
+    _log(f"INTERCHANGE: {load_interchange().INTERCHANGE}")
     _log(
         "EDGE DEFINITION: model probability minus sportsbook break-even probability"
     )
 
-    input_files = sorted(INPUT_DIR.glob("*.csv"))
+    if dates:
+        _log(f"Date-scoped rebuild: {dates}")
+
+    input_files = sorted(path for prefix in prefixes for path in INPUT_DIR.glob(f"{prefix}*.csv"))
     _log(f"Files found: {len(input_files)}")
 
-    for out_file in OUTPUT_DIR.glob("*.csv"):
-        out_file.unlink()
+    for prefix in prefixes:
+        for out_file in OUTPUT_DIR.glob(f"{prefix}*.csv"):
+            load_interchange().remove_output(out_file)
 
     for input_file in input_files:
         name = input_file.name.lower()
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 # docs/win/baseball/mlb/scripts/03_edges/compute_ev_kelly.py
 
+import argparse
+import importlib.util
+import sys
 import traceback
 from datetime import UTC, datetime
 from pathlib import Path
@@ -14,6 +17,8 @@ OUTPUT_DIR = Path("docs/win/baseball/mlb/03_edges/ev_kelly")
 AUDIT_DIR = OUTPUT_DIR / "audit"
 ERROR_DIR = Path("docs/win/baseball/mlb/errors/03_edges")
 LOG_FILE = ERROR_DIR / "compute_ev_kelly.txt"
+SEASON_AUDIT_SCRIPT = Path("docs/win/baseball/mlb/scripts/season_audit.py")
+INTERCHANGE_SCRIPT = Path("docs/win/baseball/mlb/scripts/interchange.py")
 
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 AUDIT_DIR.mkdir(parents=True, exist_ok=True)
@@ -53,6 +58,69 @@ PROBABILITY_SOURCES = {
 }
 
 
+EV_KELLY_COLUMNS = {
+    "moneyline": {
+        "home": {
+            "decimal": "home_dk_decimal_moneyline",
+            "ev": "home_ml_ev",
+            "raw_kelly": "home_ml_kelly_raw",
+            "kelly": "home_ml_kelly",
+        },
+        "away": {
+            "decimal": "away_dk_decimal_moneyline",
+            "ev": "away_ml_ev",
+            "raw_kelly": "away_ml_kelly_raw",
+            "kelly": "away_ml_kelly",
+        },
+    },
+    "run_line": {
+        "home": {
+            "decimal": "home_dk_run_line_decimal",
+            "ev": "home_rl_ev",
+            "raw_kelly": "home_rl_kelly_raw",
+            "kelly": "home_rl_kelly",
+        },
+        "away": {
+            "decimal": "away_dk_run_line_decimal",
+            "ev": "away_rl_ev",
+            "raw_kelly": "away_rl_kelly_raw",
+            "kelly": "away_rl_kelly",
+        },
+    },
+    "total": {
+        "over": {
+            "decimal": "dk_total_over_decimal",
+            "loss": "over_model_prob_total_loss",
+            "ev": "over_ev",
+            "raw_kelly": "over_kelly_raw",
+            "kelly": "over_kelly",
+        },
+        "under": {
+            "decimal": "dk_total_under_decimal",
+            "loss": "under_model_prob_total_loss",
+            "ev": "under_ev",
+            "raw_kelly": "under_kelly_raw",
+            "kelly": "under_kelly",
+        },
+    },
+}
+
+AUDIT_COLUMNS = [
+    "date",
+    "game_id",
+    "market",
+    "side",
+    "prob_for_ev",
+    "prob_for_kelly",
+    "dk_decimal",
+    "ev",
+    "raw_kelly",
+    "kelly",
+    "ev_probability_source",
+    "kelly_probability_source",
+    "status",
+]
+
 MONEYLINE_REQUIRED_COLUMNS = [
     "game_id",
     "sport",
@@ -176,11 +244,38 @@ def assert_read_path_allowed(
     )
 
 
+def load_interchange():
+    """Load the shared stage interchange helpers
+    (scripts/interchange.py) once per process."""
+    module = sys.modules.get("mlb_interchange")
+
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            "mlb_interchange",
+            INTERCHANGE_SCRIPT,
+        )
+
+        if spec is None or spec.loader is None:
+            raise RuntimeError(
+                f"Could not load interchange helpers: {INTERCHANGE_SCRIPT}"
+            )
+
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["mlb_interchange"] = module
+
+    return module
+
+
 def read_csv_guarded(
     path: Path,
 ) -> pd.DataFrame:
-    assert_read_path_allowed(path)
-    return pd.read_csv(path)
+    """Read a stage boundary file, checking whichever
+    path is actually read."""
+    return load_interchange().read_interchange(
+        path,
+        guard=assert_read_path_allowed,
+    )
 
 
 # =========================
@@ -731,77 +826,159 @@ def write_csv_checked(
     )
 
 
+def write_columnar(
+    df: pd.DataFrame,
+    csv_path: Path,
+) -> None:
+    load_interchange().write_columnar(
+        df,
+        csv_path,
+        warn=lambda msg: _log(msg, "WARN"),
+    )
+
+
 # =========================
 # EV / KELLY HELPERS
 # =========================
+# One array kernel prices every side of every market: binary markets
+# (moneyline, run line) and push-aware totals share ev_kelly_arrays, and
+# the Series helpers below are thin wrappers over it.
 
-def compute_binary_ev(
-    probability,
+def ev_kelly_arrays(
+    p_win,
     decimal_odds,
-) -> pd.Series:
-    probability = pd.to_numeric(
-        probability,
-        errors="coerce",
+    p_loss=None,
+) -> tuple[np.ndarray, np.ndarray]:
+    p_win = np.asarray(
+        p_win,
+        dtype=float,
     )
 
-    decimal_odds = pd.to_numeric(
+    decimal_odds = np.asarray(
         decimal_odds,
-        errors="coerce",
+        dtype=float,
     )
 
+    b = (
+        decimal_odds
+        - 1.0
+    )
+
+    valid = (
+        np.isfinite(p_win)
+        & np.isfinite(decimal_odds)
+        & (decimal_odds > 1.0)
+    )
+
+    with np.errstate(
+        divide="ignore",
+        invalid="ignore",
+    ):
+        if p_loss is None:
+            ev = (
+                p_win
+                * decimal_odds
+            ) - 1.0
+
+            raw_kelly = (
+                (
+                    b
+                    * p_win
+                )
+                - (
+                    1.0
+                    - p_win
+                )
+            ) / b
+
+        else:
+            p_loss = np.asarray(
+                p_loss,
+                dtype=float,
+            )
+
+            resolved = (
+                p_win
+                + p_loss
+            )
+
+            valid = (
+                valid
+                & np.isfinite(p_loss)
+                & np.isfinite(resolved)
+                & (resolved > 0)
+            )
+
+            ev = (
+                p_win
+                * b
+            ) - p_loss
+
+            raw_kelly = ev / (
+                b
+                * resolved
+            )
+
     return (
-        probability
-        * decimal_odds
-    ) - 1.0
+        ev,
+        np.where(
+            valid,
+            raw_kelly,
+            np.nan,
+        ),
+    )
 
 
-def compute_binary_kelly_raw(
+def _numeric_series(value) -> pd.Series:
+    return pd.Series(
+        pd.to_numeric(
+            value,
+            errors="coerce",
+        ),
+        dtype="float64",
+    )
+
+
+def compute_binary_ev(
     probability,
     decimal_odds,
 ) -> pd.Series:
-    probability = pd.to_numeric(
-        probability,
-        errors="coerce",
+    probability = _numeric_series(
+        probability
     )
 
-    decimal_odds = pd.to_numeric(
-        decimal_odds,
-        errors="coerce",
+    ev, _ = ev_kelly_arrays(
+        probability,
+        _numeric_series(
+            decimal_odds
+        ),
     )
 
-    b = (
-        decimal_odds
-        - 1.0
+    return pd.Series(
+        ev,
+        index=probability.index,
     )
 
-    q = (
-        1.0
-        - probability
-    )
 
-    raw_kelly = pd.Series(
-        np.nan,
-        index=probability.index,
-        dtype="float64",
+def compute_binary_kelly_raw(
+    probability,
+    decimal_odds,
+) -> pd.Series:
+    probability = _numeric_series(
+        probability
     )
 
-    valid = (
-        probability.notna()
-        & decimal_odds.notna()
-        & np.isfinite(probability)
-        & np.isfinite(decimal_odds)
-        & (decimal_odds > 1.0)
+    _, raw_kelly = ev_kelly_arrays(
+        probability,
+        _numeric_series(
+            decimal_odds
+        ),
     )
 
-    raw_kelly.loc[valid] = (
-        (
-            b.loc[valid]
-            * probability.loc[valid]
-        )
-        - q.loc[valid]
-    ) / b.loc[valid]
-
-    return raw_kelly
+    return pd.Series(
+        raw_kelly,
+        index=probability.index,
+    )
 
 
 def compute_total_ev(
@@ -809,52 +986,43 @@ def compute_total_ev(
     p_loss,
     decimal_odds,
 ) -> pd.Series:
-    p_win = pd.to_numeric(
-        p_win,
-        errors="coerce",
-    )
-
-    p_loss = pd.to_numeric(
-        p_loss,
-        errors="coerce",
+    p_win = _numeric_series(
+        p_win
     )
 
-    decimal_odds = pd.to_numeric(
-        decimal_odds,
-        errors="coerce",
+    ev, _ = ev_kelly_arrays(
+        p_win,
+        _numeric_series(
+            decimal_odds
+        ),
+        _numeric_series(
+            p_loss
+        ),
     )
 
-    b = (
-        decimal_odds
-        - 1.0
+    return pd.Series(
+        ev,
+        index=p_win.index,
     )
 
-    return (
-        p_win
-        * b
-    ) - p_loss
-
 
-def compute_total_kelly_raw(
+def validate_total_kelly_inputs(
     p_win,
     p_loss,
     decimal_odds,
     game_id,
     label: str,
-) -> pd.Series:
-    p_win = pd.to_numeric(
-        p_win,
-        errors="coerce",
+) -> None:
+    p_win = _numeric_series(
+        p_win
     )
 
-    p_loss = pd.to_numeric(
-        p_loss,
-        errors="coerce",
+    p_loss = _numeric_series(
+        p_loss
     )
 
-    decimal_odds = pd.to_numeric(
-        decimal_odds,
-        errors="coerce",
+    decimal_odds = _numeric_series(
+        decimal_odds
     )
 
     resolved = (
@@ -862,11 +1030,6 @@ def compute_total_kelly_raw(
         + p_loss
     )
 
-    b = (
-        decimal_odds
-        - 1.0
-    )
-
     invalid = (
         p_win.isna()
         | p_loss.isna()
@@ -903,19 +1066,39 @@ def compute_total_kelly_raw(
             f"sample={sample}"
         )
 
-    numerator = (
+
+def compute_total_kelly_raw(
+    p_win,
+    p_loss,
+    decimal_odds,
+    game_id,
+    label: str,
+) -> pd.Series:
+    p_win = _numeric_series(
         p_win
-        * b
-    ) - p_loss
+    )
 
-    denominator = (
-        b
-        * resolved
+    validate_total_kelly_inputs(
+        p_win,
+        p_loss,
+        decimal_odds,
+        game_id,
+        label,
     )
 
-    return (
-        numerator
-        / denominator
+    _, raw_kelly = ev_kelly_arrays(
+        p_win,
+        _numeric_series(
+            decimal_odds
+        ),
+        _numeric_series(
+            p_loss
+        ),
+    )
+
+    return pd.Series(
+        raw_kelly,
+        index=p_win.index,
     )
 
 
@@ -968,39 +1151,50 @@ def validate_ev_kelly_sign_consistency(
         errors="coerce",
     )
 
-    invalid_numeric = (
-        ev.isna()
-        | raw_kelly.isna()
-        | ~np.isfinite(ev)
-        | ~np.isfinite(raw_kelly)
+    ev_values = np.asarray(
+        ev,
+        dtype=float,
     )
 
-    positive_bad = (
-        (ev > SIGN_TOLERANCE)
-        & (
-            raw_kelly
-            <= SIGN_TOLERANCE
-        )
+    kelly_values = np.asarray(
+        raw_kelly,
+        dtype=float,
     )
 
-    negative_bad = (
-        (ev < -SIGN_TOLERANCE)
-        & (
-            raw_kelly
-            >= -SIGN_TOLERANCE
-        )
+    invalid_numeric = (
+        ~np.isfinite(ev_values)
+        | ~np.isfinite(kelly_values)
     )
 
-    zero_bad = (
-        (
-            ev.abs()
-            <= SIGN_TOLERANCE
+    with np.errstate(
+        invalid="ignore",
+    ):
+        positive_bad = (
+            (ev_values > SIGN_TOLERANCE)
+            & (
+                kelly_values
+                <= SIGN_TOLERANCE
+            )
         )
-        & (
-            raw_kelly.abs()
-            > SIGN_TOLERANCE
+
+        negative_bad = (
+            (ev_values < -SIGN_TOLERANCE)
+            & (
+                kelly_values
+                >= -SIGN_TOLERANCE
+            )
+        )
+
+        zero_bad = (
+            (
+                np.abs(ev_values)
+                <= SIGN_TOLERANCE
+            )
+            & (
+                np.abs(kelly_values)
+                > SIGN_TOLERANCE
+            )
         )
-    )
 
     bad = (
         invalid_numeric
@@ -1063,9 +1257,9 @@ def probability_source_mismatch_count(
     df: pd.DataFrame,
     sides: list,
 ) -> int:
-    mismatch = pd.Series(
-        False,
-        index=df.index,
+    mismatch = np.zeros(
+        len(df),
+        dtype=bool,
     )
 
     for side in sides:
@@ -1074,6 +1268,7 @@ def probability_source_mismatch_count(
                 f"{side}_ev_probability_source"
             ]
             .astype(str)
+            .to_numpy()
         )
 
         kelly_source = (
@@ -1081,6 +1276,7 @@ def probability_source_mismatch_count(
                 f"{side}_kelly_probability_source"
             ]
             .astype(str)
+            .to_numpy()
         )
 
         prob_ev = pd.to_numeric(
@@ -1088,14 +1284,14 @@ def probability_source_mismatch_count(
                 f"{side}_prob_for_ev"
             ],
             errors="coerce",
-        )
+        ).to_numpy(dtype=float)
 
         prob_kelly = pd.to_numeric(
             df[
                 f"{side}_prob_for_kelly"
             ],
             errors="coerce",
-        )
+        ).to_numpy(dtype=float)
 
         mismatch = (
             mismatch
@@ -1103,13 +1299,13 @@ def probability_source_mismatch_count(
                 ev_source
                 != kelly_source
             )
-            | prob_ev.isna()
-            | prob_kelly.isna()
+            | np.isnan(prob_ev)
+            | np.isnan(prob_kelly)
             | (
-                (
+                np.abs(
                     prob_ev
                     - prob_kelly
-                ).abs()
+                )
                 > PROB_TOLERANCE
             )
         )
@@ -1148,362 +1344,236 @@ def add_columns_at_once(
     ).copy()
 
 
-def audit_rows(
+def audit_frame(
     df: pd.DataFrame,
     market: str,
-    sides: list,
-    decimal_cols: dict,
-    ev_cols: dict,
-    raw_kelly_cols: dict,
-    kelly_cols: dict,
-) -> list:
-    records = []
+) -> pd.DataFrame:
+    sides = EV_KELLY_COLUMNS[market]
+    rows = len(df)
 
-    for side in sides:
-        for _, row in df.iterrows():
-            records.append(
-                {
-                    "date":
-                        row.get(
-                            "game_date"
-                        ),
-                    "game_id":
-                        row.get(
-                            "game_id"
-                        ),
-                    "market":
-                        market,
-                    "side":
-                        side,
-                    "prob_for_ev":
-                        row.get(
-                            f"{side}_prob_for_ev"
-                        ),
-                    "prob_for_kelly":
-                        row.get(
-                            f"{side}_prob_for_kelly"
-                        ),
-                    "dk_decimal":
-                        row.get(
-                            decimal_cols[side]
-                        ),
-                    "ev":
-                        row.get(
-                            ev_cols[side]
-                        ),
-                    "raw_kelly":
-                        row.get(
-                            raw_kelly_cols[side]
-                        ),
-                    "kelly":
-                        row.get(
-                            kelly_cols[side]
-                        ),
-                    "ev_probability_source":
-                        row.get(
-                            f"{side}_ev_probability_source"
-                        ),
-                    "kelly_probability_source":
-                        row.get(
-                            f"{side}_kelly_probability_source"
-                        ),
-                    "status":
-                        "ok",
-                }
-            )
+    def stacked(column_for_side) -> np.ndarray:
+        return np.concatenate(
+            [
+                df[
+                    column_for_side(side)
+                ].to_numpy()
+                for side in sides
+            ]
+        )
 
-    return records
+    return pd.DataFrame(
+        {
+            "date":
+                np.tile(
+                    df["game_date"].to_numpy(),
+                    len(sides),
+                ),
+            "game_id":
+                np.tile(
+                    df["game_id"].to_numpy(),
+                    len(sides),
+                ),
+            "market":
+                market,
+            "side":
+                np.repeat(
+                    list(sides),
+                    rows,
+                ),
+            "prob_for_ev":
+                stacked(
+                    lambda side: f"{side}_prob_for_ev"
+                ),
+            "prob_for_kelly":
+                stacked(
+                    lambda side: f"{side}_prob_for_kelly"
+                ),
+            "dk_decimal":
+                stacked(
+                    lambda side: sides[side]["decimal"]
+                ),
+            "ev":
+                stacked(
+                    lambda side: sides[side]["ev"]
+                ),
+            "raw_kelly":
+                stacked(
+                    lambda side: sides[side]["raw_kelly"]
+                ),
+            "kelly":
+                stacked(
+                    lambda side: sides[side]["kelly"]
+                ),
+            "ev_probability_source":
+                stacked(
+                    lambda side: f"{side}_ev_probability_source"
+                ),
+            "kelly_probability_source":
+                stacked(
+                    lambda side: f"{side}_kelly_probability_source"
+                ),
+            "status":
+                "ok",
+        },
+        columns=AUDIT_COLUMNS,
+    )
 
 
 # =========================
 # MARKET PROCESSORS
 # =========================
 
-def process_moneyline(
+def process_market(
     df: pd.DataFrame,
+    market: str,
     file_name: str,
 ):
-    (
-        home_prob,
-        home_basis,
-    ) = probability_basis_columns(
-        df,
-        "home",
-        PROBABILITY_SOURCES[
-            "moneyline"
-        ]["home"],
+    sides = EV_KELLY_COLUMNS[market]
+    label = market.replace("_", " ")
+    push_aware = all(
+        "loss" in spec
+        for spec in sides.values()
     )
 
-    (
-        away_prob,
-        away_basis,
-    ) = probability_basis_columns(
-        df,
-        "away",
-        PROBABILITY_SOURCES[
-            "moneyline"
-        ]["away"],
-    )
+    basis_columns = {}
+    probabilities = []
 
-    home_ev = compute_binary_ev(
-        home_prob,
-        df[
-            "home_dk_decimal_moneyline"
-        ],
-    )
-
-    away_ev = compute_binary_ev(
-        away_prob,
-        df[
-            "away_dk_decimal_moneyline"
-        ],
-    )
-
-    home_raw_kelly = (
-        compute_binary_kelly_raw(
-            home_prob,
-            df[
-                "home_dk_decimal_moneyline"
-            ],
-        )
-    )
-
-    away_raw_kelly = (
-        compute_binary_kelly_raw(
-            away_prob,
-            df[
-                "away_dk_decimal_moneyline"
-            ],
+    for side in sides:
+        (
+            probability,
+            basis,
+        ) = probability_basis_columns(
+            df,
+            side,
+            PROBABILITY_SOURCES[
+                market
+            ][side],
         )
-    )
-
-    validate_ev_kelly_sign_consistency(
-        df["game_id"],
-        home_ev,
-        home_raw_kelly,
-        f"{file_name} home moneyline",
-    )
-
-    validate_ev_kelly_sign_consistency(
-        df["game_id"],
-        away_ev,
-        away_raw_kelly,
-        f"{file_name} away moneyline",
-    )
-
-    (
-        home_kelly,
-        home_neg,
-    ) = clip_negative_kelly(
-        home_raw_kelly,
-        file_name,
-        "home moneyline",
-    )
-
-    (
-        away_kelly,
-        away_neg,
-    ) = clip_negative_kelly(
-        away_raw_kelly,
-        file_name,
-        "away moneyline",
-    )
-
-    df = add_columns_at_once(
-        df,
-        {
-            **home_basis,
-            **away_basis,
-            "home_ml_ev":
-                home_ev,
-            "away_ml_ev":
-                away_ev,
-            "home_ml_kelly_raw":
-                home_raw_kelly,
-            "away_ml_kelly_raw":
-                away_raw_kelly,
-            "home_ml_kelly":
-                home_kelly,
-            "away_ml_kelly":
-                away_kelly,
-        },
-    )
 
-    mismatch_count = (
-        probability_source_mismatch_count(
-            df,
-            [
-                "home",
-                "away",
-            ],
+        probabilities.append(
+            probability.to_numpy(
+                dtype=float,
+            )
         )
-    )
 
-    if mismatch_count:
-        raise ValueError(
-            f"{file_name} EV/Kelly probability "
-            f"basis mismatch rows="
-            f"{mismatch_count}"
+        basis_columns.update(
+            basis
         )
 
-    audit = audit_rows(
-        df,
-        "moneyline",
+    decimal_odds = np.vstack(
         [
-            "home",
-            "away",
-        ],
-        {
-            "home":
-                "home_dk_decimal_moneyline",
-            "away":
-                "away_dk_decimal_moneyline",
-        },
-        {
-            "home":
-                "home_ml_ev",
-            "away":
-                "away_ml_ev",
-        },
-        {
-            "home":
-                "home_ml_kelly_raw",
-            "away":
-                "away_ml_kelly_raw",
-        },
-        {
-            "home":
-                "home_ml_kelly",
-            "away":
-                "away_ml_kelly",
-        },
+            pd.to_numeric(
+                df[spec["decimal"]],
+                errors="coerce",
+            ).to_numpy(dtype=float)
+            for spec in sides.values()
+        ]
     )
 
-    return (
-        df,
-        home_neg + away_neg,
-        mismatch_count,
-        audit,
+    p_win = np.vstack(
+        probabilities
     )
 
+    p_loss = None
 
-def process_run_line(
-    df: pd.DataFrame,
-    file_name: str,
-):
-    (
-        home_prob,
-        home_basis,
-    ) = probability_basis_columns(
-        df,
-        "home",
-        PROBABILITY_SOURCES[
-            "run_line"
-        ]["home"],
-    )
-
-    (
-        away_prob,
-        away_basis,
-    ) = probability_basis_columns(
-        df,
-        "away",
-        PROBABILITY_SOURCES[
-            "run_line"
-        ]["away"],
-    )
+    if push_aware:
+        p_loss = np.vstack(
+            [
+                pd.to_numeric(
+                    df[spec["loss"]],
+                    errors="coerce",
+                ).to_numpy(dtype=float)
+                for spec in sides.values()
+            ]
+        )
 
-    home_ev = compute_binary_ev(
-        home_prob,
-        df[
-            "home_dk_run_line_decimal"
-        ],
-    )
+        for i, side in enumerate(sides):
+            validate_total_kelly_inputs(
+                pd.Series(
+                    p_win[i],
+                    index=df.index,
+                ),
+                pd.Series(
+                    p_loss[i],
+                    index=df.index,
+                ),
+                pd.Series(
+                    decimal_odds[i],
+                    index=df.index,
+                ),
+                df["game_id"],
+                f"{file_name} {side} {label}",
+            )
 
-    away_ev = compute_binary_ev(
-        away_prob,
-        df[
-            "away_dk_run_line_decimal"
-        ],
+    # Every side of the market in one (sides x games) kernel call.
+    ev, raw_kelly = ev_kelly_arrays(
+        p_win,
+        decimal_odds,
+        p_loss,
     )
 
-    home_raw_kelly = (
-        compute_binary_kelly_raw(
-            home_prob,
-            df[
-                "home_dk_run_line_decimal"
-            ],
+    ev = {
+        side: pd.Series(
+            ev[i],
+            index=df.index,
         )
-    )
+        for i, side in enumerate(sides)
+    }
 
-    away_raw_kelly = (
-        compute_binary_kelly_raw(
-            away_prob,
-            df[
-                "away_dk_run_line_decimal"
-            ],
+    raw_kelly = {
+        side: pd.Series(
+            raw_kelly[i],
+            index=df.index,
         )
-    )
+        for i, side in enumerate(sides)
+    }
 
-    validate_ev_kelly_sign_consistency(
-        df["game_id"],
-        home_ev,
-        home_raw_kelly,
-        f"{file_name} home run line",
-    )
+    for side in sides:
+        validate_ev_kelly_sign_consistency(
+            df["game_id"],
+            ev[side],
+            raw_kelly[side],
+            f"{file_name} {side} {label}",
+        )
 
-    validate_ev_kelly_sign_consistency(
-        df["game_id"],
-        away_ev,
-        away_raw_kelly,
-        f"{file_name} away run line",
-    )
+    kelly = {}
+    neg_kelly = 0
 
-    (
-        home_kelly,
-        home_neg,
-    ) = clip_negative_kelly(
-        home_raw_kelly,
-        file_name,
-        "home run line",
-    )
+    for side in sides:
+        (
+            kelly[side],
+            clipped,
+        ) = clip_negative_kelly(
+            raw_kelly[side],
+            file_name,
+            f"{side} {label}",
+        )
 
-    (
-        away_kelly,
-        away_neg,
-    ) = clip_negative_kelly(
-        away_raw_kelly,
-        file_name,
-        "away run line",
-    )
+        neg_kelly += clipped
 
     df = add_columns_at_once(
         df,
         {
-            **home_basis,
-            **away_basis,
-            "home_rl_ev":
-                home_ev,
-            "away_rl_ev":
-                away_ev,
-            "home_rl_kelly_raw":
-                home_raw_kelly,
-            "away_rl_kelly_raw":
-                away_raw_kelly,
-            "home_rl_kelly":
-                home_kelly,
-            "away_rl_kelly":
-                away_kelly,
+            **basis_columns,
+            **{
+                sides[side]["ev"]: ev[side]
+                for side in sides
+            },
+            **{
+                sides[side]["raw_kelly"]: raw_kelly[side]
+                for side in sides
+            },
+            **{
+                sides[side]["kelly"]: kelly[side]
+                for side in sides
+            },
         },
     )
 
     mismatch_count = (
         probability_source_mismatch_count(
             df,
-            [
-                "home",
-                "away",
-            ],
+            list(sides),
         )
     )
 
@@ -1514,242 +1584,101 @@ def process_run_line(
             f"{mismatch_count}"
         )
 
-    audit = audit_rows(
-        df,
-        "run_line",
-        [
-            "home",
-            "away",
-        ],
-        {
-            "home":
-                "home_dk_run_line_decimal",
-            "away":
-                "away_dk_run_line_decimal",
-        },
-        {
-            "home":
-                "home_rl_ev",
-            "away":
-                "away_rl_ev",
-        },
-        {
-            "home":
-                "home_rl_kelly_raw",
-            "away":
-                "away_rl_kelly_raw",
-        },
-        {
-            "home":
-                "home_rl_kelly",
-            "away":
-                "away_rl_kelly",
-        },
-    )
-
     return (
         df,
-        home_neg + away_neg,
+        neg_kelly,
         mismatch_count,
-        audit,
+        audit_frame(
+            df,
+            market,
+        ),
     )
 
 
-def process_total(
+def process_moneyline(
     df: pd.DataFrame,
     file_name: str,
 ):
-    (
-        over_prob,
-        over_basis,
-    ) = probability_basis_columns(
-        df,
-        "over",
-        PROBABILITY_SOURCES[
-            "total"
-        ]["over"],
-    )
-
-    (
-        under_prob,
-        under_basis,
-    ) = probability_basis_columns(
+    return process_market(
         df,
-        "under",
-        PROBABILITY_SOURCES[
-            "total"
-        ]["under"],
+        "moneyline",
+        file_name,
     )
 
-    over_loss = pd.to_numeric(
-        df[
-            "over_model_prob_total_loss"
-        ],
-        errors="coerce",
-    )
 
-    under_loss = pd.to_numeric(
-        df[
-            "under_model_prob_total_loss"
-        ],
-        errors="coerce",
+def process_run_line(
+    df: pd.DataFrame,
+    file_name: str,
+):
+    return process_market(
+        df,
+        "run_line",
+        file_name,
     )
 
-    over_ev = compute_total_ev(
-        over_prob,
-        over_loss,
-        df[
-            "dk_total_over_decimal"
-        ],
-    )
 
-    under_ev = compute_total_ev(
-        under_prob,
-        under_loss,
-        df[
-            "dk_total_under_decimal"
-        ],
+def process_total(
+    df: pd.DataFrame,
+    file_name: str,
+):
+    return process_market(
+        df,
+        "total",
+        file_name,
     )
 
-    over_raw_kelly = (
-        compute_total_kelly_raw(
-            over_prob,
-            over_loss,
-            df[
-                "dk_total_over_decimal"
-            ],
-            df["game_id"],
-            f"{file_name} over total",
-        )
-    )
 
-    under_raw_kelly = (
-        compute_total_kelly_raw(
-            under_prob,
-            under_loss,
-            df[
-                "dk_total_under_decimal"
-            ],
-            df["game_id"],
-            f"{file_name} under total",
-        )
-    )
+# =========================
+# MAIN
+# =========================
 
-    validate_ev_kelly_sign_consistency(
-        df["game_id"],
-        over_ev,
-        over_raw_kelly,
-        f"{file_name} over total",
-    )
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
 
-    validate_ev_kelly_sign_consistency(
-        df["game_id"],
-        under_ev,
-        under_raw_kelly,
-        f"{file_name} under total",
+    parser.add_argument(
+        "dates",
+        nargs="*",
+        help=(
+            "Optional date(s) to rebuild "
+            "(YYYY_MM_DD or YYYY-MM-DD); "
+            "omit to rebuild every slate."
+        ),
     )
 
-    (
-        over_kelly,
-        over_neg,
-    ) = clip_negative_kelly(
-        over_raw_kelly,
-        file_name,
-        "over total",
-    )
+    return parser.parse_args(argv)
 
-    (
-        under_kelly,
-        under_neg,
-    ) = clip_negative_kelly(
-        under_raw_kelly,
-        file_name,
-        "under total",
-    )
 
-    df = add_columns_at_once(
-        df,
-        {
-            **over_basis,
-            **under_basis,
-            "over_ev":
-                over_ev,
-            "under_ev":
-                under_ev,
-            "over_kelly_raw":
-                over_raw_kelly,
-            "under_kelly_raw":
-                under_raw_kelly,
-            "over_kelly":
-                over_kelly,
-            "under_kelly":
-                under_kelly,
-        },
-    )
+def load_season_audit():
+    """Load the shared season-audit helpers (scripts/season_audit.py) once per process."""
+    module = sys.modules.get("mlb_season_audit")
 
-    mismatch_count = (
-        probability_source_mismatch_count(
-            df,
-            [
-                "over",
-                "under",
-            ],
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            "mlb_season_audit",
+            SEASON_AUDIT_SCRIPT,
         )
-    )
 
-    if mismatch_count:
-        raise ValueError(
-            f"{file_name} EV/Kelly probability "
-            f"basis mismatch rows="
-            f"{mismatch_count}"
-        )
+        if spec is None or spec.loader is None:
+            raise RuntimeError(
+                f"Could not load season audit helpers: {SEASON_AUDIT_SCRIPT}"
+            )
 
-    audit = audit_rows(
-        df,
-        "total",
-        [
-            "over",
-            "under",
-        ],
-        {
-            "over":
-                "dk_total_over_decimal",
-            "under":
-                "dk_total_under_decimal",
-        },
-        {
-            "over":
-                "over_ev",
-            "under":
-                "under_ev",
-        },
-        {
-            "over":
-                "over_kelly_raw",
-            "under":
-                "under_kelly_raw",
-        },
-        {
-            "over":
-                "over_kelly",
-            "under":
-                "under_kelly",
-        },
-    )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["mlb_season_audit"] = module
 
-    return (
-        df,
-        over_neg + under_neg,
-        mismatch_count,
-        audit,
-    )
+    return module
 
 
-# =========================
-# MAIN
-# =========================
+def main(argv=None):
+    dates = sorted(
+        {
+            value.strip().replace("-", "_")
+            for value in parse_args(argv).dates
+        }
+    )
+    prefixes = dates or [""]
 
-def main():
     with open(
         LOG_FILE,
         "w",
@@ -1775,7 +1704,7 @@ def main():
     }
 
     per_file = []
-    all_audit_rows = []
+    audit_frames = []
 
     _log(
         f"INPUT_DIR : {INPUT_DIR}"
@@ -1785,6 +1714,10 @@ def main():
         f"OUTPUT_DIR: {OUTPUT_DIR}"
     )
 
+    _log(
+        f"INTERCHANGE: {load_interchange().INTERCHANGE}"
+    )
+
     _log(
         "EV AND KELLY USE THE SAME "
         "CANONICAL MODEL PROBABILITY BASIS"
@@ -1795,23 +1728,36 @@ def main():
         "pushes are neither wins nor losses."
     )
 
+    if dates:
+        _log(
+            f"Date-scoped rebuild: {dates}"
+        )
+
     input_files = sorted(
-        INPUT_DIR.glob("*.csv")
+        path
+        for prefix in prefixes
+        for path in INPUT_DIR.glob(
+            f"{prefix}*.csv"
+        )
     )
 
     _log(
         f"Files found: {len(input_files)}"
     )
 
-    for out_file in OUTPUT_DIR.glob(
-        "*.csv"
-    ):
-        out_file.unlink()
+    for prefix in prefixes:
+        for out_file in OUTPUT_DIR.glob(
+            f"{prefix}*.csv"
+        ):
+            load_interchange().remove_output(
+                out_file
+            )
 
-    for old_audit in AUDIT_DIR.glob(
-        "*.csv"
-    ):
-        old_audit.unlink()
+    if not dates:
+        for old_audit in AUDIT_DIR.glob(
+            "*.csv"
+        ):
+            old_audit.unlink()
 
     for input_file in input_files:
         name = input_file.name.lower()
@@ -1966,7 +1912,7 @@ def main():
                 "audit_rows"
             ] += len(audit)
 
-            all_audit_rows.extend(
+            audit_frames.append(
                 audit
             )
 
@@ -1980,6 +1926,11 @@ def main():
                 output_path,
             )
 
+            write_columnar(
+                df,
+                output_path,
+            )
+
             summary[
                 "files_processed"
             ] += 1
@@ -2009,25 +1960,21 @@ def main():
         / "post_ev_kelly_audit.csv"
     )
 
-    audit_columns = [
-        "date",
-        "game_id",
-        "market",
-        "side",
-        "prob_for_ev",
-        "prob_for_kelly",
-        "dk_decimal",
-        "ev",
-        "raw_kelly",
-        "kelly",
-        "ev_probability_source",
-        "kelly_probability_source",
-        "status",
-    ]
+    if audit_frames:
+        audit_df = pd.concat(
+            audit_frames,
+            ignore_index=True,
+        )
+
+    else:
+        audit_df = pd.DataFrame(
+            columns=AUDIT_COLUMNS,
+        )
 
-    audit_df = pd.DataFrame(
-        all_audit_rows,
-        columns=audit_columns,
+    audit_df = load_season_audit().merge_season_audit(
+        audit_df,
+        audit_path,
+        dates,
     )
 
     write_csv_checked(
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 # docs/win/baseball/scripts/04_select/baseball_select_bets.py
+import argparse
+import importlib.util
+import sys
 import traceback
 from datetime import datetime, UTC
 from pathlib import Path
@@ -14,6 +17,8 @@ CONFIG_PATH = Path("docs/win/baseball/mlb/config/markets.yaml")
 AUDIT_DIR = OUTPUT_DIR / "audit"
 ERROR_DIR = Path("docs/win/baseball/mlb/errors/04_select")
 LOG_FILE = ERROR_DIR / "select_bets.txt"
+SEASON_AUDIT_SCRIPT = Path("docs/win/baseball/mlb/scripts/season_audit.py")
+INTERCHANGE_SCRIPT = Path("docs/win/baseball/mlb/scripts/interchange.py")
 
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 AUDIT_DIR.mkdir(parents=True, exist_ok=True)
@@ -228,6 +233,7 @@ SELECTED_AUDIT_COLUMNS = [
 ]
 
 RUN_LINE_AUDIT_COLUMNS = [
+    "date",
     "game_id",
     "side",
     "line",
@@ -348,8 +354,21 @@ def validate_unique_game_id(df: pd.DataFrame, label: str) -> None:
         raise ValueError(f"{label} has multiple rows for one game_id: {counts}")
 
 
+def load_interchange():
+    """Load the shared stage interchange helpers (scripts/interchange.py) once per process."""
+    module = sys.modules.get("mlb_interchange")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("mlb_interchange", INTERCHANGE_SCRIPT)
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"Could not load interchange helpers: {INTERCHANGE_SCRIPT}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["mlb_interchange"] = module
+    return module
+
+
 def read_market_csv(path: Path, required_columns: list, label: str) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    df = load_interchange().read_interchange(path)
 
     validate_no_duplicate_columns(df, label)
     validate_required_columns(df, required_columns, label)
@@ -399,6 +418,13 @@ def write_output_csv(df: pd.DataFrame, path: Path, label: str) -> dict:
     validate_no_duplicate_columns(df, label)
     counts = validate_selected_output(df, label)
     df.to_csv(path, index=False)
+    # Selections are the last stage: nothing downstream reads a handoff.
+    load_interchange().write_columnar(
+        df,
+        path,
+        warn=lambda msg: _log(msg, "WARN"),
+        handoff=False,
+    )
     return counts
 
 
@@ -1224,16 +1250,43 @@ def process_total(row, counters, rejection_rows):
 # RUN MODE
 # =========================
 
-def choose_slates(slates: dict) -> tuple[list, str]:
+def choose_slates(slates: dict, dates=None) -> tuple[list, str]:
     available = sorted(slates)
+    if dates:
+        return [slate for slate in available if slate in dates], "rebuild_dates"
     return available, "rebuild_all"
 
 
+def load_season_audit():
+    """Load the shared season-audit helpers (scripts/season_audit.py) once per process."""
+    module = sys.modules.get("mlb_season_audit")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("mlb_season_audit", SEASON_AUDIT_SCRIPT)
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"Could not load season audit helpers: {SEASON_AUDIT_SCRIPT}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["mlb_season_audit"] = module
+    return module
+
+
 # =========================
 # MAIN
 # =========================
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "dates",
+        nargs="*",
+        help="Optional date(s) to rebuild (YYYY_MM_DD or YYYY-MM-DD); omit to rebuild every slate.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    dates = sorted({value.strip().replace("-", "_") for value in parse_args(argv).dates})
+
     with open(LOG_FILE, "w", encoding="utf-8") as f:
         f.write(f"=== MLB select_bets RUN {_now()} ===\n")
 
@@ -1275,13 +1328,19 @@ def main():
     rejection_rows = []
     run_line_audit_rows = []
 
-    for old in OUTPUT_DIR.glob("*.csv"):
-        old.unlink()
-    for old in AUDIT_DIR.glob("*.csv"):
-        old.unlink()
+    if dates:
+        for date in dates:
+            for old in OUTPUT_DIR.glob(f"{date}_*.csv"):
+                load_interchange().remove_output(old)
+    else:
+        for old in OUTPUT_DIR.glob("*.csv"):
+            load_interchange().remove_output(old)
+        for old in AUDIT_DIR.glob("*.csv"):
+            old.unlink()
 
     _log(f"INPUT_DIR : {INPUT_DIR}")
     _log(f"OUTPUT_DIR: {OUTPUT_DIR}")
+    _log(f"INTERCHANGE: {load_interchange().INTERCHANGE}")
     _log(
         f"Rain filter: will_it_rain={FILTERS.get('rain_exclude_on_will_it_rain', True)} "
         f"symbol_code={FILTERS.get('rain_exclude_on_symbol_code', False)} "
@@ -1312,7 +1371,7 @@ def main():
 
         summary["slates_found"] = len(slates)
 
-        slate_keys, run_mode = choose_slates(slates)
+        slate_keys, run_mode = choose_slates(slates, dates)
         summary["run_mode"] = run_mode
         _log(f"Selected run mode: {run_mode}")
         _log(f"Slate keys to process: {slate_keys}")
@@ -1343,6 +1402,7 @@ def main():
             }
 
             _log(f"--- SLATE: {slate}")
+            run_line_audit_start = len(run_line_audit_rows)
 
             try:
                 summary["slates_processed"] += 1
@@ -1642,6 +1702,10 @@ def main():
                 ps["status"] = "error"
                 summary["errors"] += 1
 
+            # Run-line audit rows carry their slate so a date-scoped rebuild can replace them.
+            for audit_row in run_line_audit_rows[run_line_audit_start:]:
+                audit_row["date"] = slate
+
             per_slate.append(ps)
 
         summary["counters"] = global_counters
@@ -1654,6 +1718,12 @@ def main():
         selected_audit_path = AUDIT_DIR / "selected_bet_audit.csv"
         run_line_audit_path = AUDIT_DIR / "run_line_selection_audit.csv"
 
+        if dates:
+            season_audit = load_season_audit()
+            rejection_df = season_audit.merge_season_audit(rejection_df, rejection_audit_path, dates)
+            selected_audit_df = season_audit.merge_season_audit(selected_audit_df, selected_audit_path, dates)
+            run_line_audit_df = season_audit.merge_season_audit(run_line_audit_df, run_line_audit_path, dates)
+
         rejection_df.to_csv(rejection_audit_path, index=False)
         selected_audit_df.to_csv(selected_audit_path, index=False)
         run_line_audit_df.to_csv(run_line_audit_path, index=False)
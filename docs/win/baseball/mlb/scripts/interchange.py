@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# docs/win/baseball/mlb/scripts/interchange.py
+#
+# Stage boundary reads and writes shared by the slate pipeline
+# (01_merge/merge_intake.py, 01_merge/build_juice_files.py,
+# 03_edges/compute_edges.py, 03_edges/compute_ev_kelly.py,
+# 04_select/baseball_select_bets.py).
+#
+# The CSVs are always written as the human-readable export. Two faster paths
+# sit next to them:
+#   - MLB_INTERCHANGE=parquet: every boundary CSV gets a typed Parquet twin
+#     under <csv dir>/columnar/, and a reader uses the twin when it is at least
+#     as new as the CSV.
+#   - run_stages.py --in-process sets FRAME_HANDOFF to one dict for the whole
+#     run; a frame written by one stage is then read from memory by the next.
+#     Keys are str(Path(csv_path)), so writer and reader agree however the path
+#     was spelled.
+#
+# The stages load this file by path under one sys.modules name, so they all
+# share FRAME_HANDOFF; run_stages.py hashes it into every stage's fingerprint.
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+INTERCHANGE = os.environ.get("MLB_INTERCHANGE", "csv").strip().lower()
+COLUMNAR_DIRNAME = "columnar"
+
+FRAME_HANDOFF = None
+
+
+def _handoff_key(csv_path) -> str:
+    return str(Path(csv_path))
+
+
+def columnar_path(csv_path) -> Path:
+    csv_path = Path(csv_path)
+    return csv_path.parent / COLUMNAR_DIRNAME / f"{csv_path.stem}.parquet"
+
+
+def read_interchange(csv_path, guard=None) -> pd.DataFrame:
+    """Read a stage boundary file: handed-off frame, current Parquet twin, then CSV.
+
+    guard, when given, is called with the path actually read (the CSV path for a
+    handed-off frame) before it is read.
+    """
+    csv_path = Path(csv_path)
+    key = _handoff_key(csv_path)
+
+    if FRAME_HANDOFF is not None and key in FRAME_HANDOFF:
+        if guard is not None:
+            guard(csv_path)
+        return FRAME_HANDOFF.pop(key)
+
+    parquet_path = columnar_path(csv_path)
+
+    if (
+        INTERCHANGE == "parquet"
+        and parquet_path.exists()
+        and parquet_path.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns
+    ):
+        if guard is not None:
+            guard(parquet_path)
+        return pd.read_parquet(parquet_path)
+
+    if guard is not None:
+        guard(csv_path)
+    return pd.read_csv(csv_path)
+
+
+def write_columnar(df, csv_path, warn=print, handoff=True) -> Path | None:
+    """Pass on the frame just written to csv_path and return its Parquet twin, if written.
+
+    The frame is handed off when FRAME_HANDOFF is set (unless handoff is False).
+    df=None reads the CSV back, and only when a twin is needed. Outside parquet
+    mode any old twin is removed so it cannot go stale; a twin that cannot be
+    written is removed and reported through warn.
+    """
+    csv_path = Path(csv_path)
+
+    if handoff and df is not None and FRAME_HANDOFF is not None:
+        FRAME_HANDOFF[_handoff_key(csv_path)] = df
+
+    parquet_path = columnar_path(csv_path)
+
+    if INTERCHANGE != "parquet":
+        parquet_path.unlink(missing_ok=True)
+        return None
+
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        if df is None:
+            df = pd.read_csv(csv_path)
+        df.to_parquet(parquet_path, index=False)
+    except (ImportError, TypeError, ValueError) as e:
+        parquet_path.unlink(missing_ok=True)
+        warn(f"Parquet twin not written for {csv_path}: {e}")
+        return None
+
+    return parquet_path
+
+
+def remove_output(csv_path) -> None:
+    """Delete a boundary CSV together with its Parquet twin and any pending handoff."""
+    csv_path = Path(csv_path)
+
+    csv_path.unlink(missing_ok=True)
+    columnar_path(csv_path).unlink(missing_ok=True)
+
+    if FRAME_HANDOFF is not None:
+        FRAME_HANDOFF.pop(_handoff_key(csv_path), None)
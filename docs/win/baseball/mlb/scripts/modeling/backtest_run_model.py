@@ -0,0 +1,647 @@
+#!/usr/bin/env python3
+"""Walk-forward retrain and backtest for the MLB home-run and away-run models.
+
+Input:
+    docs/win/baseball/mlb/modeling/data/mlb_run_training_set.csv
+    docs/win/baseball/mlb/models/run_projection/*_metadata.json (--params production only)
+    docs/win/baseball/mlb/00_intake/sportsbook/{date}_MLB.csv
+
+Outputs:
+    docs/win/baseball/mlb/modeling/backtest/fold_run_metrics.csv
+    docs/win/baseball/mlb/modeling/backtest/fold_market_metrics.csv
+    docs/win/baseball/mlb/modeling/backtest/fold_predictions.csv
+    docs/win/baseball/mlb/modeling/backtest/folds/{fold_key}/  (cached fold)
+
+Each fold retrains both models on the games before its cutoff date and scores
+the next --cadence-days of games. The training window either expands from
+the first date or rolls over the last --window-days. Folds are fit in a
+process pool. A fold's fitted models and predictions are cached under a key
+hashed from its data and settings, so rerunning with one more week of games
+only fits the folds that changed.
+
+Hyperparameters are selected per fold on the last VALIDATION_FRACTION of
+that fold's training dates, as train_run_model.py does, before refitting on the
+whole window (--params grid, the default, or halving).
+
+--params production instead reuses the saved production selected_hyperparameters
+in every fold. Those were chosen on validation dates later than most fold
+cutoffs, so early folds see the future through their hyperparameters and the
+decay and cadence metrics come out optimistic. It is a quick check, not a
+backtest: every report row carries params_mode and lookahead_params=True so
+such runs cannot be mistaken for leak-free ones.
+
+Per-fold metrics reuse evaluate_run_model.py: run MAE and Poisson deviance
+against DRatings, market calibration error and EV summaries. A fold without
+sportsbook files keeps its run metrics and skips the market ones.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from threadpoolctl import threadpool_limits
+
+import evaluate_run_model as erm
+import train_run_model as trm
+
+
+BASE_DIR = Path("docs/win/baseball/mlb")
+
+DEFAULT_INPUT = BASE_DIR / "modeling/data/mlb_run_training_set.csv"
+DEFAULT_MODEL_DIR = BASE_DIR / "models/run_projection"
+DEFAULT_SPORTSBOOK_DIR = BASE_DIR / "00_intake/sportsbook"
+DEFAULT_OUTPUT_DIR = BASE_DIR / "modeling/backtest"
+
+ERROR_DIR = BASE_DIR / "errors/modeling"
+LOG_FILE = ERROR_DIR / "backtest_run_model.txt"
+
+REPORT_FILES = {
+    "run_metrics": "fold_run_metrics.csv",
+    "market_metrics": "fold_market_metrics.csv",
+    "predictions": "fold_predictions.csv",
+}
+
+WINDOW_MODES = ["expanding", "rolling"]
+PARAM_MODES = ["grid", "halving", "production"]
+
+MIN_TRAIN_DATES = 30
+VALIDATION_FRACTION = 0.20
+
+PREDICTION_COLUMNS = [
+    "game_id",
+    "game_date",
+    "model_home_runs",
+    "model_away_runs",
+]
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _log(message: str, level: str = "INFO") -> None:
+    ERROR_DIR.mkdir(parents=True, exist_ok=True)
+    with LOG_FILE.open("a", encoding="utf-8") as f:
+        f.write(f"{_now()} | {level:<5} | {message.rstrip()}\n")
+
+
+def fail(message: str) -> None:
+    _log(message, "ERROR")
+    raise RuntimeError(message)
+
+
+def load_backtest_frame(path: Path) -> tuple[pd.DataFrame, list[str]]:
+    df = trm.load_training_set(path)
+    feature_columns = trm.determine_feature_columns(df)
+    df = trm.coerce_and_validate_training_data(df, feature_columns)
+
+    df["game_id"] = erm.normalize_game_id(df["game_id"])
+
+    if df["game_id"].isna().any():
+        fail("Training set contains blank game_id values")
+
+    duplicates = df["game_id"].duplicated(keep=False)
+    if duplicates.any():
+        sample = df.loc[
+            duplicates,
+            ["game_date", "game_id"],
+        ].head(10).to_dict("records")
+        fail(f"Training set contains duplicate game_id values; sample={sample}")
+
+    for col in [
+        "dratings_home_projected_runs",
+        "dratings_away_projected_runs",
+    ]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    df = df.sort_values(
+        ["_game_date_dt", "game_id"],
+        kind="mergesort",
+    ).reset_index(drop=True)
+
+    return df, feature_columns
+
+
+def production_hyperparameters(model_dir: Path) -> dict[str, dict]:
+    params = {}
+
+    for side in trm.SIDE_COLUMNS:
+        path = model_dir / f"{side}_runs_model_metadata.json"
+        metadata = erm.load_json(path, f"{side} model metadata")
+        selected = metadata.get("selected_hyperparameters")
+
+        if not isinstance(selected, dict):
+            fail(f"{path} has no selected_hyperparameters")
+
+        params[side] = selected
+
+    return params
+
+
+# ─────────────────────────────────────────────
+# FOLDS
+# ─────────────────────────────────────────────
+
+def build_folds(
+    dates: pd.Series,
+    cadence_days: int,
+    window: str,
+    window_days: int,
+    min_train_days: int,
+) -> list[dict]:
+    """
+    Calendar folds: [train_start, cutoff) trains, [cutoff, cutoff + cadence)
+    scores. Folds whose windows hold no games are dropped by the caller.
+    """
+    unique_dates = pd.Series(sorted(dates.drop_duplicates()))
+    first = unique_dates.iloc[0]
+    last = unique_dates.iloc[-1]
+
+    folds = []
+    cutoff = first + pd.Timedelta(days=min_train_days)
+
+    while cutoff <= last:
+        test_end = cutoff + pd.Timedelta(days=cadence_days)
+
+        if window == "rolling":
+            train_start = max(first, cutoff - pd.Timedelta(days=window_days))
+        else:
+            train_start = first
+
+        folds.append(
+            {
+                "fold": len(folds) + 1,
+                "train_start": train_start,
+                "cutoff": cutoff,
+                "test_end": test_end,
+            }
+        )
+
+        cutoff = test_end
+
+    return folds
+
+
+def fold_frames(
+    df: pd.DataFrame,
+    fold: dict,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    dates = df["_game_date_dt"]
+
+    train = df[(dates >= fold["train_start"]) & (dates < fold["cutoff"])]
+    test = df[(dates >= fold["cutoff"]) & (dates < fold["test_end"])]
+
+    return train, test
+
+
+def fold_key(
+    train: pd.DataFrame,
+    test: pd.DataFrame,
+    feature_columns: list[str],
+    settings: dict,
+) -> str:
+    hasher = hashlib.sha256()
+    hasher.update(
+        json.dumps(
+            {
+                "settings": settings,
+                "feature_columns": feature_columns,
+            },
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    )
+
+    columns = ["game_id", "game_date"] + feature_columns + trm.TARGET_COLUMNS
+
+    for frame in [train, test]:
+        hasher.update(
+            pd.util.hash_pandas_object(
+                frame[columns],
+                index=False,
+            ).to_numpy().tobytes()
+        )
+
+    return hasher.hexdigest()[:20]
+
+
+def split_validation(
+    train: pd.DataFrame,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    unique_dates = sorted(train["_game_date_dt"].drop_duplicates())
+    n_validation = max(1, int(np.ceil(len(unique_dates) * VALIDATION_FRACTION)))
+    validation_start = unique_dates[len(unique_dates) - n_validation]
+
+    return (
+        train[train["_game_date_dt"] < validation_start],
+        train[train["_game_date_dt"] >= validation_start],
+    )
+
+
+_THREAD_LIMIT = None
+
+
+def _init_fold_worker() -> None:
+    global _THREAD_LIMIT
+
+    # One OpenMP thread per process; the pool supplies the parallelism.
+    _THREAD_LIMIT = threadpool_limits(limits=1)
+
+
+def run_fold(task: tuple) -> tuple[dict, pd.DataFrame, bool]:
+    """Fits one fold (or reuses its cache) and returns its test predictions."""
+    fold, train, test, feature_columns, settings, params, cache_dir = task
+
+    key = fold_key(train, test, feature_columns, settings)
+    fold_dir = cache_dir / key
+    predictions_path = fold_dir / "predictions.csv"
+    fold_info_path = fold_dir / "fold.json"
+
+    if predictions_path.exists() and fold_info_path.exists():
+        predictions = pd.read_csv(
+            predictions_path,
+            dtype={"game_id": "string", "game_date": "string"},
+        )
+        fold_info = json.loads(fold_info_path.read_text(encoding="utf-8"))
+        fold_info["fold"] = fold["fold"]
+        return fold_info, predictions, True
+
+    if params is None:
+        search_train, search_validation = split_validation(train)
+        selections = trm.select_hyperparameters(
+            search_train,
+            search_validation,
+            feature_columns,
+            {
+                side: target_column
+                for side, (target_column, _) in trm.SIDE_COLUMNS.items()
+            },
+            settings["params"],
+            1,
+        )
+        params = {side: selection[0] for side, selection in selections.items()}
+
+    fold_dir.mkdir(parents=True, exist_ok=True)
+    predictions = test[["game_id", "game_date"]].copy()
+
+    for side, (target_column, _) in trm.SIDE_COLUMNS.items():
+        model = trm.build_model(params[side])
+        model.fit(train[feature_columns], train[target_column])
+
+        predicted = np.asarray(model.predict(test[feature_columns]), dtype=float)
+
+        if np.any(~np.isfinite(predicted)) or np.any(predicted < 0):
+            fail(f"fold {fold['fold']} {side} model produced invalid predictions")
+
+        predictions[f"model_{side}_runs"] = predicted
+        joblib.dump(model, fold_dir / f"{side}_runs_model.joblib")
+
+    fold_info = {
+        "fold": fold["fold"],
+        "fold_key": key,
+        "train_start_date": pd.Timestamp(fold["train_start"]).strftime("%Y-%m-%d"),
+        "cutoff_date": pd.Timestamp(fold["cutoff"]).strftime("%Y-%m-%d"),
+        "test_end_date": (
+            pd.Timestamp(fold["test_end"]) - pd.Timedelta(days=1)
+        ).strftime("%Y-%m-%d"),
+        "training_row_count": int(len(train)),
+        "test_row_count": int(len(test)),
+        "selected_hyperparameters": params,
+        "created_at": _now(),
+    }
+
+    predictions[PREDICTION_COLUMNS].to_csv(predictions_path, index=False)
+    fold_info_path.write_text(
+        json.dumps(fold_info, indent=2) + "\n",
+        encoding="utf-8",
+    )
+
+    return fold_info, predictions[PREDICTION_COLUMNS], False
+
+
+# ─────────────────────────────────────────────
+# METRICS
+# ─────────────────────────────────────────────
+
+def score_fold(
+    test: pd.DataFrame,
+    predictions: pd.DataFrame,
+) -> pd.DataFrame:
+    scored = test.merge(
+        predictions[["game_id", "model_home_runs", "model_away_runs"]],
+        on="game_id",
+        how="left",
+        validate="one_to_one",
+    )
+
+    if scored[["model_home_runs", "model_away_runs"]].isna().any().any():
+        fail("Fold predictions do not cover every test game")
+
+    scored["model_total_runs"] = (
+        scored["model_home_runs"]
+        + scored["model_away_runs"]
+    )
+
+    return scored
+
+
+def market_metrics(
+    scored: pd.DataFrame,
+    sportsbook_dir: Path,
+    probs_module,
+    evk_module,
+) -> list[dict]:
+    sportsbook = erm.load_sportsbook_test_period(scored, sportsbook_dir)
+    market = erm.join_sportsbook(scored, sportsbook)
+    market = erm.derive_market_probabilities(market, probs_module)
+    market = erm.add_observed_outcomes(market)
+
+    calibrations = erm.build_calibration_reports(market)
+    values = erm.build_value_records(market, evk_module)
+
+    rows = []
+
+    for system in ["dratings", "new_model"]:
+        rows.append(
+            {
+                "system": system,
+                "moneyline_ece": erm.expected_calibration_error(
+                    calibrations["moneyline"],
+                    system,
+                ),
+                "run_line_ece": erm.expected_calibration_error(
+                    calibrations["run_line"],
+                    system,
+                ),
+                "total_ece": erm.expected_calibration_error(
+                    calibrations["total"],
+                    system,
+                ),
+                **erm.value_summary(values, system),
+            }
+        )
+
+    return rows
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "--input",
+        type=Path,
+        default=DEFAULT_INPUT,
+        help=f"Training-set CSV path (default: {DEFAULT_INPUT})",
+    )
+    parser.add_argument(
+        "--model-dir",
+        type=Path,
+        default=DEFAULT_MODEL_DIR,
+        help=(
+            "Production model metadata for --params production "
+            f"(default: {DEFAULT_MODEL_DIR})"
+        ),
+    )
+    parser.add_argument(
+        "--sportsbook-dir",
+        type=Path,
+        default=DEFAULT_SPORTSBOOK_DIR,
+        help=(
+            "Historical sportsbook snapshot directory "
+            f"(default: {DEFAULT_SPORTSBOOK_DIR})"
+        ),
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=DEFAULT_OUTPUT_DIR,
+        help=f"Report and fold cache directory (default: {DEFAULT_OUTPUT_DIR})",
+    )
+    parser.add_argument(
+        "--window",
+        choices=WINDOW_MODES,
+        default="expanding",
+        help="Training window per fold (default: expanding)",
+    )
+    parser.add_argument(
+        "--window-days",
+        type=int,
+        default=365,
+        help="Calendar days in a rolling window (default: 365)",
+    )
+    parser.add_argument(
+        "--cadence-days",
+        type=int,
+        default=7,
+        help="Days between retrains; each fold scores this span (default: 7)",
+    )
+    parser.add_argument(
+        "--min-train-days",
+        type=int,
+        default=60,
+        help="Calendar days before the first cutoff (default: 60)",
+    )
+    parser.add_argument(
+        "--params",
+        choices=PARAM_MODES,
+        default="grid",
+        help=(
+            "grid and halving select per fold on that fold's own training "
+            "dates; production reuses the saved selected_hyperparameters, "
+            "which were chosen on later dates and leak into early folds "
+            "(default: grid)"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Fold processes; 1 runs in-process (default: CPU count)",
+    )
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    ERROR_DIR.mkdir(parents=True, exist_ok=True)
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = args.output_dir / "folds"
+
+    with LOG_FILE.open("w", encoding="utf-8") as f:
+        f.write(f"=== backtest_run_model RUN {_now()} ===\n")
+
+    try:
+        if args.cadence_days < 1 or args.window_days < 1:
+            fail("--cadence-days and --window-days must be positive")
+
+        df, feature_columns = load_backtest_frame(args.input)
+
+        lookahead_params = args.params == "production"
+        params = (
+            production_hyperparameters(args.model_dir)
+            if lookahead_params
+            else None
+        )
+
+        if lookahead_params:
+            _log(
+                "--params production reuses hyperparameters selected on dates "
+                "after most fold cutoffs; reports are marked lookahead_params",
+                "WARN",
+            )
+
+        settings = {
+            "params": args.params,
+            "production_hyperparameters": params,
+            "random_state": trm.RANDOM_STATE,
+            "max_iter": trm.FULL_MAX_ITER,
+            "validation_fraction": VALIDATION_FRACTION,
+        }
+
+        tasks = []
+
+        for fold in build_folds(
+            df["_game_date_dt"],
+            args.cadence_days,
+            args.window,
+            args.window_days,
+            args.min_train_days,
+        ):
+            train, test = fold_frames(df, fold)
+
+            if test.empty:
+                continue
+
+            if train["_game_date_dt"].nunique() < MIN_TRAIN_DATES:
+                _log(
+                    f"fold {fold['fold']} skipped: "
+                    f"train_dates={train['_game_date_dt'].nunique()} "
+                    f"< {MIN_TRAIN_DATES}",
+                    "WARN",
+                )
+                continue
+
+            tasks.append(
+                (fold, train, test, feature_columns, settings, params, cache_dir)
+            )
+
+        if not tasks:
+            fail("No backtest folds have both training and test games")
+
+        _log(
+            f"folds={len(tasks)} window={args.window} "
+            f"cadence_days={args.cadence_days} params={args.params} "
+            f"workers={args.workers}"
+        )
+
+        if args.workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=args.workers,
+                initializer=_init_fold_worker,
+            ) as executor:
+                results = list(executor.map(run_fold, tasks))
+        else:
+            results = [run_fold(task) for task in tasks]
+
+        probs_module, evk_module = erm._load_production_math()
+
+        run_rows = []
+        market_rows = []
+        prediction_frames = []
+        cached = 0
+
+        for task, (fold_info, predictions, from_cache) in zip(tasks, results):
+            test = task[2]
+            cached += int(from_cache)
+
+            fold_columns = {
+                "fold": fold_info["fold"],
+                "fold_key": fold_info["fold_key"],
+                "train_start_date": fold_info["train_start_date"],
+                "cutoff_date": fold_info["cutoff_date"],
+                "test_end_date": fold_info["test_end_date"],
+                "training_row_count": fold_info["training_row_count"],
+                "params_mode": args.params,
+                "lookahead_params": lookahead_params,
+            }
+
+            scored = score_fold(test, predictions)
+
+            run_metrics = erm.build_run_metrics(scored)
+            for key, value in reversed(list(fold_columns.items())):
+                run_metrics.insert(0, key, value)
+            run_rows.append(run_metrics)
+
+            try:
+                for row in market_metrics(
+                    scored,
+                    args.sportsbook_dir,
+                    probs_module,
+                    evk_module,
+                ):
+                    market_rows.append({**fold_columns, **row})
+            except RuntimeError as exc:
+                _log(
+                    f"fold {fold_info['fold']} market metrics skipped: {exc}",
+                    "WARN",
+                )
+
+            prediction_frames.append(
+                predictions.assign(
+                    fold=fold_info["fold"],
+                    lookahead_params=lookahead_params,
+                )
+            )
+
+        run_report = pd.concat(run_rows, ignore_index=True)
+        market_report = pd.DataFrame(market_rows)
+        prediction_report = pd.concat(prediction_frames, ignore_index=True)
+
+        run_report.to_csv(
+            args.output_dir / REPORT_FILES["run_metrics"],
+            index=False,
+        )
+        market_report.to_csv(
+            args.output_dir / REPORT_FILES["market_metrics"],
+            index=False,
+        )
+        prediction_report.to_csv(
+            args.output_dir / REPORT_FILES["predictions"],
+            index=False,
+        )
+
+        _log(
+            f"SUCCESS folds={len(tasks)} cached_folds={cached} "
+            f"market_fold_rows={len(market_report)} "
+            f"prediction_rows={len(prediction_report)}"
+        )
+
+        print(
+            "backtest_run_model complete. "
+            f"folds={len(tasks)} cached={cached} "
+            f"reports={args.output_dir}"
+        )
+
+    except Exception as exc:
+        _log(
+            f"FATAL: {exc}\n{traceback.format_exc()}",
+            "ERROR",
+        )
+        print(f"backtest_run_model failed: {exc}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
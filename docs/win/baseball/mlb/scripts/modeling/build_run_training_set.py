@@ -14,11 +14,18 @@ The output contains only explicitly approved pregame model inputs plus targets
 and audit identifiers. Sportsbook prices, implied probabilities, grading
 results, and postgame-derived fields other than final-run targets are never
 copied into the training dataset.
+
+Each source family is read once for the whole date range and joined as one
+frame, with keys and joins scoped to the date of the file a row came from.
+The CSV is the training input; a Parquet copy plus a per-date fingerprint
+manifest let --incremental rebuild only new or changed dates.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import sys
 import traceback
 from datetime import UTC, datetime
@@ -38,6 +45,13 @@ WEATHER_DIR = BASE_DIR / "data/weather"
 
 OUTPUT_DIR = BASE_DIR / "modeling/data"
 OUTPUT_FILE = OUTPUT_DIR / "mlb_run_training_set.csv"
+OUTPUT_PARQUET = OUTPUT_DIR / "mlb_run_training_set.parquet"
+MANIFEST_FILE = OUTPUT_DIR / "mlb_run_training_set_manifest.json"
+MANIFEST_VERSION = 1
+
+# Per-file date tag carried through the stacked sources and kept in the
+# Parquet copy so incremental runs know which rows each date produced.
+SOURCE_DATE = "_source_date"
 
 ERROR_DIR = BASE_DIR / "errors/modeling"
 LOG_FILE = ERROR_DIR / "build_run_training_set.txt"
@@ -280,13 +294,21 @@ def _assert_unique_key(
 
     values = df[key].astype("string").str.strip()
     nonblank = values.notna() & (values != "")
-    duplicated = nonblank & values.duplicated(keep=False)
+
+    # Keys only need to be unique within one date's file.
+    if SOURCE_DATE in df.columns:
+        scoped = pd.DataFrame({SOURCE_DATE: df[SOURCE_DATE], key: values})
+        duplicated = nonblank & scoped.duplicated(keep=False)
+        sample = scoped.loc[duplicated].head(10).to_dict("records")
+    else:
+        duplicated = nonblank & values.duplicated(keep=False)
+        sample = values.loc[duplicated].head(10).tolist()
+
     count = int(duplicated.sum())
 
     if count:
         metric = "duplicate_game_id" if key == "game_id" else "duplicate_gamePk"
         summary[metric] += count
-        sample = values.loc[duplicated].head(10).tolist()
         fail(
             f"{label} contains duplicate {key}; "
             f"duplicate_rows={count}; sample={sample}"
@@ -406,9 +428,8 @@ def _resolve_game_datetime(games: pd.DataFrame) -> pd.Series:
     )
 
 
-def _safe_weather_frame(
+def _read_weather_file(
     weather_path: Path,
-    games: pd.DataFrame,
     summary: dict,
 ) -> pd.DataFrame | None:
     if not weather_path.exists():
@@ -455,12 +476,40 @@ def _safe_weather_frame(
         )
         return None
 
+    return weather[["gamePk", provenance_col] + keep_features].rename(
+        columns={provenance_col: "_weather_generated"}
+    )
+
+
+def _safe_weather_frame(
+    dates: list[str],
+    games: pd.DataFrame,
+    summary: dict,
+) -> pd.DataFrame | None:
+    frames: list[pd.DataFrame] = []
+
+    for date_str in dates:
+        frame = _read_weather_file(
+            WEATHER_DIR / f"{date_str}_weather.csv",
+            summary,
+        )
+
+        if frame is not None:
+            frame[SOURCE_DATE] = date_str
+            frames.append(frame)
+
+    if not frames:
+        return None
+
+    weather = pd.concat(frames, ignore_index=True, sort=False)
+    keep_features = [col for col in WEATHER_FEATURES if col in weather.columns]
+
     weather_gamepk = _normalize_gamepk(weather["gamePk"])
     weather = weather.loc[
         weather_gamepk.notna() & (weather_gamepk != "")
     ].copy()
 
-    game_times = games[["gamePk"]].copy()
+    game_times = games[[SOURCE_DATE, "gamePk"]].copy()
     game_times["_game_start"] = _resolve_game_datetime(games)
     game_gamepk = _normalize_gamepk(game_times["gamePk"])
     game_times = game_times.loc[
@@ -468,13 +517,13 @@ def _safe_weather_frame(
     ].copy()
 
     check = game_times.merge(
-        weather[["gamePk", provenance_col] + keep_features],
-        on="gamePk",
+        weather[[SOURCE_DATE, "gamePk", "_weather_generated"] + keep_features],
+        on=[SOURCE_DATE, "gamePk"],
         how="left",
         validate="one_to_one",
     )
 
-    generated = pd.to_datetime(check[provenance_col], errors="coerce")
+    generated = pd.to_datetime(check["_weather_generated"], errors="coerce")
     game_start = pd.to_datetime(check["_game_start"], errors="coerce")
 
     unsafe = (
@@ -483,21 +532,20 @@ def _safe_weather_frame(
         | (generated >= game_start)
     )
 
-    matched_weather = check[provenance_col].notna()
+    matched_weather = check["_weather_generated"].notna()
     unsafe_matched = unsafe & matched_weather
 
     if unsafe_matched.any():
         sample = check.loc[
             unsafe_matched,
-            ["gamePk", provenance_col, "_game_start"],
+            [SOURCE_DATE, "gamePk", "_weather_generated", "_game_start"],
         ].head(10).to_dict("records")
         fail(
-            f"weather provenance is not safely pregame for "
-            f"{weather_path.name}; bad_rows={int(unsafe_matched.sum())}; "
-            f"sample={sample}"
+            f"weather provenance is not safely pregame; "
+            f"bad_rows={int(unsafe_matched.sum())}; sample={sample}"
         )
 
-    return weather[["gamePk"] + keep_features].copy()
+    return weather[[SOURCE_DATE, "gamePk"] + keep_features].copy()
 
 
 def _discover_dates() -> list[str]:
@@ -553,54 +601,89 @@ def _rename_prediction_features(pred: pd.DataFrame) -> pd.DataFrame:
     )
 
 
-def build_date_training_rows(
-    date_str: str,
+def read_source_family(
+    directory: Path,
+    filename: str,
+    dates: list[str],
+    required: list[str],
+    label: str,
+    defaults: dict[str, str] | None = None,
+) -> pd.DataFrame:
+    """Reads one per-date source for every date into a single frame.
+
+    Each row is tagged with SOURCE_DATE so per-file key rules and joins
+    still apply within a date after the files are stacked. defaults fills
+    optional columns that a file leaves out entirely, so stacking does not
+    turn a missing column into blank values for that date.
+    """
+    frames: list[pd.DataFrame] = []
+
+    for date_str in dates:
+        frame = read_csv_checked(
+            directory / filename.format(date=date_str),
+            required,
+            f"{label} {date_str}",
+        )
+        for col, value in (defaults or {}).items():
+            if col not in frame.columns:
+                frame[col] = value
+        frame[SOURCE_DATE] = date_str
+        frames.append(frame)
+
+    return pd.concat(frames, ignore_index=True, sort=False)
+
+
+def build_training_rows(
+    dates: list[str],
     summary: dict,
 ) -> pd.DataFrame:
-    pred_path = PRED_DIR / f"{date_str}_MLB.csv"
-    games_path = GAMES_DIR / f"{date_str}_games.csv"
-    sdv_path = SDV_DIR / f"{date_str}_sportsdataverse.csv"
-    final_path = FINAL_DIR / f"{date_str}_final_scores_MLB.csv"
-    weather_path = WEATHER_DIR / f"{date_str}_weather.csv"
-
-    pred = read_csv_checked(
-        pred_path,
-        PRED_REQUIRED,
-        f"predictions {date_str}",
+    """Builds training rows for all dates with one pass per source family.
+
+    Rows keep their SOURCE_DATE tag for the Parquet copy.
+    """
+    pred = read_source_family(
+        PRED_DIR, "{date}_MLB.csv", dates, PRED_REQUIRED, "predictions"
     )
-    games = read_csv_checked(
-        games_path,
-        GAMES_REQUIRED,
-        f"games {date_str}",
+    games = read_source_family(
+        GAMES_DIR, "{date}_games.csv", dates, GAMES_REQUIRED, "games"
     )
-    sdv = read_csv_checked(
-        sdv_path,
+    sdv = read_source_family(
+        SDV_DIR,
+        "{date}_sportsdataverse.csv",
+        dates,
         SDV_REQUIRED,
-        f"sportsdataverse {date_str}",
+        "sportsdataverse",
     )
-    final = read_csv_checked(
-        final_path,
+    final = read_source_family(
+        FINAL_DIR,
+        "{date}_final_scores_MLB.csv",
+        dates,
         FINAL_REQUIRED,
-        f"final_scores {date_str}",
+        "final_scores",
+        # A file without game_status is judged on its scores alone.
+        defaults={"game_status": "final"},
     )
 
-    pred = _prepare_source_keys(pred, f"predictions {date_str}", summary)
-    games = _prepare_source_keys(games, f"games {date_str}", summary)
-    sdv = _prepare_source_keys(sdv, f"sportsdataverse {date_str}", summary)
-    final = _prepare_source_keys(final, f"final_scores {date_str}", summary)
+    pred = _prepare_source_keys(pred, "predictions", summary)
+    games = _prepare_source_keys(games, "games", summary)
+    sdv = _prepare_source_keys(sdv, "sportsdataverse", summary)
+    final = _prepare_source_keys(final, "final_scores", summary)
 
     summary["rows_loaded"] += len(pred)
 
     pred = _rename_prediction_features(pred)
 
+    join_key = [SOURCE_DATE, "game_id"]
+
     pred_keep = [
+        SOURCE_DATE,
         "game_id",
         "game_date",
         "home_team",
         "away_team",
     ] + DRATINGS_COLUMNS
 
-    game_keep = [
+    game_keep = [SOURCE_DATE] + [
         col for col in [
             "gamePk",
             "game_id",
@@ -616,7 +699,7 @@ def build_date_training_rows(
 
     joined = pred[pred_keep].merge(
         games[game_keep],
-        on="game_id",
+        on=join_key,
         how="inner",
         suffixes=("_pred", "_games"),
         validate="one_to_one",
@@ -625,9 +708,14 @@ def build_date_training_rows(
     summary["rows_joined"] += len(joined)
 
     if len(joined) != len(pred):
-        missing = len(pred) - len(joined)
+        lost = (
+            pred[SOURCE_DATE].value_counts()
+            .sub(joined[SOURCE_DATE].value_counts(), fill_value=0)
+        )
+        lost = lost[lost > 0].sort_index()
         fail(
-            f"{date_str} prediction->games join lost {missing} rows; "
+            f"prediction->games join lost {int(lost.sum())} rows; "
+            f"dates={lost.astype(int).to_dict()}; "
             "game_id spine must resolve one-to-one"
         )
 
@@ -635,13 +723,13 @@ def build_date_training_rows(
         joined,
         "home_team_pred",
         "home_team_games",
-        f"{date_str} home team",
+        "home team",
     )
     _assert_team_consistency(
         joined,
         "away_team_pred",
         "away_team_games",
-        f"{date_str} away team",
+        "away team",
     )
 
     joined["game_date"] = joined["game_date_games"]
@@ -649,6 +737,7 @@ def build_date_training_rows(
     joined["away_team"] = joined["away_team_games"]
 
     sdv_keep = [
+        SOURCE_DATE,
         "gamePk",
         "game_id",
         "sdv_as_of_date",
@@ -659,7 +748,7 @@ def build_date_training_rows(
 
     joined = joined.merge(
         sdv[sdv_keep].rename(columns={"gamePk": "gamePk_sdv"}),
-        on="game_id",
+        on=join_key,
         how="left",
         validate="one_to_one",
     )
@@ -671,10 +760,10 @@ def build_date_training_rows(
         joined,
         "gamePk",
         "gamePk_sdv",
-        f"{date_str} games->sportsdataverse",
+        "games->sportsdataverse",
     )
 
-    final_keep = [
+    final_keep = [SOURCE_DATE] + [
         col for col in [
             "gamePk",
             "game_id",
@@ -691,7 +780,7 @@ def build_date_training_rows(
 
     joined = joined.merge(
         final_join,
-        on="game_id",
+        on=join_key,
         how="left",
         validate="one_to_one",
     )
@@ -701,7 +790,7 @@ def build_date_training_rows(
             joined,
             "gamePk",
             "gamePk_final",
-            f"{date_str} games->final_scores",
+            "games->final_scores",
         )
 
     final_home = pd.to_numeric(
@@ -713,20 +802,13 @@ def build_date_training_rows(
         errors="coerce",
     )
 
-    if "game_status" in joined.columns:
-        final_status = (
-            joined["game_status"]
-            .astype("string")
-            .str.strip()
-            .str.lower()
-        )
-        status_invalid = final_status.ne("final")
-    else:
-        status_invalid = pd.Series(
-            False,
-            index=joined.index,
-            dtype=bool,
-        )
+    final_status = (
+        joined["game_status"]
+        .astype("string")
+        .str.strip()
+        .str.lower()
+    )
+    status_invalid = final_status.ne("final")
 
     invalid_final = (
         status_invalid
@@ -761,7 +843,7 @@ def build_date_training_rows(
             ["game_id", "gamePk", "game_date", "sdv_as_of_date"],
         ].head(10).to_dict("records")
         fail(
-            f"{date_str} SDV leakage validation failed; "
+            f"SDV leakage validation failed; "
             f"sdv_as_of_date must be < game_date; "
             f"bad_rows={int(leakage.sum())}; sample={sample}"
         )
@@ -775,14 +857,14 @@ def build_date_training_rows(
     joined = joined.rename(columns=SDV_FEATURE_MAP)
 
     weather = _safe_weather_frame(
-        weather_path,
+        dates,
         games,
         summary,
     )
     if weather is not None:
         joined = joined.merge(
             weather,
-            on="gamePk",
+            on=[SOURCE_DATE, "gamePk"],
             how="left",
             validate="many_to_one",
         )
@@ -800,6 +882,7 @@ def build_date_training_rows(
             if col in joined.columns
         ]
         + TARGET_COLUMNS
+        + [SOURCE_DATE]
     )
 
     output = joined[output_columns].copy()
@@ -824,6 +907,94 @@ def build_date_training_rows(
     return output
 
 
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def date_fingerprint(date_str: str) -> str:
+    """Hash of this builder plus every source file a date is built from."""
+    digest = hashlib.sha256()
+    digest.update(f"code\0{file_sha256(Path(__file__))}\n".encode("utf-8"))
+
+    for path in [
+        PRED_DIR / f"{date_str}_MLB.csv",
+        GAMES_DIR / f"{date_str}_games.csv",
+        SDV_DIR / f"{date_str}_sportsdataverse.csv",
+        FINAL_DIR / f"{date_str}_final_scores_MLB.csv",
+        WEATHER_DIR / f"{date_str}_weather.csv",
+    ]:
+        value = file_sha256(path) if path.exists() else "missing"
+        digest.update(f"{path}\0{value}\n".encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+def load_manifest() -> dict:
+    if not MANIFEST_FILE.exists():
+        return {"version": MANIFEST_VERSION, "dates": {}}
+
+    with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        _log(
+            f"manifest version {manifest.get('version')} != "
+            f"{MANIFEST_VERSION}; ignoring it",
+            "WARN",
+        )
+        return {"version": MANIFEST_VERSION, "dates": {}}
+
+    return manifest
+
+
+def save_manifest(manifest: dict) -> None:
+    tmp = MANIFEST_FILE.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    tmp.replace(MANIFEST_FILE)
+
+
+def plan_incremental(
+    dates: list[str],
+    discovered: list[str],
+    fingerprints: dict[str, str],
+) -> tuple[list[str], pd.DataFrame | None]:
+    """Splits dates into ones to rebuild and existing Parquet rows to keep.
+
+    A selected date is reused when its fingerprint is unchanged, since its
+    rows depend only on its source files and this builder. Late final
+    scores or an SDV backfill change the fingerprint and rebuild the date.
+    Rows for dates outside the selection are kept while their prediction
+    file exists.
+    """
+    if not OUTPUT_PARQUET.exists():
+        _log("incremental: no existing Parquet training set; full build")
+        return dates, None
+
+    recorded = load_manifest()["dates"]
+
+    reuse = {
+        date_str for date_str in dates
+        if date_str in recorded
+        and recorded[date_str].get("fingerprint") == fingerprints[date_str]
+    }
+
+    existing = pd.read_parquet(OUTPUT_PARQUET)
+    if SOURCE_DATE not in existing.columns:
+        _log("incremental: Parquet training set has no source dates; full build", "WARN")
+        return dates, None
+
+    outside = set(discovered) - set(dates)
+    existing = existing.loc[existing[SOURCE_DATE].isin(reuse | outside)].copy()
+
+    return [d for d in dates if d not in reuse], existing
+
+
 def validate_final_output(df: pd.DataFrame) -> None:
     dupes = duplicate_columns(list(df.columns))
     if dupes:
@@ -885,6 +1056,14 @@ def parse_args() -> argparse.Namespace:
         "--to-date",
         help="Optional inclusive end date (YYYY-MM-DD or YYYY_MM_DD).",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Rebuild only new dates and dates whose sources changed, "
+            "reusing the rest from the existing Parquet training set."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -906,9 +1085,9 @@ def main() -> None:
     }
 
     try:
-        dates = _discover_dates()
+        discovered = _discover_dates()
         dates = _filter_dates(
-            dates,
+            discovered,
             args.from_date,
             args.to_date,
         )
@@ -916,15 +1095,33 @@ def main() -> None:
         if not dates:
             fail("No prediction dates found for the requested range")
 
-        _log(f"dates_to_process={len(dates)}")
+        fingerprints = {
+            date_str: date_fingerprint(date_str)
+            for date_str in dates
+        }
+
+        existing = None
+        build_dates = dates
+        if args.incremental:
+            build_dates, existing = plan_incremental(
+                dates,
+                discovered,
+                fingerprints,
+            )
+
+        _log(
+            f"dates_to_process={len(build_dates)} "
+            f"dates_reused={len(dates) - len(build_dates)}"
+        )
 
         all_rows: list[pd.DataFrame] = []
 
-        for date_str in dates:
-            _log(f"processing date={date_str}")
+        if existing is not None and not existing.empty:
+            all_rows.append(existing)
 
-            frame = build_date_training_rows(
-                date_str,
+        if build_dates:
+            frame = build_training_rows(
+                build_dates,
                 summary,
             )
 
@@ -945,6 +1142,7 @@ def main() -> None:
                     + SAFE_GAME_FEATURES
                     + list(SDV_FEATURE_MAP.values())
                     + TARGET_COLUMNS
+                    + [SOURCE_DATE]
                 )
             )
 
@@ -956,10 +1154,30 @@ def main() -> None:
         ).reset_index(drop=True)
 
         summary["rows_written"] = len(training)
-        training.to_csv(
+        training.drop(columns=[SOURCE_DATE]).to_csv(
             OUTPUT_FILE,
             index=False,
         )
+        training.to_parquet(
+            OUTPUT_PARQUET,
+            index=False,
+        )
+
+        manifest = load_manifest() if args.incremental else {
+            "version": MANIFEST_VERSION,
+            "dates": {},
+        }
+        kept_dates = set(training[SOURCE_DATE]) | set(dates)
+        manifest["dates"] = {
+            date_str: entry
+            for date_str, entry in manifest["dates"].items()
+            if date_str in kept_dates
+        }
+        for date_str in build_dates:
+            manifest["dates"][date_str] = {
+                "fingerprint": fingerprints[date_str],
+            }
+        save_manifest(manifest)
 
         for key in [
             "rows_loaded",
@@ -974,9 +1192,11 @@ def main() -> None:
             _log(f"{key}={summary[key]}")
 
         _log(f"WROTE {OUTPUT_FILE}")
+        _log(f"WROTE {OUTPUT_PARQUET}")
         print(
             "build_run_training_set complete. "
             f"rows_written={summary['rows_written']} "
+            f"dates_built={len(build_dates)} "
             f"missing_sdv={summary['missing_sdv']} "
             f"missing_final_score={summary['missing_final_score']} "
             f"leakage_rejections={summary['leakage_rejections']}"
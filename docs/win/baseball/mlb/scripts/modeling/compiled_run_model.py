@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""Array-backed inference for the MLB home/away run models.
+
+Compiles a fitted HistGradientBoostingRegressor (poisson loss, numeric
+features) into flat split and leaf arrays and scores it without walking the
+trees. The artifact is a plain .npz next to the joblib model:
+
+    docs/win/baseball/mlb/models/run_projection/home_runs_model_compiled.npz
+    docs/win/baseball/mlb/models/run_projection/away_runs_model_compiled.npz
+
+Each artifact records the sha256 of the joblib file it was compiled from.
+load_if_fresh returns None when that file has changed since, so callers fall
+back to joblib instead of scoring a stale model.
+
+Scoring uses leaf bitmasks (the QuickScorer layout). Each tree's leaves are
+numbered left to right, and each split stores a mask that clears the leaves
+of its left subtree. A row's exit leaf is then the lowest bit left after
+AND-ing the masks of every split that sends it right. All splits of all
+trees are tested in one comparison, so the cost is a handful of dense array
+operations instead of one gather per tree level.
+
+Split decisions match sklearn's predictor exactly: NaN takes the node's
+missing-value branch, otherwise x <= threshold goes left. Tree values are
+added to the baseline in boosting order before the log link is inverted.
+
+Export for the current production models (parity is checked on the training
+set before anything is written):
+    python docs/win/baseball/mlb/scripts/modeling/compiled_run_model.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import traceback
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+BASE_DIR = Path("docs/win/baseball/mlb")
+
+DEFAULT_INPUT = BASE_DIR / "modeling/data/mlb_run_training_set.csv"
+
+MODEL_DIR = BASE_DIR / "models/run_projection"
+ERROR_DIR = BASE_DIR / "errors/modeling"
+LOG_FILE = ERROR_DIR / "compiled_run_model.txt"
+
+ERROR_DIR.mkdir(parents=True, exist_ok=True)
+
+MODEL_FILES = {
+    "home": MODEL_DIR / "home_runs_model.joblib",
+    "away": MODEL_DIR / "away_runs_model.joblib",
+}
+
+FORMAT_VERSION = 1
+
+# Rows scored per chunk; bounds the (splits x rows) working arrays.
+PREDICT_CHUNK_ROWS = 256
+
+PARITY_TOLERANCE = 1e-9
+
+MASK_DTYPES = {32: np.uint32, 64: np.uint64}
+
+SCORING_ARRAYS = [
+    "split_column",
+    "split_threshold",
+    "split_mask",
+    "leaf_value",
+    "leaf_offset",
+    "baseline",
+]
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _log(message: str, level: str = "INFO") -> None:
+    with LOG_FILE.open("a", encoding="utf-8") as f:
+        f.write(f"{_now()} | {level:<5} | {message.rstrip()}\n")
+
+
+def fail(message: str) -> None:
+    _log(message, "ERROR")
+    raise RuntimeError(message)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def compiled_path_for(model_path: Path) -> Path:
+    return model_path.with_name(f"{model_path.stem}_compiled.npz")
+
+
+class CompiledRunModel:
+    """
+    Drop-in scorer for a compiled run model: exposes predict(X) and
+    feature_names_in_ like the sklearn estimator it came from.
+    """
+
+    def __init__(self, arrays: dict, meta: dict):
+        self.arrays = arrays
+        self.meta = meta
+        self.feature_names_in_ = np.asarray(meta["feature_names"], dtype=object)
+        self.n_features_in_ = len(meta["feature_names"])
+
+    @classmethod
+    def compile(cls, model, source_sha256: str | None = None) -> "CompiledRunModel":
+        import sklearn
+
+        if getattr(model, "loss", None) != "poisson":
+            fail(f"only poisson-loss models can be compiled; loss={getattr(model, 'loss', None)}")
+
+        feature_names = getattr(model, "feature_names_in_", None)
+        if feature_names is None:
+            fail("model does not expose feature_names_in_; cannot pin feature order")
+
+        try:
+            trees = [tree.nodes for iteration in model._predictors for tree in iteration]
+            baseline = float(np.asarray(model._baseline_prediction).ravel()[0])
+        except AttributeError as exc:
+            fail(
+                f"fitted model internals unavailable for sklearn {sklearn.__version__}: {exc}"
+            )
+
+        if not trees:
+            fail("model has no fitted trees")
+
+        if any(nodes["is_categorical"].any() for nodes in trees):
+            fail("categorical splits are not supported by the compiled run model")
+
+        max_leaves = max(int(nodes["is_leaf"].sum()) for nodes in trees)
+        mask_bits = next((bits for bits in MASK_DTYPES if max_leaves <= bits), None)
+        if mask_bits is None:
+            fail(f"trees with more than 64 leaves are not supported; max_leaves={max_leaves}")
+
+        n_features = len(feature_names)
+        splits_per_tree = max(1, max(int((~nodes["is_leaf"].astype(bool)).sum()) for nodes in trees))
+        all_leaves = (1 << mask_bits) - 1
+
+        # Unused split slots never clear a bit, whatever the comparison says.
+        split_column = np.zeros((len(trees), splits_per_tree), dtype=np.int64)
+        split_threshold = np.full((len(trees), splits_per_tree), np.inf)
+        split_mask = np.full((len(trees), splits_per_tree), all_leaves, dtype=np.uint64)
+        leaf_value = []
+        leaf_offset = []
+
+        for t, nodes in enumerate(trees):
+            leaf_order, left_leaves = _tree_leaves(nodes)
+            position = {node: k for k, node in enumerate(leaf_order)}
+
+            leaf_offset.append(len(leaf_value))
+            leaf_value.extend(float(v) for v in nodes["value"][leaf_order])
+
+            for slot, node in enumerate(sorted(left_leaves)):
+                cleared = sum(1 << position[leaf] for leaf in left_leaves[node])
+
+                # Scored against [X with NaN as -inf | X], so NaN goes left
+                # exactly where the node sends missing values left.
+                split_column[t, slot] = (
+                    int(nodes["feature_idx"][node])
+                    + (0 if nodes["missing_go_to_left"][node] else n_features)
+                )
+                split_threshold[t, slot] = float(nodes["num_threshold"][node])
+                split_mask[t, slot] = all_leaves & ~cleared
+
+        arrays = {
+            "split_column": split_column.ravel(),
+            "split_threshold": split_threshold.ravel(),
+            "split_mask": split_mask.ravel().astype(MASK_DTYPES[mask_bits]),
+            "leaf_value": np.asarray(leaf_value, dtype=np.float64),
+            "leaf_offset": np.asarray(leaf_offset, dtype=np.int64),
+            "baseline": np.asarray([baseline], dtype=np.float64),
+        }
+
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "loss": "poisson",
+            "feature_names": [str(name) for name in feature_names.tolist()],
+            "n_trees": len(trees),
+            "splits_per_tree": splits_per_tree,
+            "mask_bits": mask_bits,
+            "sklearn_version": sklearn.__version__,
+            "source_sha256": source_sha256,
+            "compiled_at": _now(),
+        }
+
+        return cls(arrays, meta)
+
+    def save(self, path: Path) -> Path:
+        tmp_path = path.with_name(f"{path.name}.tmp")
+
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                meta=np.asarray(json.dumps(self.meta, sort_keys=True)),
+                **self.arrays,
+            )
+
+        tmp_path.replace(path)
+
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "CompiledRunModel":
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+
+            if meta.get("format_version") != FORMAT_VERSION:
+                fail(
+                    f"compiled model format {meta.get('format_version')} != "
+                    f"{FORMAT_VERSION}: {path}"
+                )
+
+            arrays = {key: data[key] for key in SCORING_ARRAYS}
+
+        return cls(arrays, meta)
+
+    def _feature_matrix(self, X) -> np.ndarray:
+        if isinstance(X, pd.DataFrame):
+            columns = [str(col) for col in X.columns]
+
+            if columns != self.meta["feature_names"]:
+                fail(
+                    "compiled model feature order differs from input; "
+                    f"input={columns} model={self.meta['feature_names']}"
+                )
+
+            X = X.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        X = np.asarray(X, dtype=np.float64)
+
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            fail(
+                f"compiled model expects {self.n_features_in_} features; "
+                f"got shape={X.shape}"
+            )
+
+        return X
+
+    def _leaf_values(self, X: np.ndarray) -> np.ndarray:
+        """(rows, trees) exit-leaf values for one chunk of rows."""
+        arrays = self.arrays
+        n_trees = self.meta["n_trees"]
+
+        # Split-major layout keeps the gathers and comparisons contiguous.
+        columns = np.concatenate(
+            [np.where(np.isnan(X), -np.inf, X), X],
+            axis=1,
+        ).T.copy()
+        go_left = columns[arrays["split_column"]] <= arrays["split_threshold"][:, None]
+
+        mask_dtype = arrays["split_mask"].dtype
+        kept = arrays["split_mask"][:, None] | np.negative(go_left.astype(mask_dtype))
+        reachable = np.bitwise_and.reduce(
+            kept.reshape(n_trees, self.meta["splits_per_tree"], len(X)),
+            axis=1,
+        )
+
+        lowest = reachable & (~reachable + mask_dtype.type(1))
+        leaf = np.log2(lowest.astype(np.float64)).astype(np.int64)
+
+        return arrays["leaf_value"][arrays["leaf_offset"][:, None] + leaf].T
+
+    def raw_predict(self, X) -> np.ndarray:
+        X = self._feature_matrix(X)
+        raw = np.empty(len(X), dtype=np.float64)
+        baseline = self.arrays["baseline"][0]
+
+        for start in range(0, len(X), PREDICT_CHUNK_ROWS):
+            chunk = X[start:start + PREDICT_CHUNK_ROWS]
+            values = self._leaf_values(chunk)
+
+            # Accumulate in boosting order from the baseline, as sklearn does,
+            # so results match it bit for bit rather than to rounding error.
+            terms = np.concatenate(
+                [np.full((len(chunk), 1), baseline), values],
+                axis=1,
+            )
+            raw[start:start + len(chunk)] = np.cumsum(terms, axis=1)[:, -1]
+
+        return raw
+
+    def predict(self, X) -> np.ndarray:
+        return np.exp(self.raw_predict(X))
+
+
+def _tree_leaves(nodes) -> tuple[list[int], dict[int, list[int]]]:
+    """Leaves in left-to-right order, and each split's left-subtree leaves."""
+    order = []
+    left_leaves = {}
+    subtree = {}
+
+    # Iterative post-order walk; children are finished before their parent.
+    stack = [(0, False)]
+    while stack:
+        node, done = stack.pop()
+
+        if nodes["is_leaf"][node]:
+            order.append(node)
+            subtree[node] = [node]
+            continue
+
+        left, right = int(nodes["left"][node]), int(nodes["right"][node])
+
+        if done:
+            left_leaves[node] = subtree[left]
+            subtree[node] = subtree[left] + subtree[right]
+            continue
+
+        stack.extend([(node, True), (right, False), (left, False)])
+
+    return order, left_leaves
+
+
+def check_parity(model, compiled: CompiledRunModel, X: pd.DataFrame) -> float:
+    """Max absolute difference from sklearn's predict; fails above tolerance."""
+    expected = np.asarray(model.predict(X), dtype=float)
+    actual = compiled.predict(X)
+    max_abs_diff = float(np.max(np.abs(expected - actual))) if len(X) else 0.0
+
+    if not max_abs_diff <= PARITY_TOLERANCE:
+        fail(
+            f"compiled model parity failed; max_abs_diff={max_abs_diff} "
+            f"tolerance={PARITY_TOLERANCE} rows={len(X)}"
+        )
+
+    return max_abs_diff
+
+
+def export_compiled(model, model_path: Path, X: pd.DataFrame) -> dict:
+    """Compiles the model saved at model_path, checks parity on X, saves it."""
+    compiled = CompiledRunModel.compile(model, file_sha256(model_path))
+    max_abs_diff = check_parity(model, compiled, X)
+
+    compiled.meta["parity_rows"] = int(len(X))
+    compiled.meta["parity_max_abs_diff"] = max_abs_diff
+
+    path = compiled.save(compiled_path_for(model_path))
+    _log(
+        f"WROTE {path} trees={compiled.meta['n_trees']} "
+        f"parity_rows={len(X)} parity_max_abs_diff={max_abs_diff}"
+    )
+
+    return {
+        "file": path.name,
+        "n_trees": compiled.meta["n_trees"],
+        "parity_rows": int(len(X)),
+        "parity_max_abs_diff": max_abs_diff,
+    }
+
+
+def load_if_fresh(model_path: Path) -> CompiledRunModel | None:
+    """The compiled twin of model_path, or None if missing or stale."""
+    path = compiled_path_for(model_path)
+
+    if not path.exists() or not model_path.exists():
+        return None
+
+    compiled = CompiledRunModel.load(path)
+
+    if compiled.meta.get("source_sha256") != file_sha256(model_path):
+        _log(f"compiled model is stale for {model_path}; ignoring {path}", "WARN")
+        return None
+
+    return compiled
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--input",
+        default=str(DEFAULT_INPUT),
+        help="Training set whose feature rows are used for the parity check.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    import joblib
+
+    args = parse_args()
+
+    with LOG_FILE.open("w", encoding="utf-8") as f:
+        f.write(f"=== compiled_run_model RUN {_now()} ===\n")
+
+    try:
+        input_path = Path(args.input)
+        if not input_path.exists():
+            fail(f"parity input missing: {input_path}")
+
+        data = pd.read_csv(input_path)
+
+        for side, model_path in MODEL_FILES.items():
+            if not model_path.exists():
+                fail(f"{side} model missing: {model_path}")
+
+            model = joblib.load(model_path)
+            feature_columns = [str(x) for x in model.feature_names_in_.tolist()]
+
+            missing = [col for col in feature_columns if col not in data.columns]
+            if missing:
+                fail(f"{side} parity input missing feature columns: {missing}")
+
+            X = data[feature_columns].apply(pd.to_numeric, errors="coerce")
+            summary = export_compiled(model, model_path, X)
+
+            print(
+                f"{side}: wrote {summary['file']} trees={summary['n_trees']} "
+                f"parity_max_abs_diff={summary['parity_max_abs_diff']:.3e}"
+            )
+
+    except Exception as exc:
+        _log(f"FATAL: {exc}\n{traceback.format_exc()}", "ERROR")
+        print(f"compiled_run_model failed: {exc}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
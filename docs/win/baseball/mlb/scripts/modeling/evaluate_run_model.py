@@ -40,6 +40,8 @@ import pandas as pd
 from scipy.stats import spearmanr
 from sklearn.metrics import mean_absolute_error, mean_poisson_deviance
 
+import compiled_run_model as crm
+
 
 BASE_DIR = Path("docs/win/baseball/mlb")
 DEFAULT_TRAINING_DATA = BASE_DIR / "modeling/data/mlb_run_training_set.csv"
@@ -184,6 +186,7 @@ def _load_production_math():
         "moneyline_probabilities",
         "run_line_probabilities",
         "totals_probabilities",
+        "market_probability_arrays",
     ]
     required_ev_helpers = [
         "compute_binary_ev",
@@ -542,6 +545,17 @@ def validate_model_feature_order(
         )
 
 
+def load_scoring_model(path: Path, label: str):
+    """The compiled twin of a joblib model when it is current, else joblib."""
+    compiled = crm.load_if_fresh(path)
+
+    if compiled is not None:
+        _log(f"{label} model scored from compiled artifact {crm.compiled_path_for(path)}")
+        return compiled
+
+    return joblib.load(path)
+
+
 def score_models(
     test: pd.DataFrame,
     feature_columns: list[str],
@@ -554,8 +568,8 @@ def score_models(
         if not path.exists():
             fail(f"Model artifact not found: {path}")
 
-    home_model = joblib.load(home_path)
-    away_model = joblib.load(away_path)
+    home_model = load_scoring_model(home_path, "home")
+    away_model = load_scoring_model(away_path, "away")
 
     validate_model_feature_order(
         home_model,
@@ -925,25 +939,6 @@ def join_sportsbook(
     return market
 
 
-def _probability_triplet(
-    probs_module,
-    home_runs: float,
-    away_runs: float,
-    total_line: float,
-):
-    p_over, p_under, p_push = probs_module.totals_probabilities(
-        home_runs,
-        away_runs,
-        total_line,
-    )
-
-    return (
-        float(p_over),
-        float(p_under),
-        float(p_push),
-    )
-
-
 def derive_market_probabilities(
     market: pd.DataFrame,
     probs_module,
@@ -962,54 +957,21 @@ def derive_market_probabilities(
     }
 
     for system, (home_col, away_col) in systems.items():
-        ml_home: list[float] = []
-        ml_away: list[float] = []
-        rl_home: list[float] = []
-        rl_away: list[float] = []
-        total_over: list[float] = []
-        total_under: list[float] = []
-        total_push: list[float] = []
-
-        for row in out.itertuples(index=False):
-            home_runs = float(getattr(row, home_col))
-            away_runs = float(getattr(row, away_col))
-
-            p_home_ml, p_away_ml, _ = (
-                probs_module.moneyline_probabilities(
-                    home_runs,
-                    away_runs,
-                )
-            )
-            p_home_rl, p_away_rl = (
-                probs_module.run_line_probabilities(
-                    home_runs,
-                    away_runs,
-                    float(row.home_run_line),
-                    float(row.away_run_line),
-                )
-            )
-            p_over, p_under, p_push = _probability_triplet(
-                probs_module,
-                home_runs,
-                away_runs,
-                float(row.total),
-            )
-
-            ml_home.append(float(p_home_ml))
-            ml_away.append(float(p_away_ml))
-            rl_home.append(float(p_home_rl))
-            rl_away.append(float(p_away_rl))
-            total_over.append(p_over)
-            total_under.append(p_under)
-            total_push.append(p_push)
-
-        out[f"{system}_home_ml_prob"] = ml_home
-        out[f"{system}_away_ml_prob"] = ml_away
-        out[f"{system}_home_rl_prob"] = rl_home
-        out[f"{system}_away_rl_prob"] = rl_away
-        out[f"{system}_over_total_win_prob"] = total_over
-        out[f"{system}_under_total_win_prob"] = total_under
-        out[f"{system}_total_push_prob"] = total_push
+        probs = probs_module.market_probability_arrays(
+            out[home_col].to_numpy(dtype=float),
+            out[away_col].to_numpy(dtype=float),
+            out["home_run_line"].to_numpy(dtype=float),
+            out["away_run_line"].to_numpy(dtype=float),
+            out["total"].to_numpy(dtype=float),
+        )
+
+        out[f"{system}_home_ml_prob"] = probs["ml_home"]
+        out[f"{system}_away_ml_prob"] = probs["ml_away"]
+        out[f"{system}_home_rl_prob"] = probs["rl_home"]
+        out[f"{system}_away_rl_prob"] = probs["rl_away"]
+        out[f"{system}_over_total_win_prob"] = probs["total_over"]
+        out[f"{system}_under_total_win_prob"] = probs["total_under"]
+        out[f"{system}_total_push_prob"] = probs["total_push"]
 
         resolved = (
             out[f"{system}_over_total_win_prob"]
@@ -1417,295 +1379,228 @@ def build_probability_log_loss(
     return pd.DataFrame(rows)
 
 
-def _scalar(value) -> float:
-    if isinstance(value, pd.Series):
-        if len(value) != 1:
-            fail(
-                "Expected a one-value Series from production math "
-                f"helper; got {len(value)}"
-            )
-        return float(value.iloc[0])
-
-    array = np.asarray(value, dtype=float)
-    if array.size != 1:
-        fail(
-            "Expected scalar-like value from production math helper; "
-            f"shape={array.shape}"
-        )
-
-    return float(array.reshape(-1)[0])
-
-
-def binary_ev(
-    evk_module,
-    probability: float,
-    decimal_odds: float,
-) -> float:
-    return _scalar(
-        evk_module.compute_binary_ev(
-            pd.Series([probability], dtype=float),
-            pd.Series([decimal_odds], dtype=float),
-        )
-    )
-
+def realized_returns(
+    observed_win,
+    decimal_odds,
+) -> np.ndarray:
+    observed = np.asarray(observed_win, dtype=float)
+    decimal_odds = np.asarray(decimal_odds, dtype=float)
 
-def binary_kelly_raw(
-    evk_module,
-    probability: float,
-    decimal_odds: float,
-) -> float:
-    return _scalar(
-        evk_module.compute_binary_kelly_raw(
-            pd.Series([probability], dtype=float),
-            pd.Series([decimal_odds], dtype=float),
-        )
+    unknown = ~(
+        np.isnan(observed)
+        | (observed == 1.0)
+        | (observed == 0.0)
     )
-
-
-def total_ev(
-    evk_module,
-    p_win: float,
-    p_loss: float,
-    decimal_odds: float,
-) -> float:
-    return _scalar(
-        evk_module.compute_total_ev(
-            pd.Series([p_win], dtype=float),
-            pd.Series([p_loss], dtype=float),
-            pd.Series([decimal_odds], dtype=float),
-        )
+    if unknown.any():
+        fail(
+            "Invalid observed_win value: "
+            f"{observed[unknown][0]}"
+        )
+
+    return np.select(
+        [
+            observed == 1.0,
+            observed == 0.0,
+        ],
+        [
+            decimal_odds - 1.0,
+            -1.0,
+        ],
+        default=0.0,
     )
 
 
-def total_kelly_raw(
+def _value_block(
+    market: pd.DataFrame,
     evk_module,
-    p_win: float,
-    p_loss: float,
-    decimal_odds: float,
-    game_id: str,
-    label: str,
-) -> float:
-    return _scalar(
-        evk_module.compute_total_kelly_raw(
-            pd.Series([p_win], dtype=float),
-            pd.Series([p_loss], dtype=float),
-            pd.Series([decimal_odds], dtype=float),
-            pd.Series([game_id], dtype="string"),
-            label,
-        )
+    slot: int,
+    system: str,
+    market_name: str,
+    side: str,
+    model_probability: np.ndarray,
+    price: pd.Series,
+    observed: np.ndarray,
+    line: np.ndarray,
+    p_loss: np.ndarray | None = None,
+) -> pd.DataFrame:
+    priced = price.notna().to_numpy()
+    decimal_odds = price.to_numpy(dtype=float)[priced]
+    game_id = market["game_id"].astype(str).to_numpy()[priced]
+    model_probability = model_probability[priced]
+    break_even = 1.0 / decimal_odds
+
+    if p_loss is None:
+        probability = pd.Series(model_probability, dtype=float)
+        odds = pd.Series(decimal_odds, dtype=float)
+        ev = evk_module.compute_binary_ev(probability, odds)
+        raw_kelly = evk_module.compute_binary_kelly_raw(probability, odds)
+    else:
+        p_win = pd.Series(
+            market[
+                f"{system}_{side}_total_win_prob"
+            ].to_numpy(dtype=float)[priced],
+            dtype=float,
+        )
+        p_loss_series = pd.Series(p_loss[priced], dtype=float)
+        odds = pd.Series(decimal_odds, dtype=float)
+        ev = evk_module.compute_total_ev(p_win, p_loss_series, odds)
+        raw_kelly = evk_module.compute_total_kelly_raw(
+            p_win,
+            p_loss_series,
+            odds,
+            pd.Series(game_id, dtype="string"),
+            f"evaluate_run_model {system} {side}",
+        )
+
+    ev = np.asarray(ev, dtype=float)
+    raw_kelly = np.asarray(raw_kelly, dtype=float)
+
+    return pd.DataFrame(
+        {
+            "_game": np.flatnonzero(priced),
+            "_slot": slot,
+            "game_id": game_id,
+            "system": system,
+            "market": market_name,
+            "side": side,
+            "line": line[priced],
+            "model_probability": model_probability,
+            "decimal_odds": decimal_odds,
+            "break_even_probability": break_even,
+            "probability_edge": model_probability - break_even,
+            "ev": ev,
+            "kelly_raw": raw_kelly,
+            "kelly": np.maximum(raw_kelly, 0.0),
+            "realized_return": realized_returns(
+                observed[priced],
+                decimal_odds,
+            ),
+        }
     )
 
 
-def realized_return(
-    observed_win: float | int | None,
-    decimal_odds: float,
-) -> float:
-    if observed_win is None or pd.isna(observed_win):
-        return 0.0
-
-    if float(observed_win) == 1.0:
-        return float(decimal_odds - 1.0)
-
-    if float(observed_win) == 0.0:
-        return -1.0
-
-    fail(f"Invalid observed_win value: {observed_win}")
-
-
 def build_value_records(
     market: pd.DataFrame,
     evk_module,
 ) -> pd.DataFrame:
-    rows: list[dict] = []
+    # One EV/Kelly kernel call per (system, market, side) column block; rows
+    # are then put back in game -> system -> candidate order.
+    blocks: list[pd.DataFrame] = []
+    no_line = np.full(len(market), np.nan)
+    total_line = market["total"].to_numpy(dtype=float)
 
-    for row in market.itertuples(index=False):
-        game_id = str(row.game_id)
-
-        for system in ["dratings", "new_model"]:
-            binary_candidates = [
-                (
-                    "moneyline",
-                    "home",
-                    float(getattr(row, f"{system}_home_ml_prob")),
-                    getattr(row, "home_dk_moneyline_decimal"),
-                    int(getattr(row, "observed_home_ml_win")),
-                    np.nan,
-                ),
-                (
-                    "moneyline",
-                    "away",
-                    float(getattr(row, f"{system}_away_ml_prob")),
-                    getattr(row, "away_dk_moneyline_decimal"),
-                    int(getattr(row, "observed_away_ml_win")),
-                    np.nan,
-                ),
-                (
-                    "run_line",
-                    "home",
-                    float(getattr(row, f"{system}_home_rl_prob")),
-                    getattr(row, "home_dk_run_line_decimal"),
-                    int(getattr(row, "observed_home_rl_win")),
-                    float(getattr(row, "home_run_line")),
-                ),
-                (
-                    "run_line",
-                    "away",
-                    float(getattr(row, f"{system}_away_rl_prob")),
-                    getattr(row, "away_dk_run_line_decimal"),
-                    int(getattr(row, "observed_away_rl_win")),
-                    float(getattr(row, "away_run_line")),
-                ),
-            ]
+    binary_candidates = [
+        (
+            "moneyline",
+            "home",
+            "ml",
+            "home_dk_moneyline_decimal",
+            "observed_home_ml_win",
+            None,
+        ),
+        (
+            "moneyline",
+            "away",
+            "ml",
+            "away_dk_moneyline_decimal",
+            "observed_away_ml_win",
+            None,
+        ),
+        (
+            "run_line",
+            "home",
+            "rl",
+            "home_dk_run_line_decimal",
+            "observed_home_rl_win",
+            "home_run_line",
+        ),
+        (
+            "run_line",
+            "away",
+            "rl",
+            "away_dk_run_line_decimal",
+            "observed_away_rl_win",
+            "away_run_line",
+        ),
+    ]
+    total_candidates = [
+        (
+            "over",
+            "under",
+            "dk_total_over_decimal",
+            "observed_over_win",
+        ),
+        (
+            "under",
+            "over",
+            "dk_total_under_decimal",
+            "observed_under_win",
+        ),
+    ]
+    slots = len(binary_candidates) + len(total_candidates)
 
-            for (
-                market_name,
-                side,
-                probability,
-                price,
-                observed,
-                line,
-            ) in binary_candidates:
-                if pd.isna(price):
-                    continue
-
-                decimal_odds = float(price)
-                break_even = 1.0 / decimal_odds
-                edge = probability - break_even
-                ev = binary_ev(
-                    evk_module,
-                    probability,
-                    decimal_odds,
-                )
-                raw_kelly = binary_kelly_raw(
+    for system_index, system in enumerate(["dratings", "new_model"]):
+        for candidate_index, (
+            market_name,
+            side,
+            short,
+            price_col,
+            observed_col,
+            line_col,
+        ) in enumerate(binary_candidates):
+            blocks.append(
+                _value_block(
+                    market,
                     evk_module,
-                    probability,
-                    decimal_odds,
-                )
-
-                rows.append(
-                    {
-                        "game_id": game_id,
-                        "system": system,
-                        "market": market_name,
-                        "side": side,
-                        "line": line,
-                        "model_probability": probability,
-                        "decimal_odds": decimal_odds,
-                        "break_even_probability": break_even,
-                        "probability_edge": edge,
-                        "ev": ev,
-                        "kelly_raw": raw_kelly,
-                        "kelly": max(raw_kelly, 0.0),
-                        "realized_return": realized_return(
-                            observed,
-                            decimal_odds,
-                        ),
-                    }
-                )
-
-            total_candidates = [
-                (
-                    "over",
-                    float(
-                        getattr(
-                            row,
-                            f"{system}_over_total_win_prob",
-                        )
-                    ),
-                    float(
-                        getattr(
-                            row,
-                            f"{system}_under_total_win_prob",
-                        )
-                    ),
-                    float(
-                        getattr(
-                            row,
-                            f"{system}_over_total_conditional_prob",
-                        )
-                    ),
-                    getattr(row, "dk_total_over_decimal"),
-                    getattr(row, "observed_over_win"),
-                ),
-                (
-                    "under",
-                    float(
-                        getattr(
-                            row,
-                            f"{system}_under_total_win_prob",
-                        )
-                    ),
-                    float(
-                        getattr(
-                            row,
-                            f"{system}_over_total_win_prob",
-                        )
-                    ),
-                    float(
-                        getattr(
-                            row,
-                            f"{system}_under_total_conditional_prob",
-                        )
+                    system_index * slots + candidate_index,
+                    system,
+                    market_name,
+                    side,
+                    market[
+                        f"{system}_{side}_{short}_prob"
+                    ].to_numpy(dtype=float),
+                    market[price_col],
+                    market[observed_col].astype(int).to_numpy(),
+                    (
+                        no_line
+                        if line_col is None
+                        else market[line_col].to_numpy(dtype=float)
                     ),
-                    getattr(row, "dk_total_under_decimal"),
-                    getattr(row, "observed_under_win"),
-                ),
-            ]
-
-            for (
-                side,
-                p_win,
-                p_loss,
-                conditional_probability,
-                price,
-                observed,
-            ) in total_candidates:
-                if pd.isna(price):
-                    continue
-
-                decimal_odds = float(price)
-                break_even = 1.0 / decimal_odds
-                edge = (
-                    conditional_probability
-                    - break_even
-                )
-                ev = total_ev(
-                    evk_module,
-                    p_win,
-                    p_loss,
-                    decimal_odds,
-                )
-                raw_kelly = total_kelly_raw(
-                    evk_module,
-                    p_win,
-                    p_loss,
-                    decimal_odds,
-                    game_id,
-                    f"evaluate_run_model {system} {side}",
                 )
+            )
 
-                rows.append(
-                    {
-                        "game_id": game_id,
-                        "system": system,
-                        "market": "total",
-                        "side": side,
-                        "line": float(row.total),
-                        "model_probability": conditional_probability,
-                        "decimal_odds": decimal_odds,
-                        "break_even_probability": break_even,
-                        "probability_edge": edge,
-                        "ev": ev,
-                        "kelly_raw": raw_kelly,
-                        "kelly": max(raw_kelly, 0.0),
-                        "realized_return": realized_return(
-                            observed,
-                            decimal_odds,
-                        ),
-                    }
+        for candidate_index, (
+            side,
+            other,
+            price_col,
+            observed_col,
+        ) in enumerate(total_candidates, start=len(binary_candidates)):
+            blocks.append(
+                _value_block(
+                    market,
+                    evk_module,
+                    system_index * slots + candidate_index,
+                    system,
+                    "total",
+                    side,
+                    market[
+                        f"{system}_{side}_total_conditional_prob"
+                    ].to_numpy(dtype=float),
+                    market[price_col],
+                    market[observed_col].to_numpy(dtype=float),
+                    total_line,
+                    p_loss=market[
+                        f"{system}_{other}_total_win_prob"
+                    ].to_numpy(dtype=float),
                 )
+            )
 
-    values = pd.DataFrame(rows)
+    values = (
+        pd.concat(blocks, ignore_index=True)
+        .sort_values(["_game", "_slot"], kind="mergesort")
+        .drop(columns=["_game", "_slot"])
+        .reset_index(drop=True)
+    )
 
     if values.empty:
         fail(
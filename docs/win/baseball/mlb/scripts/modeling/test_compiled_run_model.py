@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Parity tests for the compiled run-model scorer against sklearn."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import HistGradientBoostingRegressor
+
+
+def _find_repo_root() -> Path:
+    file_path = Path(__file__).resolve()
+
+    for parent in file_path.parents:
+        if (
+            (parent / "requirements.txt").exists()
+            and (parent / "docs/win/baseball/mlb").exists()
+        ):
+            return parent
+
+    raise RuntimeError(
+        f"Could not resolve repository root from {file_path}"
+    )
+
+
+REPO_ROOT = _find_repo_root()
+
+COMPILED_SCRIPT = (
+    REPO_ROOT
+    / "docs/win/baseball/mlb/scripts/modeling/compiled_run_model.py"
+)
+
+
+def _load_module(name: str, path: Path):
+    if not path.exists():
+        raise RuntimeError(
+            f"Required production module not found: {path}"
+        )
+
+    spec = importlib.util.spec_from_file_location(name, path)
+
+    if spec is None or spec.loader is None:
+        raise RuntimeError(
+            f"Could not load production module: {path}"
+        )
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+CRM = _load_module(
+    "mlb_compiled_run_model",
+    COMPILED_SCRIPT,
+)
+
+
+@pytest.fixture(autouse=True)
+def _log_to_tmp(monkeypatch, tmp_path: Path) -> None:
+    # Exports and scoring log under errors/; keep test runs out of the tree.
+    monkeypatch.setattr(CRM, "ERROR_DIR", tmp_path)
+    monkeypatch.setattr(
+        CRM,
+        "LOG_FILE",
+        tmp_path / "compiled_run_model.txt",
+    )
+
+
+FEATURES = [
+    "dratings_home_projected_runs",
+    "home_sp_xera",
+    "away_sp_xwoba",
+    "temp_f",
+    "wind_mph",
+]
+
+
+def _synthetic_frame(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+
+    frame = pd.DataFrame(
+        {
+            "dratings_home_projected_runs": rng.uniform(2.5, 6.5, rows),
+            "home_sp_xera": rng.normal(4.2, 0.9, rows),
+            "away_sp_xwoba": rng.normal(0.31, 0.03, rows),
+            "temp_f": rng.uniform(40.0, 100.0, rows),
+            "wind_mph": rng.gamma(2.0, 4.0, rows),
+        }
+    )
+
+    # Weather and SDV gaps are routine in production; cover both branches
+    # of the missing-value routing.
+    for col, share in [("temp_f", 0.2), ("home_sp_xera", 0.1)]:
+        frame.loc[rng.random(rows) < share, col] = np.nan
+
+    return frame[FEATURES]
+
+
+def _fitted_model(max_leaf_nodes: int = 15) -> HistGradientBoostingRegressor:
+    X = _synthetic_frame(2000, seed=7)
+    rate = np.exp(
+        0.25 * X["dratings_home_projected_runs"].to_numpy()
+        - 0.02 * np.nan_to_num(X["temp_f"].to_numpy(), nan=70.0)
+        + 1.0
+    )
+    y = np.random.default_rng(11).poisson(rate / rate.mean() * 4.5)
+
+    model = HistGradientBoostingRegressor(
+        loss="poisson",
+        learning_rate=0.05,
+        max_leaf_nodes=max_leaf_nodes,
+        min_samples_leaf=20,
+        l2_regularization=1.0,
+        max_iter=100,
+        random_state=42,
+    )
+    return model.fit(X, y)
+
+
+@pytest.mark.parametrize("max_leaf_nodes", [7, 31])
+def test_compiled_predictions_match_sklearn(max_leaf_nodes: int) -> None:
+    model = _fitted_model(max_leaf_nodes)
+    compiled = CRM.CompiledRunModel.compile(model)
+    X = _synthetic_frame(5000, seed=3)
+
+    expected = model.predict(X)
+    actual = compiled.predict(X)
+
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual, expected, rtol=0.0, atol=1e-12)
+    assert CRM.check_parity(model, compiled, X) <= CRM.PARITY_TOLERANCE
+
+
+def test_chunked_scoring_matches_single_pass(monkeypatch) -> None:
+    model = _fitted_model()
+    compiled = CRM.CompiledRunModel.compile(model)
+    X = _synthetic_frame(1000, seed=5)
+
+    whole = compiled.predict(X)
+    monkeypatch.setattr(CRM, "PREDICT_CHUNK_ROWS", 97)
+
+    np.testing.assert_array_equal(compiled.predict(X), whole)
+
+
+def test_saved_artifact_round_trips_and_tracks_source(tmp_path: Path) -> None:
+    model = _fitted_model()
+    model_path = tmp_path / "home_runs_model.joblib"
+    joblib.dump(model, model_path)
+
+    X = _synthetic_frame(500, seed=9)
+    summary = CRM.export_compiled(model, model_path, X)
+
+    assert summary["file"] == "home_runs_model_compiled.npz"
+    assert summary["parity_max_abs_diff"] <= CRM.PARITY_TOLERANCE
+
+    loaded = CRM.load_if_fresh(model_path)
+    assert loaded is not None
+    assert loaded.feature_names_in_.tolist() == FEATURES
+    np.testing.assert_allclose(loaded.predict(X), model.predict(X), rtol=0.0, atol=1e-12)
+
+    # A retrained joblib model makes the compiled twin stale.
+    joblib.dump(_fitted_model(max_leaf_nodes=7), model_path)
+    assert CRM.load_if_fresh(model_path) is None
+
+
+def test_feature_order_is_enforced() -> None:
+    compiled = CRM.CompiledRunModel.compile(_fitted_model())
+    X = _synthetic_frame(10, seed=1)
+
+    with pytest.raises(RuntimeError, match="feature order"):
+        compiled.predict(X[list(reversed(FEATURES))])
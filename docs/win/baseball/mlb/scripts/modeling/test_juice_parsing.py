@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Unparseable odds cells settle as bad_parse in the vectorized juice steps."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _find_repo_root() -> Path:
+    file_path = Path(__file__).resolve()
+
+    for parent in file_path.parents:
+        if (
+            (parent / "requirements.txt").exists()
+            and (parent / "docs/win/baseball/mlb").exists()
+        ):
+            return parent
+
+    raise RuntimeError(
+        f"Could not resolve repository root from {file_path}"
+    )
+
+
+REPO_ROOT = _find_repo_root()
+
+JUICE_DIR = REPO_ROOT / "docs/win/baseball/mlb/scripts/02_juice"
+
+
+def _load_module(name: str, path: Path):
+    if not path.exists():
+        raise RuntimeError(
+            f"Required production module not found: {path}"
+        )
+
+    spec = importlib.util.spec_from_file_location(name, path)
+
+    if spec is None or spec.loader is None:
+        raise RuntimeError(
+            f"Could not load production module: {path}"
+        )
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+ML = _load_module(
+    "mlb_apply_moneyline_juice",
+    JUICE_DIR / "apply_moneyline_juice.py",
+)
+
+RL = _load_module(
+    "mlb_apply_run_line_juice",
+    JUICE_DIR / "apply_run_line_juice.py",
+)
+
+TOTAL = _load_module(
+    "mlb_apply_total_juice",
+    JUICE_DIR / "apply_total_juice.py",
+)
+
+
+@pytest.fixture(autouse=True)
+def _log_to_tmp(monkeypatch, tmp_path: Path) -> None:
+    # The juice logs under errors/ are tracked; keep test runs out of them.
+    for module in (ML, RL, TOTAL):
+        monkeypatch.setattr(
+            module,
+            "LOG_FILE",
+            tmp_path / f"{module.__name__}.txt",
+        )
+
+
+def _juice_config(module) -> pd.DataFrame:
+    return pd.read_csv(REPO_ROOT / module.JUICE_FILE)
+
+
+def _slate(rows: dict) -> pd.DataFrame:
+    df = pd.DataFrame(rows)
+    df["game_id"] = [f"2026_06_01_g{i}" for i in range(len(df))]
+    df["game_date"] = "2026-06-01"
+    return df
+
+
+def test_moneyline_unparseable_odds_settle_as_bad_parse() -> None:
+    juice_df = _juice_config(ML)
+    ML.validate_juice_config(juice_df)
+    band_index = ML.compile_band_index(juice_df)
+
+    df = _slate(
+        {
+            "home_dk_moneyline_american": [-130, "abc", -130],
+            "away_dk_moneyline_american": [110, 110, 110],
+            "home_dk_moneyline_decimal": [1.77, 1.77, 1.77],
+            "away_dk_moneyline_decimal": [2.10, 2.10, 2.10],
+            "home_fair_decimal_moneyline": [1.80, 1.80, "n/a"],
+            "away_fair_decimal_moneyline": [2.25, 2.25, 2.25],
+        }
+    )
+
+    df, audit, result = ML.process_frame(df, band_index)
+
+    assert result.tolist() == ["ok", "bad", "bad"]
+    assert audit["status"].tolist() == ["juiced"] * 2 + ["bad_parse"] * 4
+    assert audit.iloc[2:]["dk_american"].isna().all()
+    assert np.isfinite(df.loc[0, "home_normalized_prob_moneyline"])
+    assert df.loc[1:, "home_normalized_prob_moneyline"].isna().all()
+
+    log = ML.LOG_FILE.read_text(encoding="utf-8")
+    assert "row=1 reason=conversion_failed" in log
+    assert "row=2 reason=conversion_failed" in log
+
+
+def test_run_line_unparseable_odds_settle_as_bad_parse() -> None:
+    juice_df = _juice_config(RL)
+    RL.validate_juice_config(juice_df)
+    band_index = RL.compile_band_index(juice_df)
+
+    df = _slate(
+        {
+            "home_prob_run_line": [0.42, 0.42],
+            "away_prob_run_line": [0.58, 0.58],
+            "home_dk_run_line_american": [145, 145],
+            "away_dk_run_line_american": [-175, "-175x"],
+            "home_dk_run_line_decimal": [2.45, 2.45],
+            "away_dk_run_line_decimal": [1.57, 1.57],
+        }
+    )
+
+    _, audit, result = RL.process_frame(df, band_index)
+
+    assert result[1] == "bad"
+    assert audit["status"].tolist()[2:] == ["bad_parse", "bad_parse"]
+    assert "row=1 reason=conversion_failed" in RL.LOG_FILE.read_text(
+        encoding="utf-8"
+    )
+
+
+def test_total_unparseable_odds_settle_as_bad_parse() -> None:
+    juice_df = _juice_config(TOTAL)
+    uses_odds_bands = TOTAL.validate_juice_config(juice_df)
+    band_index = TOTAL.compile_band_index(juice_df, uses_odds_bands)
+
+    df = _slate(
+        {
+            "total": [8.5, 8.5, 8.5],
+            "fair_total_over_decimal": [1.95, 1.95, 1.95],
+            "dk_total_over_american": [-110, "EVEN?", None],
+            "dk_total_over_decimal": [1.91, 1.91, 1.91],
+        }
+    )
+
+    _, audit, applied, _, bad, _ = TOTAL.process_side(df, band_index, "over")
+
+    assert applied == 1
+    assert bad == 2
+    # A blank price is still missing odds; only a present, unparseable one is bad_parse.
+    assert audit["status"].tolist()[1:] == ["bad_parse", "missing_dk_odds"]
+    assert audit.iloc[1:]["dk_decimal"].isna().all()
+    assert "row=1 side=over reason=bad_parse" in TOTAL.LOG_FILE.read_text(
+        encoding="utf-8"
+    )
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Opening, closing and as-of queries over the append-only odds history."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+
+def _find_repo_root() -> Path:
+    file_path = Path(__file__).resolve()
+
+    for parent in file_path.parents:
+        if (
+            (parent / "requirements.txt").exists()
+            and (parent / "docs/win/baseball/mlb").exists()
+        ):
+            return parent
+
+    raise RuntimeError(
+        f"Could not resolve repository root from {file_path}"
+    )
+
+
+REPO_ROOT = _find_repo_root()
+
+HISTORY_SCRIPT = (
+    REPO_ROOT
+    / "docs/win/baseball/mlb/scripts/00_parsing/odds_history.py"
+)
+
+
+def _load_module(name: str, path: Path):
+    if not path.exists():
+        raise RuntimeError(
+            f"Required production module not found: {path}"
+        )
+
+    spec = importlib.util.spec_from_file_location(name, path)
+
+    if spec is None or spec.loader is None:
+        raise RuntimeError(
+            f"Could not load production module: {path}"
+        )
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+OH = _load_module(
+    "mlb_odds_history",
+    HISTORY_SCRIPT,
+)
+
+GAME_DATE = "2026_06_01"
+FIRST_PITCH = "2026-06-01T23:05:00Z"
+
+
+@pytest.fixture(autouse=True)
+def _history_in_tmp(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(OH, "ODDS_DIR", tmp_path / "odds")
+    monkeypatch.setattr(OH, "HISTORY_DIR", tmp_path / "odds/history")
+
+
+def _moneyline(home_price: float, away_price: float) -> list[dict]:
+    return [
+        {
+            "key": "h2h",
+            "last_update": "2026-06-01T12:00:00Z",
+            "outcomes": [
+                {"name": "New York Yankees", "price": home_price},
+                {"name": "Boston Red Sox", "price": away_price},
+                {"name": "Draw", "price": 15.0},
+            ],
+        }
+    ]
+
+
+def _event(home_price: float, away_price: float) -> dict:
+    return {
+        "id": "evt1",
+        "commence_time": FIRST_PITCH,
+        "home_team": "New York Yankees",
+        "away_team": "Boston Red Sox",
+        "bookmakers": [
+            {
+                "key": "draftkings",
+                "title": "DraftKings",
+                "last_update": "2026-06-01T12:00:00Z",
+                "markets": _moneyline(home_price, away_price),
+            }
+        ],
+    }
+
+
+def _append(captured_at: str, home_price: float, away_price: float):
+    rows = OH.flatten_converted_events(
+        [_event(home_price, away_price)],
+        captured_at,
+        "odds_mlb_update",
+    )
+    return OH.append_snapshot(rows, GAME_DATE, captured_at, "odds_mlb_update")
+
+
+def _home_price(frame: pd.DataFrame) -> float:
+    home = frame[frame["side"] == "home"]
+    assert len(home) == 1
+    return float(home["price"].iloc[0])
+
+
+def test_opening_closing_and_as_of_prices() -> None:
+    assert _append("2026-06-01T14:00:00Z", 1.80, 2.10) is not None
+    assert _append("2026-06-01T20:00:00Z", 1.70, 2.25) is not None
+    # Captured after first pitch: live odds, never the close.
+    assert _append("2026-06-02T00:00:00Z", 1.20, 4.50) is not None
+
+    # Parts are immutable; the same capture is not written twice.
+    assert _append("2026-06-01T14:00:00Z", 9.99, 9.99) is None
+
+    history = OH.load_history([GAME_DATE])
+
+    assert len(history) == 6
+    assert set(history["side"]) == {"home", "away"}
+
+    assert _home_price(OH.opening_prices(history)) == 1.80
+    assert _home_price(OH.closing_prices(history)) == 1.70
+    assert _home_price(OH.prices_at(history, "2026-06-01T17:00:00Z")) == 1.80
+    assert _home_price(OH.prices_at(history, "2026-06-01T20:00:00Z")) == 1.70
+    assert OH.prices_at(history, "2026-06-01T13:00:00Z").empty
+
+    until = OH.load_history(["2026-06-01"], until="2026-06-01T17:00:00Z")
+    assert until["price"].tolist() == [2.10, 1.80]
+
+
+def test_backfill_stamps_update_dumps_in_eastern_time() -> None:
+    updates_dir = OH.ODDS_DIR / "updates"
+    updates_dir.mkdir(parents=True)
+    (updates_dir / "2026_06_01_1000.json").write_text(
+        json.dumps([_event(1.80, 2.10)]),
+        encoding="utf-8",
+    )
+
+    OH.backfill()
+    OH.backfill()
+
+    parts = sorted((OH.HISTORY_DIR / GAME_DATE).glob("*.parquet"))
+    assert [p.name for p in parts] == ["20260601T140000Z_odds_mlb_update.parquet"]
+    assert _home_price(OH.load_history([GAME_DATE])) == 1.80
@@ -477,6 +477,183 @@ def test_model_probabilities_are_price_independent() -> None:
     )
 
 
+REFERENCE_MAX_RUNS = 80
+
+
+def _poisson_pmf(k: int, rate: float) -> float:
+    return math.exp(k * math.log(rate) - rate - math.lgamma(k + 1))
+
+
+def _reference_market_probabilities(
+    home_runs: float,
+    away_runs: float,
+    home_line: float,
+    total_line: float,
+) -> dict[str, float]:
+    """
+    Prices one game from first principles: home and away runs as
+    independent Poissons, summed over a truncated joint grid. Shares no
+    code with build_juice_files.
+    """
+    home_pmf = [_poisson_pmf(k, home_runs) for k in range(REFERENCE_MAX_RUNS)]
+    away_pmf = [_poisson_pmf(k, away_runs) for k in range(REFERENCE_MAX_RUNS)]
+
+    margin: dict[int, float] = {}
+    total: dict[int, float] = {}
+
+    for h, p_h in enumerate(home_pmf):
+        for a, p_a in enumerate(away_pmf):
+            margin[h - a] = margin.get(h - a, 0.0) + p_h * p_a
+            total[h + a] = total.get(h + a, 0.0) + p_h * p_a
+
+    home_win = sum(p for d, p in margin.items() if d > 0)
+    away_win = sum(p for d, p in margin.items() if d < 0)
+
+    # Home covers when margin + home_line > 0 (-1.5: win by 2+, +1.5: lose by 1 or less).
+    rl_home = sum(p for d, p in margin.items() if d + home_line > 0)
+
+    under = sum(p for t, p in total.items() if t < total_line)
+    push = total.get(int(total_line), 0.0) if float(total_line).is_integer() else 0.0
+
+    return {
+        "ml_home": home_win / (home_win + away_win),
+        "ml_away": away_win / (home_win + away_win),
+        "ml_tie": margin[0],
+        "rl_home": rl_home,
+        "rl_away": 1.0 - rl_home,
+        "total_over": 1.0 - under - push,
+        "total_under": under,
+        "total_push": push,
+    }
+
+
+def test_batched_market_probabilities_match_reference() -> None:
+    # Rows cover tied run projections, both run-line sides and whole-number
+    # totals that can push alongside half-run totals that cannot.
+    model_home_runs = np.array([4.8, 3.1, 5.6, 2.4, 4.0, 4.5])
+    model_away_runs = np.array([3.7, 4.2, 2.9, 2.6, 4.0, 4.5])
+    home_lines = np.array([-1.5, 1.5, -1.5, 1.5, -1.5, 1.5])
+    total_lines = np.array([8.5, 7.0, 9.5, 5.0, 8.0, 9.0])
+
+    batched = PROBS.market_probability_arrays(
+        model_home_runs,
+        model_away_runs,
+        home_lines,
+        -home_lines,
+        total_lines,
+    )
+
+    for i in range(len(model_home_runs)):
+        expected = _reference_market_probabilities(
+            model_home_runs[i],
+            model_away_runs[i],
+            home_lines[i],
+            total_lines[i],
+        )
+
+        for key, value in expected.items():
+            _assert_close(
+                batched[key][i],
+                value,
+            )
+
+    # Equal projections split the resolved moneyline evenly; a whole-number
+    # total carries a real push probability.
+    _assert_close(batched["ml_home"][4], 0.5)
+    _assert_close(batched["ml_away"][5], 0.5)
+    assert batched["total_push"][1] > 0.05
+    assert batched["total_push"][0] == 0.0
+
+    # The one-row helpers used by the per-file path agree with the batch.
+    _assert_close(
+        PROBS.totals_probabilities(4.0, 4.0, 8.0)[2],
+        batched["total_push"][4],
+    )
+    _assert_close(
+        PROBS.run_line_probabilities(3.1, 4.2, 1.5, -1.5)[0],
+        batched["rl_home"][1],
+    )
+    _assert_close(
+        PROBS.moneyline_probabilities(4.8, 3.7)[0],
+        batched["ml_home"][0],
+    )
+
+    try:
+        PROBS.totals_probability_arrays(
+            model_home_runs,
+            model_away_runs,
+            np.array([8.5, 7.0, 9.25, 5.0, 8.0, 9.0]),
+        )
+    except ValueError as e:
+        assert "idx=2" in str(e)
+    else:
+        raise AssertionError("unsupported total line was not rejected")
+
+
+def test_ev_kelly_kernel_matches_series_helpers_across_sides() -> None:
+    p_win = np.array(
+        [
+            [0.55, 0.48, 0.30],
+            [0.40, 0.47, 0.62],
+        ]
+    )
+    p_loss = np.array(
+        [
+            [0.40, 0.47, 0.62],
+            [0.55, 0.48, 0.30],
+        ]
+    )
+    decimal_odds = np.array(
+        [
+            [1.91, 2.05, 3.40],
+            [2.10, 1.87, 1.50],
+        ]
+    )
+
+    binary_ev, binary_kelly = EVK.ev_kelly_arrays(
+        p_win,
+        decimal_odds,
+    )
+    total_ev, total_kelly = EVK.ev_kelly_arrays(
+        p_win,
+        decimal_odds,
+        p_loss,
+    )
+
+    for side in range(p_win.shape[0]):
+        for i in range(p_win.shape[1]):
+            _assert_close(
+                binary_ev[side, i],
+                _binary_ev(p_win[side, i], decimal_odds[side, i]),
+            )
+            _assert_close(
+                binary_kelly[side, i],
+                _binary_kelly_raw(p_win[side, i], decimal_odds[side, i]),
+            )
+            _assert_close(
+                total_ev[side, i],
+                _total_ev(
+                    p_win[side, i],
+                    p_loss[side, i],
+                    decimal_odds[side, i],
+                ),
+            )
+            _assert_close(
+                total_kelly[side, i],
+                _total_kelly_raw(
+                    p_win[side, i],
+                    p_loss[side, i],
+                    decimal_odds[side, i],
+                ),
+            )
+
+    _, unpriced_kelly = EVK.ev_kelly_arrays(
+        np.array([0.5]),
+        np.array([1.0]),
+    )
+    assert np.isnan(unpriced_kelly[0])
+
+
 def test_binary_ev_and_raw_kelly_sign_consistency_grid() -> None:
     probabilities = [
         0.05,
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Request validation for the run-projection scoring server."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _find_repo_root() -> Path:
+    file_path = Path(__file__).resolve()
+
+    for parent in file_path.parents:
+        if (
+            (parent / "requirements.txt").exists()
+            and (parent / "docs/win/baseball/mlb").exists()
+        ):
+            return parent
+
+    raise RuntimeError(
+        f"Could not resolve repository root from {file_path}"
+    )
+
+
+REPO_ROOT = _find_repo_root()
+
+INTAKE_DIR = REPO_ROOT / "docs/win/baseball/mlb/scripts/00_intake"
+
+
+def _load_module(name: str, path: Path):
+    if not path.exists():
+        raise RuntimeError(
+            f"Required production module not found: {path}"
+        )
+
+    spec = importlib.util.spec_from_file_location(name, path)
+
+    if spec is None or spec.loader is None:
+        raise RuntimeError(
+            f"Could not load production module: {path}"
+        )
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# The server imports build_run_projection as a sibling module.
+BRP = _load_module(
+    "build_run_projection",
+    INTAKE_DIR / "build_run_projection.py",
+)
+
+SERVER = _load_module(
+    "mlb_run_projection_server",
+    INTAKE_DIR / "run_projection_server.py",
+)
+
+FEATURES = ["home_sp_xera", "away_sp_xwoba", "temp_f"]
+
+
+@pytest.fixture(autouse=True)
+def _log_to_tmp(monkeypatch, tmp_path: Path) -> None:
+    # The server and projection logs under errors/ are tracked.
+    for module in (BRP, SERVER):
+        monkeypatch.setattr(
+            module,
+            "LOG_FILE",
+            tmp_path / f"{module.__name__}.txt",
+        )
+
+
+@pytest.fixture
+def fake_projection(monkeypatch) -> list:
+    slate = pd.DataFrame(
+        {
+            "game_id": ["2026_06_01_g0", "2026_06_01_g1"],
+            "gamePk": [1, 2],
+            "model_home_runs": [4.5, 3.9],
+            "model_away_runs": [4.1, 4.4],
+        }
+    )
+    built = []
+    written = []
+
+    monkeypatch.setattr(
+        BRP,
+        "load_run_models",
+        lambda: {"version": "test-version", "feature_columns": FEATURES},
+    )
+
+    def build(date_str, models):
+        built.append(date_str)
+        return slate
+
+    def write(date_str, result):
+        written.append(date_str)
+        return Path(f"{date_str}_MLB.csv")
+
+    monkeypatch.setattr(BRP, "build_date_projection", build)
+    monkeypatch.setattr(BRP, "write_projection", write)
+
+    return [built, written]
+
+
+def test_feature_frame_from_rows_orders_features_and_keeps_nulls() -> None:
+    joined, X = SERVER.feature_frame_from_rows(
+        [
+            {"temp_f": 71, "away_sp_xwoba": 0.3, "home_sp_xera": 3.5, "game_id": "g0"},
+            {"temp_f": None, "away_sp_xwoba": 0.31, "home_sp_xera": 4.25},
+        ],
+        FEATURES,
+    )
+
+    assert list(X.columns) == FEATURES
+    np.testing.assert_array_equal(
+        X.to_numpy(),
+        [[3.5, 0.3, 71.0], [4.25, 0.31, np.nan]],
+    )
+    assert joined["game_id"].tolist() == ["g0", None]
+
+
+@pytest.mark.parametrize(
+    "row, message",
+    [
+        ({"home_sp_xera": 3.5, "away_sp_xwoba": 0.3}, "missing features"),
+        ({**dict.fromkeys(FEATURES, 1.0), "lineup": 1}, "unknown fields"),
+        ({**dict.fromkeys(FEATURES, 1.0), "temp_f": True}, "not a number"),
+        ({**dict.fromkeys(FEATURES, 1.0), "temp_f": "71"}, "not a number"),
+        ({**dict.fromkeys(FEATURES, 1.0), "temp_f": float("inf")}, "not finite"),
+    ],
+)
+def test_feature_frame_from_rows_rejects_bad_rows(row: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        SERVER.feature_frame_from_rows([row], FEATURES)
+
+
+def test_project_date_selects_games_and_writes_full_slate(fake_projection) -> None:
+    built, written = fake_projection
+
+    body = SERVER.project_date({"date": "2026-06-01", "game_ids": ["2026_06_01_g1"]})
+
+    assert built == written == ["2026_06_01"]
+    assert body["date"] == "2026_06_01"
+    assert [row["game_id"] for row in body["projections"]] == ["2026_06_01_g1"]
+
+    with pytest.raises(ValueError, match="not on the 2026_06_01 slate"):
+        SERVER.project_date({"date": "2026_06_01", "game_ids": ["nope"], "write": False})
+
+
+@pytest.mark.parametrize(
+    "date",
+    [None, "", "garbage", "../../../../tmp/x", "2026_06_01/../../x", "2026_13_40", 20260601],
+)
+def test_project_date_rejects_bad_dates_before_touching_files(fake_projection, date) -> None:
+    built, written = fake_projection
+
+    with pytest.raises(ValueError):
+        SERVER.project_date({"date": date})
+
+    assert built == written == []
+
+
+def _post(url: str, body: bytes, content_type: str) -> tuple[int, dict]:
+    request = urllib.request.Request(
+        url,
+        data=body,
+        method="POST",
+        headers={"Content-Type": content_type},
+    )
+
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def test_project_endpoint_status_codes(fake_projection) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SERVER.ProjectionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    url = f"http://127.0.0.1:{server.server_address[1]}/project"
+
+    try:
+        body = json.dumps({"date": "garbage"}).encode("utf-8")
+
+        assert _post(url, body, "application/json")[0] == 400
+        assert _post(url, body, "text/plain")[0] == 415
+
+        status, payload = _post(
+            url,
+            json.dumps({"date": "2026_06_01", "write": False}).encode("utf-8"),
+            "application/json; charset=utf-8",
+        )
+        assert status == 200
+        assert len(payload["projections"]) == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert fake_projection[1] == []
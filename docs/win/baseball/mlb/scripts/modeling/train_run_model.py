@@ -7,6 +7,7 @@ Input:
 Outputs:
     docs/win/baseball/mlb/models/run_projection/home_runs_model.joblib
     docs/win/baseball/mlb/models/run_projection/away_runs_model.joblib
+    docs/win/baseball/mlb/models/run_projection/{home,away}_runs_model_compiled.npz
     docs/win/baseball/mlb/models/run_projection/home_runs_model_metadata.json
     docs/win/baseball/mlb/models/run_projection/away_runs_model_metadata.json
 
@@ -16,6 +17,8 @@ The split is chronological by unique game dates:
     final 15% -> untouched test
 
 Hyperparameters are selected using validation mean Poisson deviance only.
+Candidates for both sides are scored in one process pool; --search halving
+prunes the grid on short boosting budgets before the full-budget finalists.
 The exact ordered feature list is persisted in metadata and must be enforced
 by the future production prediction script.
 """
@@ -25,8 +28,11 @@ from __future__ import annotations
 import argparse
 import itertools
 import json
+import math
+import os
 import sys
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -35,6 +41,9 @@ import numpy as np
 import pandas as pd
 from sklearn.ensemble import HistGradientBoostingRegressor
 from sklearn.metrics import mean_absolute_error, mean_poisson_deviance
+from threadpoolctl import threadpool_limits
+
+import compiled_run_model as crm
 
 
 BASE_DIR = Path("docs/win/baseball/mlb")
@@ -118,6 +127,18 @@ HYPERPARAMETER_GRID = {
     "l2_regularization": [0, 1, 5],
 }
 
+# HistGradientBoostingRegressor's default max_iter; the grid always fit at it.
+FULL_MAX_ITER = 100
+
+SEARCH_STRATEGIES = ["grid", "halving"]
+HALVING_FACTOR = 3
+HALVING_RUNGS = 3
+
+SIDE_COLUMNS = {
+    "home": ("target_home_runs", "dratings_home_projected_runs"),
+    "away": ("target_away_runs", "dratings_away_projected_runs"),
+}
+
 RANDOM_STATE = 42
 POISSON_EPSILON = 1e-12
 
@@ -356,68 +377,184 @@ def evaluate_predictions(
     }
 
 
+def build_model(
+    params: dict,
+    max_iter: int = FULL_MAX_ITER,
+) -> HistGradientBoostingRegressor:
+    return HistGradientBoostingRegressor(
+        loss="poisson",
+        learning_rate=params["learning_rate"],
+        max_leaf_nodes=params["max_leaf_nodes"],
+        min_samples_leaf=params["min_samples_leaf"],
+        l2_regularization=params["l2_regularization"],
+        max_iter=max_iter,
+        random_state=RANDOM_STATE,
+    )
+
+
+def search_budgets(strategy: str) -> list[int]:
+    """Boosting-iteration budget for each search rung; the last is full."""
+    if strategy == "grid":
+        return [FULL_MAX_ITER]
+
+    return [
+        max(1, FULL_MAX_ITER // HALVING_FACTOR ** rung)
+        for rung in reversed(range(HALVING_RUNGS))
+    ]
+
+
+# Per-process search frames, set once by the pool initializer so each
+# candidate task only ships its parameters.
+_SEARCH_DATA: dict = {}
+_THREAD_LIMIT = None
+
+
+def _init_search_worker(
+    search_data: dict,
+    limit_threads: bool = True,
+) -> None:
+    global _SEARCH_DATA, _THREAD_LIMIT
+
+    _SEARCH_DATA = search_data
+
+    if limit_threads:
+        # One OpenMP thread per process; the pool supplies the parallelism.
+        _THREAD_LIMIT = threadpool_limits(limits=1)
+
+
+def _score_candidate(task: tuple) -> tuple[str, int, float]:
+    side, order, params, max_iter = task
+    X_train, y_train, X_validation, y_validation = _SEARCH_DATA[side]
+
+    model = build_model(params, max_iter)
+    model.fit(X_train, y_train)
+
+    return side, order, safe_mean_poisson_deviance(
+        y_validation,
+        model.predict(X_validation),
+    )
+
+
 def select_hyperparameters(
     train: pd.DataFrame,
     validation: pd.DataFrame,
     feature_columns: list[str],
-    target_column: str,
-    label: str,
-) -> tuple[dict, float]:
-    X_train = train[feature_columns]
-    y_train = train[target_column]
-
-    X_validation = validation[feature_columns]
-    y_validation = validation[target_column]
-
-    best_params = None
-    best_score = np.inf
-    candidate_count = 0
-
-    for params in hyperparameter_candidates():
-        candidate_count += 1
-
-        model = HistGradientBoostingRegressor(
-            loss="poisson",
-            learning_rate=params["learning_rate"],
-            max_leaf_nodes=params["max_leaf_nodes"],
-            min_samples_leaf=params["min_samples_leaf"],
-            l2_regularization=params["l2_regularization"],
-            random_state=RANDOM_STATE,
+    target_columns: dict[str, str],
+    strategy: str,
+    workers: int,
+) -> dict[str, tuple[dict, float, dict]]:
+    """
+    Searches HYPERPARAMETER_GRID for every side in target_columns at once.
+
+    grid scores all 81 candidates at the full budget. halving scores them
+    at a small iteration budget and keeps the best 1/HALVING_FACTOR for
+    each larger budget, so only the finalists are fit at the full budget.
+    Candidates are ranked by (validation Poisson deviance, grid order),
+    so ties go to the earlier grid entry and results do not depend on the
+    worker count.
+    """
+    candidates = list(hyperparameter_candidates())
+
+    if len(candidates) != 81:
+        fail(
+            "hyperparameter grid expected 81 candidates; "
+            f"found {len(candidates)}"
         )
 
-        model.fit(
-            X_train,
-            y_train,
+    search_data = {
+        side: (
+            train[feature_columns],
+            train[target_column],
+            validation[feature_columns],
+            validation[target_column],
         )
+        for side, target_column in target_columns.items()
+    }
 
-        validation_predictions = model.predict(
-            X_validation
-        )
+    budgets = search_budgets(strategy)
+    alive = {side: list(range(len(candidates))) for side in search_data}
+    fits = {side: 0 for side in search_data}
+    final_scores = {}
 
-        validation_score = safe_mean_poisson_deviance(
-            y_validation,
-            validation_predictions,
+    executor = None
+
+    if workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_search_worker,
+            initargs=(search_data,),
         )
+        run_tasks = executor.map
+    else:
+        _init_search_worker(search_data, limit_threads=False)
+        run_tasks = map
 
-        if validation_score < best_score:
-            best_score = validation_score
-            best_params = dict(params)
+    try:
+        for rung, max_iter in enumerate(budgets):
+            tasks = [
+                (side, order, candidates[order], max_iter)
+                for side in search_data
+                for order in alive[side]
+            ]
+
+            scores = {side: {} for side in search_data}
+
+            for side, order, score in run_tasks(_score_candidate, tasks):
+                scores[side][order] = score
+                fits[side] += 1
+
+            for side in search_data:
+                ranked = sorted(
+                    alive[side],
+                    key=lambda order: (scores[side][order], order),
+                )
+
+                _log(
+                    f"{side}_runs search rung={rung + 1}/{len(budgets)} "
+                    f"max_iter={max_iter} candidates={len(ranked)} "
+                    f"best_validation_mean_poisson_deviance="
+                    f"{scores[side][ranked[0]]:.12f}"
+                )
+
+                if rung == len(budgets) - 1:
+                    final_scores[side] = scores[side]
+                    alive[side] = ranked
+                else:
+                    keep = max(1, math.ceil(len(ranked) / HALVING_FACTOR))
+                    alive[side] = sorted(ranked[:keep])
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    selections = {}
+
+    for side in search_data:
+        best_order = alive[side][0]
+        best_params = dict(candidates[best_order])
+        best_score = final_scores[side][best_order]
+        label = f"{side}_runs"
+
+        if not np.isfinite(best_score):
+            fail(f"{label} failed to select valid hyperparameters")
 
-    if candidate_count != 81:
-        fail(
-            f"{label} hyperparameter grid expected 81 candidates; "
-            f"evaluated {candidate_count}"
+        _log(
+            f"{label} selected_hyperparameters={best_params} "
+            f"validation_mean_poisson_deviance={best_score:.12f}"
         )
 
-    if best_params is None or not np.isfinite(best_score):
-        fail(f"{label} failed to select valid hyperparameters")
-
-    _log(
-        f"{label} selected_hyperparameters={best_params} "
-        f"validation_mean_poisson_deviance={best_score:.12f}"
-    )
+        selections[side] = (
+            best_params,
+            float(best_score),
+            {
+                "strategy": strategy,
+                "candidate_count": len(candidates),
+                "max_iter_budgets": budgets,
+                "halving_factor": HALVING_FACTOR if strategy == "halving" else None,
+                "fit_count": fits[side],
+            },
+        )
 
-    return best_params, float(best_score)
+    return selections
 
 
 def fit_final_model(
@@ -435,14 +572,7 @@ def fit_final_model(
         sort=False,
     )
 
-    model = HistGradientBoostingRegressor(
-        loss="poisson",
-        learning_rate=selected_hyperparameters["learning_rate"],
-        max_leaf_nodes=selected_hyperparameters["max_leaf_nodes"],
-        min_samples_leaf=selected_hyperparameters["min_samples_leaf"],
-        l2_regularization=selected_hyperparameters["l2_regularization"],
-        random_state=RANDOM_STATE,
-    )
+    model = build_model(selected_hyperparameters)
 
     model.fit(
         fit_frame[feature_columns],
@@ -471,25 +601,13 @@ def train_one_side(
     validation: pd.DataFrame,
     test: pd.DataFrame,
     feature_columns: list[str],
+    selection: tuple[dict, float, dict],
 ) -> tuple[HistGradientBoostingRegressor, dict]:
-    if side == "home":
-        target_column = "target_home_runs"
-        baseline_column = "dratings_home_projected_runs"
-    elif side == "away":
-        target_column = "target_away_runs"
-        baseline_column = "dratings_away_projected_runs"
-    else:
+    if side not in SIDE_COLUMNS:
         fail(f"Unknown model side: {side}")
 
-    selected_hyperparameters, validation_score = (
-        select_hyperparameters(
-            train,
-            validation,
-            feature_columns,
-            target_column,
-            f"{side}_runs",
-        )
-    )
+    target_column, baseline_column = SIDE_COLUMNS[side]
+    selected_hyperparameters, validation_score, search_summary = selection
 
     model = fit_final_model(
         train,
@@ -563,6 +681,7 @@ def train_one_side(
         "model_metrics": model_metrics,
         "created_at": _now(),
         "validation_mean_poisson_deviance": validation_score,
+        "hyperparameter_search": search_summary,
         "target_column": target_column,
         "baseline_column": baseline_column,
         "model_class": "HistGradientBoostingRegressor",
@@ -605,6 +724,23 @@ def parse_args() -> argparse.Namespace:
         ),
     )
 
+    parser.add_argument(
+        "--search",
+        choices=SEARCH_STRATEGIES,
+        default="grid",
+        help=(
+            "grid scores every candidate at the full budget; halving "
+            "prunes on short budgets first (default: grid)"
+        ),
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Search processes; 1 runs in-process (default: CPU count)",
+    )
+
     return parser.parse_args()
 
 
@@ -651,12 +787,25 @@ def main() -> None:
             f"feature_columns={feature_columns}"
         )
 
+        selections = select_hyperparameters(
+            train,
+            validation,
+            feature_columns,
+            {
+                side: target_column
+                for side, (target_column, _) in SIDE_COLUMNS.items()
+            },
+            args.search,
+            args.workers,
+        )
+
         home_model, home_metadata = train_one_side(
             side="home",
             train=train,
             validation=validation,
             test=test,
             feature_columns=feature_columns,
+            selection=selections["home"],
         )
 
         away_model, away_metadata = train_one_side(
@@ -665,6 +814,7 @@ def main() -> None:
             validation=validation,
             test=test,
             feature_columns=feature_columns,
+            selection=selections["away"],
         )
 
         joblib.dump(
@@ -676,6 +826,24 @@ def main() -> None:
             AWAY_MODEL_FILE,
         )
 
+        # Compile both models for array-backed scoring; export fails the run
+        # if the compiled predictions drift from sklearn on any dataset row.
+        parity_features = pd.concat(
+            [train, validation, test],
+            ignore_index=True,
+        )[feature_columns]
+
+        home_metadata["compiled_artifact"] = crm.export_compiled(
+            home_model,
+            HOME_MODEL_FILE,
+            parity_features,
+        )
+        away_metadata["compiled_artifact"] = crm.export_compiled(
+            away_model,
+            AWAY_MODEL_FILE,
+            parity_features,
+        )
+
         write_metadata(
             HOME_METADATA_FILE,
             home_metadata,
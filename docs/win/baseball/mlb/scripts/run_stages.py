@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# docs/win/baseball/mlb/scripts/run_stages.py
+#
+# Incremental runner for the numbered slate pipeline:
+#   01_merge/merge_intake.py -> 01_merge/build_juice_files.py
+#   -> 03_edges/compute_edges.py -> 03_edges/compute_ev_kelly.py
+#   -> 04_select/baseball_select_bets.py
+#
+# For every stage and slate date the runner hashes the date's input files,
+# the stage script and the stage's shared inputs (maps/config) into one
+# fingerprint and stores it in docs/win/baseball/mlb/audit/stage_manifest.json.
+# A stage is rerun only for dates whose fingerprint changed, by passing those
+# dates to the stage script. Stages run in order, so a date whose upstream
+# outputs came back byte-identical stops propagating at that stage.
+#
+# A stage runs as a full rebuild (no date arguments) when:
+#   - --force is given
+#   - the stage has no manifest entry yet
+#   - the stage script or one of its shared inputs changed
+#
+# --interchange parquet sets MLB_INTERCHANGE for every stage, so stages also
+# write typed Parquet twins of their CSVs under <stage dir>/columnar/ and read
+# the upstream twins instead of re-parsing CSV. Fingerprints are taken from the
+# CSVs, which are written in both modes.
+#
+# --in-process runs every stage in this interpreter instead of one Python
+# process per stage: each stage script is loaded as a module and its main() is
+# called with the planned dates. The runner sets FRAME_HANDOFF on the shared
+# interchange module (scripts/interchange.py), so the frames build_juice_files,
+# compute_edges and compute_ev_kelly write are handed to the next stage without
+# re-reading the CSV. Every stage still writes the same CSVs, audits and logs
+# as a separate run.
+#
+# --dates D [D ...] rebuilds the given dates in every stage even when their
+# fingerprints are unchanged (e.g. re-pricing today after lineup news).
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import subprocess
+import sys
+import traceback
+from datetime import UTC, datetime
+from pathlib import Path
+
+SCRIPT_DIR = Path("docs/win/baseball/mlb/scripts")
+MLB_DIR = Path("docs/win/baseball/mlb")
+MANIFEST_FILE = MLB_DIR / "audit" / "stage_manifest.json"
+ERROR_DIR = MLB_DIR / "errors"
+LOG_FILE = ERROR_DIR / "run_stages.txt"
+INTERCHANGE_SCRIPT = SCRIPT_DIR / "interchange.py"
+
+MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+ERROR_DIR.mkdir(parents=True, exist_ok=True)
+
+MANIFEST_VERSION = 1
+DATE_RE = re.compile(r"^(\d{4}_\d{2}_\d{2})_")
+
+# Each stage lists its per-date input globs as (directory, pattern). A file
+# belongs to the date its name starts with. shared_inputs are hashed into
+# every date's fingerprint together with the stage script itself.
+STAGES = [
+    {
+        "name": "01_merge/merge_intake.py",
+        "date_inputs": [
+            (MLB_DIR / "00_intake/predictions/model_projection", "*_MLB.csv"),
+            (MLB_DIR / "00_intake/sportsbook", "*_MLB.csv"),
+            (MLB_DIR / "00_intake/games", "*_games.csv"),
+            (MLB_DIR / "00_intake/mlb_raw", "*_game_context.csv"),
+        ],
+        "shared_inputs": [
+            MLB_DIR / "maps/team_map_mlb.csv",
+            INTERCHANGE_SCRIPT,
+        ],
+    },
+    {
+        "name": "01_merge/build_juice_files.py",
+        "date_inputs": [
+            (MLB_DIR / "01_merge", "*_mlb_*.csv"),
+        ],
+        "shared_inputs": [
+            INTERCHANGE_SCRIPT,
+        ],
+    },
+    {
+        "name": "03_edges/compute_edges.py",
+        "date_inputs": [
+            (MLB_DIR / "02_juice", "*.csv"),
+        ],
+        "shared_inputs": [
+            INTERCHANGE_SCRIPT,
+        ],
+    },
+    {
+        "name": "03_edges/compute_ev_kelly.py",
+        "date_inputs": [
+            (MLB_DIR / "03_edges", "*.csv"),
+        ],
+        "shared_inputs": [
+            SCRIPT_DIR / "season_audit.py",
+            INTERCHANGE_SCRIPT,
+        ],
+    },
+    {
+        "name": "04_select/baseball_select_bets.py",
+        "date_inputs": [
+            (MLB_DIR / "03_edges/ev_kelly", "*_mlb_*.csv"),
+        ],
+        "shared_inputs": [
+            MLB_DIR / "config/markets.yaml",
+            SCRIPT_DIR / "season_audit.py",
+            INTERCHANGE_SCRIPT,
+        ],
+    },
+]
+
+
+# =========================
+# LOGGING
+# =========================
+
+def _now():
+    return datetime.now(UTC).isoformat()
+
+
+def _log(msg: str, level: str = "INFO") -> None:
+    line = f"{_now()} | {level:<5} | {msg.rstrip()}"
+    print(line)
+    with open(LOG_FILE, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+# =========================
+# HASHING
+# =========================
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def combine_hashes(hashes: dict) -> str:
+    digest = hashlib.sha256()
+    for key in sorted(hashes):
+        digest.update(f"{key}\0{hashes[key]}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def stage_code_version(stage: dict) -> str:
+    hashes = {str(SCRIPT_DIR / stage["name"]): file_sha256(SCRIPT_DIR / stage["name"])}
+    for path in stage["shared_inputs"]:
+        hashes[str(path)] = file_sha256(path) if path.exists() else "missing"
+    return combine_hashes(hashes)
+
+
+def date_input_hashes(stage: dict) -> dict:
+    """Return {date: {input_path: sha256}} for every date the stage can see."""
+    by_date = {}
+    for folder, pattern in stage["date_inputs"]:
+        for path in sorted(folder.glob(pattern)):
+            match = DATE_RE.match(path.name)
+            if not path.is_file() or not match:
+                continue
+            by_date.setdefault(match.group(1), {})[str(path)] = file_sha256(path)
+    return by_date
+
+
+# =========================
+# MANIFEST
+# =========================
+
+def load_manifest() -> dict:
+    if not MANIFEST_FILE.exists():
+        return {"version": MANIFEST_VERSION, "stages": {}}
+
+    with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        _log(f"Manifest version {manifest.get('version')} != {MANIFEST_VERSION}; ignoring it", "WARN")
+        return {"version": MANIFEST_VERSION, "stages": {}}
+
+    return manifest
+
+
+def save_manifest(manifest: dict) -> None:
+    tmp = MANIFEST_FILE.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    tmp.replace(MANIFEST_FILE)
+
+
+# =========================
+# PLANNING
+# =========================
+
+def plan_stage(stage: dict, recorded: dict | None, force: bool, requested=()) -> dict:
+    """Decide whether a stage is skipped, run for some dates, or fully rebuilt.
+
+    requested dates are rebuilt even when their fingerprints are unchanged.
+    """
+    code_version = stage_code_version(stage)
+    inputs = date_input_hashes(stage)
+    current = {
+        date: {
+            "fingerprint": combine_hashes({"code": code_version, **hashes}),
+            "inputs": hashes,
+        }
+        for date, hashes in inputs.items()
+    }
+
+    plan = {"code_version": code_version, "current": current, "dates": []}
+
+    if force:
+        plan["mode"], plan["reason"] = "full", "--force"
+    elif recorded is None:
+        plan["mode"], plan["reason"] = "full", "no manifest entry"
+    elif recorded.get("code_version") != code_version:
+        plan["mode"], plan["reason"] = "full", "stage script or shared inputs changed"
+    else:
+        recorded_dates = recorded.get("dates", {})
+        changed = [
+            date
+            for date, entry in current.items()
+            if recorded_dates.get(date, {}).get("fingerprint") != entry["fingerprint"]
+        ]
+        removed = [date for date in recorded_dates if date not in current]
+        requested = [date for date in requested if date in current or date in recorded_dates]
+        plan["dates"] = sorted(set(changed + removed + requested))
+        if plan["dates"]:
+            plan["mode"] = "dates"
+            plan["reason"] = (
+                f"changed={sorted(changed)} removed={sorted(removed)} "
+                f"requested={sorted(requested)}"
+            )
+        else:
+            plan["mode"], plan["reason"] = "skip", "inputs unchanged"
+
+    return plan
+
+
+def run_stage(stage: dict, plan: dict, interchange: str) -> int:
+    cmd = [sys.executable, str(SCRIPT_DIR / stage["name"])]
+    if plan["mode"] == "dates":
+        cmd += plan["dates"]
+    _log(f"RUN: MLB_INTERCHANGE={interchange} {' '.join(cmd)}")
+    env = {**os.environ, "MLB_INTERCHANGE": interchange}
+    return subprocess.run(cmd, check=False, env=env).returncode
+
+
+def load_stage_module(stage: dict):
+    path = SCRIPT_DIR / stage["name"]
+    spec = importlib.util.spec_from_file_location(f"mlb_stage_{path.stem}", path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Could not load stage module: {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_interchange():
+    """Load scripts/interchange.py under the sys.modules name the stages use."""
+    module = sys.modules.get("mlb_interchange")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("mlb_interchange", INTERCHANGE_SCRIPT)
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"Could not load interchange helpers: {INTERCHANGE_SCRIPT}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["mlb_interchange"] = module
+    return module
+
+
+def run_stage_in_process(stage: dict, plan: dict, handoff: dict) -> int:
+    argv = plan["dates"] if plan["mode"] == "dates" else []
+    _log(f"RUN IN-PROCESS: {stage['name']} {' '.join(argv)}".rstrip())
+
+    try:
+        load_interchange().FRAME_HANDOFF = handoff
+        module = load_stage_module(stage)
+        module.main(argv)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        return 1
+    except Exception as e:
+        _log(f"{stage['name']} raised: {e}\n{traceback.format_exc()}", "ERROR")
+        return 1
+
+    return 0
+
+
+def record_stage(manifest: dict, stage: dict, plan: dict) -> None:
+    manifest["stages"][stage["name"]] = {
+        "code_version": plan["code_version"],
+        "updated_at": _now(),
+        "dates": {
+            date: entry
+            for date, entry in sorted(plan["current"].items())
+        },
+    }
+
+
+# =========================
+# MAIN
+# =========================
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild every date in every stage regardless of the manifest.",
+    )
+    parser.add_argument(
+        "--interchange",
+        choices=["csv", "parquet"],
+        default=os.environ.get("MLB_INTERCHANGE", "csv"),
+        help="Stage interchange format; parquet adds typed Parquet twins next to the CSV exports.",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run every stage in this interpreter, handing frames between stages in memory.",
+    )
+    parser.add_argument(
+        "--dates",
+        nargs="+",
+        default=[],
+        help="Date(s) to rebuild in every stage even if unchanged (YYYY_MM_DD or YYYY-MM-DD).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print what would run without running stages or touching the manifest.",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    with open(LOG_FILE, "w", encoding="utf-8") as f:
+        f.write(f"=== run_stages RUN {_now()} ===\n")
+
+    requested = sorted({value.strip().replace("-", "_") for value in args.dates})
+    manifest = load_manifest()
+    summary = {"full": 0, "dates": 0, "skip": 0}
+
+    # The interchange module reads MLB_INTERCHANGE when it is loaded.
+    os.environ["MLB_INTERCHANGE"] = args.interchange
+    handoff = {}
+
+    try:
+        for stage in STAGES:
+            plan = plan_stage(stage, manifest["stages"].get(stage["name"]), args.force, requested)
+            summary[plan["mode"]] += 1
+            _log(f"{stage['name']}: {plan['mode']} ({plan['reason']})")
+
+            if plan["mode"] == "skip" or args.dry_run:
+                continue
+
+            if args.in_process:
+                returncode = run_stage_in_process(stage, plan, handoff)
+            else:
+                returncode = run_stage(stage, plan, args.interchange)
+            if returncode != 0:
+                _log(f"{stage['name']} exited with {returncode}; manifest not updated for it", "ERROR")
+                raise SystemExit(returncode)
+
+            record_stage(manifest, stage, plan)
+            save_manifest(manifest)
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        _log(f"FATAL: {e}\n{traceback.format_exc()}", "ERROR")
+        raise SystemExit(1)
+
+    print(
+        f"run_stages complete. "
+        f"full={summary['full']} dates={summary['dates']} skip={summary['skip']} "
+        f"in_process={args.in_process} dry_run={args.dry_run}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# docs/win/baseball/mlb/scripts/season_audit.py
+#
+# Season-wide audit merge shared by the date-scoped stages
+# (03_edges/compute_ev_kelly.py, 04_select/baseball_select_bets.py).
+#
+# A stage given date arguments rebuilds only those slates, so its season
+# audits must keep every other date's rows. The stages load this file by path
+# (it sits outside their folders); run_stages.py hashes it into both stages'
+# fingerprints.
+
+import io
+from pathlib import Path
+
+import pandas as pd
+
+
+def normalize_audit_dates(values: pd.Series) -> pd.Series:
+    """Audit dates are written as YYYY_MM_DD or YYYY-MM-DD; compare them as YYYY_MM_DD."""
+    return values.astype(str).str.strip().str.replace("-", "_")
+
+
+def merge_season_audit(audit_df: pd.DataFrame, audit_path: Path, dates) -> pd.DataFrame:
+    """Swap the rebuilt dates' rows into the existing season audit.
+
+    Every existing row for a rebuilt date is dropped, including games no longer
+    on that slate and dates whose input is gone. Both sides go through their CSV
+    text so untouched rows are written back byte-for-byte, then a stable sort on
+    date restores the order a full rebuild produces.
+    """
+    if not dates or not audit_path.exists():
+        return audit_df
+
+    existing = pd.read_csv(audit_path, dtype=str, keep_default_na=False)
+    if "date" not in existing.columns:
+        raise ValueError(
+            f"{audit_path} has no date column, so the rows for {sorted(dates)} cannot be replaced; "
+            "rerun without dates to rebuild it"
+        )
+
+    rebuilt = pd.read_csv(io.StringIO(audit_df.to_csv(index=False)), dtype=str, keep_default_na=False)
+
+    merged = pd.concat(
+        [existing[~normalize_audit_dates(existing["date"]).isin(dates)], rebuilt],
+        ignore_index=True,
+    )
+    order = normalize_audit_dates(merged["date"]).argsort(kind="mergesort")
+
+    return merged.iloc[order].reset_index(drop=True)